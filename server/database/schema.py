@@ -20,8 +20,10 @@ def get_schema_sql() -> str:
         updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
     );
     
-    -- Index for querying sessions by user
-    CREATE INDEX IF NOT EXISTS idx_sessions_user_id ON sessions(user_id);
+    -- Index for querying sessions by user, already ordered by start time
+    -- (supersedes the former single-column idx_sessions_user_id)
+    DROP INDEX IF EXISTS idx_sessions_user_id;
+    CREATE INDEX IF NOT EXISTS idx_sessions_user_start_time ON sessions(user_id, start_time);
     CREATE INDEX IF NOT EXISTS idx_sessions_start_time ON sessions(start_time);
     
     -- Development plans table: stores goals and action items
@@ -40,8 +42,10 @@ def get_schema_sql() -> str:
         FOREIGN KEY (session_id) REFERENCES sessions(id) ON DELETE CASCADE
     );
     
-    -- Index for querying development plans by session
-    CREATE INDEX IF NOT EXISTS idx_development_plans_session_id ON development_plans(session_id);
+    -- Index for querying development plans by session; also covers goal completion counts
+    -- (supersedes the former single-column idx_development_plans_session_id)
+    DROP INDEX IF EXISTS idx_development_plans_session_id;
+    CREATE INDEX IF NOT EXISTS idx_development_plans_session_completed ON development_plans(session_id, is_completed);
     CREATE INDEX IF NOT EXISTS idx_development_plans_completed ON development_plans(is_completed);
     
     -- Emotion events table: stores detected emotions during session
@@ -58,7 +62,8 @@ def get_schema_sql() -> str:
     );
     
     -- Index for querying emotions by session and timestamp
-    CREATE INDEX IF NOT EXISTS idx_emotion_events_session_id ON emotion_events(session_id);
+    -- (the composite index supersedes the former single-column idx_emotion_events_session_id)
+    DROP INDEX IF EXISTS idx_emotion_events_session_id;
     CREATE INDEX IF NOT EXISTS idx_emotion_events_timestamp ON emotion_events(timestamp);
     CREATE INDEX IF NOT EXISTS idx_emotion_events_session_timestamp ON emotion_events(session_id, timestamp);
     
@@ -75,8 +80,10 @@ def get_schema_sql() -> str:
         FOREIGN KEY (session_id) REFERENCES sessions(id) ON DELETE CASCADE
     );
     
-    -- Index for querying phase transitions by session
-    CREATE INDEX IF NOT EXISTS idx_phase_transitions_session_id ON phase_transitions(session_id);
+    -- Index for querying phase transitions by session in transition order
+    -- (supersedes the former single-column idx_phase_transitions_session_id)
+    DROP INDEX IF EXISTS idx_phase_transitions_session_id;
+    CREATE INDEX IF NOT EXISTS idx_phase_transitions_session_time ON phase_transitions(session_id, transition_time);
     CREATE INDEX IF NOT EXISTS idx_phase_transitions_time ON phase_transitions(transition_time);
     """
 
@@ -1,52 +1,270 @@
 """Session database operations for R2C2 Voice Coach."""
 
 import json
+import math
+import os
 import sqlite3
-from datetime import datetime
+import threading
+from dataclasses import asdict, is_dataclass
+from datetime import date, datetime, time
+from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 from contextlib import contextmanager
+from itertools import chain
+
+try:
+    import orjson  # Faster JSON encoding/decoding; stdlib json is the fallback
+except ImportError:
+    orjson = None
+
+
+# Rows per multi-row INSERT, keeping bound parameters under SQLite's 999 limit
+_MAX_BULK_ROWS = 333
+
+# Values per IN (...) list, under SQLite's default limit of 999 bound parameters
+_MAX_IN_PARAMS = 900
+
+# Multi-row INSERT ... RETURNING needs SQLite 3.35 or newer
+_SQLITE_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+# Prepared statements cached per connection (keyed by SQL text)
+_STATEMENT_CACHE_SIZE = 256
+
+# Page cache for long-lived connections; negative means KiB, so about 20 MB
+_LONG_LIVED_CACHE_SIZE = -20000
+
+# Shared by the single-row and batch insert methods so they reuse one cached statement
+_INSERT_EMOTION_EVENT_SQL = """
+    INSERT INTO emotion_events
+    (session_id, timestamp, emotion_type, confidence, r2c2_phase, audio_features)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+_INSERT_PHASE_TRANSITION_SQL = """
+    INSERT INTO phase_transitions
+    (session_id, from_phase, to_phase, transition_time, trigger_reason, time_in_previous_phase)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+
+def _json_default(value: Any) -> Any:
+    """Convert values the JSON encoders do not take natively to plain ones.
+    
+    Both encoders route the same types through here, so a value is stored
+    the same way, or rejected the same way, whichever encoder is in use.
+    """
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    if is_dataclass(value) and not isinstance(value, type):
+        return asdict(value)
+    # Subclasses of builtins, which orjson hands over but json encodes itself
+    for base in (str, int, float, dict, list, tuple):
+        if isinstance(value, base):
+            return base(value)
+    tolist = getattr(value, "tolist", None)
+    if tolist is not None:
+        return tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _finite(value: Any) -> Any:
+    """Return value with NaN and infinite floats replaced by None, as orjson stores them."""
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {key: _finite(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_finite(item) for item in value]
+    return value
+
+
+if orjson is not None:
+    # Passthrough hands datetimes, dataclasses and subclasses to _json_default,
+    # so orjson stores them exactly as the stdlib fallback does
+    _ORJSON_OPTIONS = (
+        orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_SERIALIZE_NUMPY
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+        | orjson.OPT_PASSTHROUGH_SUBCLASS
+    )
+
+
+def _dumps(value: Any) -> str:
+    """Serialize a value to compact JSON for storage."""
+    if orjson is not None:
+        return orjson.dumps(value, default=_json_default, option=_ORJSON_OPTIONS).decode()
+    
+    # Keyword arguments match orjson: compact, UTF-8 text and no NaN literals
+    try:
+        return json.dumps(
+            value, separators=(",", ":"), ensure_ascii=False,
+            default=_json_default, allow_nan=False
+        )
+    except ValueError:
+        # Rare: store non-finite floats as null, as orjson does
+        return json.dumps(
+            _finite(json.loads(json.dumps(value, default=_json_default))),
+            separators=(",", ":"), ensure_ascii=False
+        )
+
+
+def _loads(data: str) -> Any:
+    """Parse stored JSON, including rows written with NaN by older builds."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
 
 
 class SessionDatabase:
     """Database interface for managing R2C2 coaching sessions."""
     
+    # Schema-initialized in-memory database copied into each new ":memory:" instance,
+    # along with the ID of the process that created it
+    _memory_template: Optional[sqlite3.Connection] = None
+    _memory_template_pid: Optional[int] = None
+    
     def __init__(self, db_path: Optional[str] = None):
         """
         Initialize the session database.
         
         Args:
             db_path: Path to the SQLite database file. If None, uses default location.
+                     Pass ":memory:" for a private in-memory database.
         """
         if db_path is None:
             db_path = str(Path(__file__).parent.parent / "data" / "r2c2_coach.db")
         
         self.db_path = db_path
         
-        # Ensure database directory exists
-        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        # Per-thread state: the connection held open by an active transaction() block
+        self._local = threading.local()
         
-        # Initialize schema if needed
-        self._ensure_schema()
+        if db_path == ":memory:":
+            # An in-memory database only lives as long as its connection;
+            # start it from a copy of the template instead of re-running the DDL
+            self._persistent_conn: Optional[sqlite3.Connection] = self._connect()
+            self._persistent_conn.execute(f"PRAGMA cache_size={_LONG_LIVED_CACHE_SIZE}")
+            self._get_memory_template().backup(self._persistent_conn)
+        else:
+            self._persistent_conn = None
+            # Ensure database directory exists
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+            
+            # Initialize schema if needed
+            self._ensure_schema()
+    
+    @classmethod
+    def _get_memory_template(cls) -> sqlite3.Connection:
+        """Return the schema-initialized in-memory template, creating it once per process."""
+        if cls._memory_template is None or cls._memory_template_pid != os.getpid():
+            from .schema import get_schema_sql
+            
+            # Only read from (via backup) after creation, so sharing across threads is safe
+            template = sqlite3.connect(":memory:", check_same_thread=False)
+            template.executescript(get_schema_sql())
+            cls._memory_template = template
+            cls._memory_template_pid = os.getpid()
+        return cls._memory_template
     
     def _ensure_schema(self):
         """Ensure the database schema exists."""
         from .schema import get_schema_sql
         
         with self._get_connection() as conn:
+            # WAL is stored in the database file, so it only needs setting once
+            conn.execute("PRAGMA journal_mode=WAL")
             cursor = conn.cursor()
             cursor.executescript(get_schema_sql())
-            conn.commit()
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Open a new connection to the database."""
+        conn = sqlite3.connect(self.db_path, cached_statements=_STATEMENT_CACHE_SIZE)
+        conn.row_factory = sqlite3.Row  # Enable column access by name
+        # Per-connection settings: with WAL, NORMAL sync only fsyncs at checkpoints
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        return conn
+    
+    def close(self):
+        """
+        Close the persistent connection of an in-memory database, if any.
+        
+        An in-memory database is gone once closed, so later calls raise
+        sqlite3.ProgrammingError.
+        """
+        if self._persistent_conn is not None:
+            self._persistent_conn.close()
+            self._persistent_conn = None
+    
+    @property
+    def _transaction_conn(self) -> Optional[sqlite3.Connection]:
+        """Connection pinned by this thread's transaction() block, if any."""
+        return getattr(self._local, "transaction_conn", None)
+    
+    @_transaction_conn.setter
+    def _transaction_conn(self, conn: Optional[sqlite3.Connection]):
+        self._local.transaction_conn = conn
     
     @contextmanager
     def _get_connection(self):
-        """Context manager for database connections."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row  # Enable column access by name
+        """
+        Context manager for database connections.
+        
+        Commits on success and rolls back on error. Inside a transaction()
+        block the shared connection is reused and committing is left to
+        the enclosing transaction.
+        """
+        if self._transaction_conn is not None:
+            yield self._transaction_conn
+            return
+        
+        conn = self._persistent_conn
+        if conn is None:
+            if self.db_path == ":memory:":
+                # Reconnecting would silently open a new, empty database
+                raise sqlite3.ProgrammingError("database is closed")
+            conn = self._connect()
         try:
             yield conn
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
         finally:
-            conn.close()
+            if conn is not self._persistent_conn:
+                conn.close()
+    
+    @contextmanager
+    def transaction(self):
+        """
+        Group several operations into a single transaction.
+        
+        All calls made on this instance inside the block share one
+        connection and are committed together when the block exits, or
+        rolled back if it raises. Nested blocks join the outer transaction.
+        The connection is pinned per thread, so calls from other threads
+        keep using their own connections and are not part of the block.
+        """
+        if self._transaction_conn is not None:
+            yield self
+            return
+        
+        with self._get_connection() as conn:
+            if conn is not self._persistent_conn:
+                # Only connections reused across a whole block benefit from a larger cache
+                conn.execute(f"PRAGMA cache_size={_LONG_LIVED_CACHE_SIZE}")
+            self._transaction_conn = conn
+            try:
+                yield self
+            finally:
+                self._transaction_conn = None
     
     def create_session(self, user_id: str, feedback_data: Dict[str, Any]) -> int:
         """
@@ -56,6 +274,19 @@ class SessionDatabase:
             user_id: Unique identifier for the user
             feedback_data: Dictionary containing 360° feedback data
             
+        Returns:
+            The session ID of the newly created session
+        """
+        return self._insert_session_raw(user_id, _dumps(feedback_data))
+    
+    def _insert_session_raw(self, user_id: str, feedback_json: str) -> int:
+        """
+        Create a new coaching session from already-serialized feedback data.
+        
+        Args:
+            user_id: Unique identifier for the user
+            feedback_json: JSON string of the 360° feedback data
+            
         Returns:
             The session ID of the newly created session
         """
@@ -66,11 +297,55 @@ class SessionDatabase:
                 INSERT INTO sessions (user_id, start_time, feedback_data)
                 VALUES (?, ?, ?)
                 """,
-                (user_id, datetime.now().isoformat(), json.dumps(feedback_data))
+                (user_id, datetime.now().isoformat(), feedback_json)
             )
-            conn.commit()
             return cursor.lastrowid
     
+    def create_sessions_bulk(self, sessions: List[Tuple[str, Dict[str, Any]]]) -> List[int]:
+        """
+        Create several coaching sessions with multi-row INSERT statements.
+        
+        SQLite older than 3.35 lacks RETURNING, so there the sessions are
+        inserted one row at a time in the same transaction instead.
+        
+        Args:
+            sessions: List of (user_id, feedback_data) tuples
+            
+        Returns:
+            The new session IDs, in the same order as the input
+        """
+        start_time = datetime.now().isoformat()
+        session_ids = []
+        
+        with self._get_connection() as conn:
+            if not _SQLITE_HAS_RETURNING:
+                # executemany() leaves lastrowid unset, so insert row by row
+                for user_id, feedback_data in sessions:
+                    cursor = conn.execute(
+                        "INSERT INTO sessions (user_id, start_time, feedback_data) "
+                        "VALUES (?, ?, ?)",
+                        (user_id, start_time, _dumps(feedback_data))
+                    )
+                    session_ids.append(cursor.lastrowid)
+                return session_ids
+            
+            for offset in range(0, len(sessions), _MAX_BULK_ROWS):
+                chunk = sessions[offset:offset + _MAX_BULK_ROWS]
+                placeholders = ", ".join(["(?, ?, ?)"] * len(chunk))
+                params = list(chain.from_iterable(
+                    (user_id, start_time, _dumps(feedback_data))
+                    for user_id, feedback_data in chunk
+                ))
+                cursor = conn.execute(
+                    f"INSERT INTO sessions (user_id, start_time, feedback_data) "
+                    f"VALUES {placeholders} RETURNING id",
+                    params
+                )
+                # IDs are assigned in VALUES order but RETURNING order is unspecified
+                session_ids.extend(sorted(row[0] for row in cursor.fetchall()))
+        
+        return session_ids
+    
     def end_session(self, session_id: int, summary: Dict[str, Any]):
         """
         End a coaching session and save the summary.
@@ -87,9 +362,8 @@ class SessionDatabase:
                 SET end_time = ?, session_summary = ?, updated_at = ?
                 WHERE id = ?
                 """,
-                (datetime.now().isoformat(), json.dumps(summary), datetime.now().isoformat(), session_id)
+                (datetime.now().isoformat(), _dumps(summary), datetime.now().isoformat(), session_id)
             )
-            conn.commit()
     
     def save_development_plan(self, session_id: int, goals: List[Dict[str, Any]]):
         """
@@ -100,29 +374,30 @@ class SessionDatabase:
             goals: List of goal dictionaries with keys: goal_text, goal_type, 
                    specific_behavior, measurable_criteria, target_date, action_steps
         """
+        rows = [
+            (
+                session_id,
+                goal.get('goal_text', ''),
+                goal.get('goal_type', 'start'),
+                goal.get('specific_behavior', ''),
+                goal.get('measurable_criteria', ''),
+                goal.get('target_date'),
+                _dumps(goal.get('action_steps', []))
+            )
+            for goal in goals
+        ]
+        
+        # All goals are inserted and committed together
         with self._get_connection() as conn:
-            cursor = conn.cursor()
-            
-            for goal in goals:
-                cursor.execute(
-                    """
-                    INSERT INTO development_plans 
-                    (session_id, goal_text, goal_type, specific_behavior, 
-                     measurable_criteria, target_date, action_steps)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        session_id,
-                        goal.get('goal_text', ''),
-                        goal.get('goal_type', 'start'),
-                        goal.get('specific_behavior', ''),
-                        goal.get('measurable_criteria', ''),
-                        goal.get('target_date'),
-                        json.dumps(goal.get('action_steps', []))
-                    )
-                )
-            
-            conn.commit()
+            conn.executemany(
+                """
+                INSERT INTO development_plans 
+                (session_id, goal_text, goal_type, specific_behavior, 
+                 measurable_criteria, target_date, action_steps)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                rows
+            )
     
     def record_emotion_event(
         self, 
@@ -145,21 +420,44 @@ class SessionDatabase:
         with self._get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(
-                """
-                INSERT INTO emotion_events 
-                (session_id, timestamp, emotion_type, confidence, r2c2_phase, audio_features)
-                VALUES (?, ?, ?, ?, ?, ?)
-                """,
+                _INSERT_EMOTION_EVENT_SQL,
                 (
                     session_id,
                     datetime.now().isoformat(),
                     emotion_type,
                     confidence,
                     r2c2_phase,
-                    json.dumps(audio_features) if audio_features else None
+                    _dumps(audio_features) if audio_features else None
                 )
             )
-            conn.commit()
+    
+    def record_emotion_events_batch(self, session_id: int, events: List[Dict[str, Any]]):
+        """
+        Record several emotion detection events with a single statement.
+        
+        Args:
+            session_id: The session ID
+            events: List of event dictionaries with keys: emotion_type, confidence,
+                    r2c2_phase, audio_features (optional)
+        """
+        timestamp = datetime.now().isoformat()
+        rows = [
+            (
+                session_id,
+                timestamp,
+                event['emotion_type'],
+                event['confidence'],
+                event['r2c2_phase'],
+                _dumps(event['audio_features']) if event.get('audio_features') else None
+            )
+            for event in events
+        ]
+        
+        with self._get_connection() as conn:
+            conn.executemany(
+                _INSERT_EMOTION_EVENT_SQL,
+                rows
+            )
     
     def record_phase_transition(
         self,
@@ -182,11 +480,7 @@ class SessionDatabase:
         with self._get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(
-                """
-                INSERT INTO phase_transitions 
-                (session_id, from_phase, to_phase, transition_time, trigger_reason, time_in_previous_phase)
-                VALUES (?, ?, ?, ?, ?, ?)
-                """,
+                _INSERT_PHASE_TRANSITION_SQL,
                 (
                     session_id,
                     from_phase,
@@ -196,8 +490,35 @@ class SessionDatabase:
                     time_in_previous_phase
                 )
             )
-            conn.commit()
 
+    def record_phase_transitions_batch(self, session_id: int, transitions: List[Dict[str, Any]]):
+        """
+        Record several R2C2 phase transitions with a single statement.
+        
+        Args:
+            session_id: The session ID
+            transitions: List of transition dictionaries with keys: from_phase, to_phase,
+                         trigger_reason, time_in_previous_phase
+        """
+        transition_time = datetime.now().isoformat()
+        rows = [
+            (
+                session_id,
+                transition['from_phase'],
+                transition['to_phase'],
+                transition_time,
+                transition['trigger_reason'],
+                transition['time_in_previous_phase']
+            )
+            for transition in transitions
+        ]
+        
+        with self._get_connection() as conn:
+            conn.executemany(
+                _INSERT_PHASE_TRANSITION_SQL,
+                rows
+            )
+    
     def get_user_sessions(self, user_id: str) -> List[Dict[str, Any]]:
         """
         Get all sessions for a user.
@@ -232,6 +553,44 @@ class SessionDatabase:
             
             return sessions
     
+    def get_session_counts_by_user(self, user_ids: List[str]) -> Dict[str, Tuple[int, Set[int]]]:
+        """
+        Get session counts and IDs for several users in one aggregate query.
+        
+        Args:
+            user_ids: The user IDs to look up
+            
+        Returns:
+            Dictionary mapping each user ID with sessions to a (count, session_ids) tuple
+        """
+        # Each user is looked up in exactly one chunk, so the results merge cleanly
+        user_ids = list(dict.fromkeys(user_ids))
+        session_counts = {}
+        
+        with self._get_connection() as conn:
+            for offset in range(0, len(user_ids), _MAX_IN_PARAMS):
+                chunk = user_ids[offset:offset + _MAX_IN_PARAMS]
+                placeholders = ", ".join("?" * len(chunk))
+                cursor = conn.execute(
+                    f"""
+                    SELECT user_id, COUNT(*) AS session_count, GROUP_CONCAT(id) AS session_ids
+                    FROM sessions
+                    WHERE user_id IN ({placeholders})
+                    GROUP BY user_id
+                    """,
+                    chunk
+                )
+                
+                session_counts.update(
+                    (row['user_id'], (
+                        row['session_count'],
+                        {int(session_id) for session_id in row['session_ids'].split(',')}
+                    ))
+                    for row in cursor.fetchall()
+                )
+        
+        return session_counts
+    
     def get_session_summary(self, session_id: int) -> Optional[Dict[str, Any]]:
         """
         Get detailed summary for a specific session.
@@ -264,8 +623,8 @@ class SessionDatabase:
                 'user_id': row['user_id'],
                 'start_time': row['start_time'],
                 'end_time': row['end_time'],
-                'feedback_data': json.loads(row['feedback_data']) if row['feedback_data'] else None,
-                'session_summary': json.loads(row['session_summary']) if row['session_summary'] else None
+                'feedback_data': _loads(row['feedback_data']) if row['feedback_data'] else None,
+                'session_summary': _loads(row['session_summary']) if row['session_summary'] else None
             }
             
             # Get development plan
@@ -289,7 +648,7 @@ class SessionDatabase:
                     'specific_behavior': goal_row['specific_behavior'],
                     'measurable_criteria': goal_row['measurable_criteria'],
                     'target_date': goal_row['target_date'],
-                    'action_steps': json.loads(goal_row['action_steps']) if goal_row['action_steps'] else [],
+                    'action_steps': _loads(goal_row['action_steps']) if goal_row['action_steps'] else [],
                     'is_completed': bool(goal_row['is_completed']),
                     'completed_at': goal_row['completed_at']
                 })
@@ -314,7 +673,7 @@ class SessionDatabase:
                     'emotion_type': emotion_row['emotion_type'],
                     'confidence': emotion_row['confidence'],
                     'r2c2_phase': emotion_row['r2c2_phase'],
-                    'audio_features': json.loads(emotion_row['audio_features']) if emotion_row['audio_features'] else None
+                    'audio_features': _loads(emotion_row['audio_features']) if emotion_row['audio_features'] else None
                 })
             
             session_data['emotion_events'] = emotions
@@ -364,9 +723,60 @@ class SessionDatabase:
                 """,
                 (datetime.now().isoformat(), goal_id)
             )
-            conn.commit()
             return cursor.rowcount > 0
     
+    def mark_goals_complete(self, goal_ids: List[int]) -> int:
+        """
+        Mark several development plan goals as completed in one transaction.
+        
+        Args:
+            goal_ids: The goal IDs to mark as complete
+            
+        Returns:
+            Number of goals that were found and updated
+        """
+        # Duplicates would otherwise be counted once per chunk they land in
+        goal_ids = list(dict.fromkeys(goal_ids))
+        completed_at = datetime.now().isoformat()
+        updated = 0
+        
+        with self._get_connection() as conn:
+            for offset in range(0, len(goal_ids), _MAX_IN_PARAMS):
+                chunk = goal_ids[offset:offset + _MAX_IN_PARAMS]
+                placeholders = ", ".join("?" * len(chunk))
+                cursor = conn.execute(
+                    f"""
+                    UPDATE development_plans
+                    SET is_completed = TRUE, completed_at = ?
+                    WHERE id IN ({placeholders})
+                    """,
+                    (completed_at, *chunk)
+                )
+                updated += cursor.rowcount
+        
+        return updated
+    
+    def get_goal_completion_counts(self, session_id: int) -> Tuple[int, int]:
+        """
+        Count completed and total development plan goals for a session.
+        
+        Args:
+            session_id: The session ID
+            
+        Returns:
+            Tuple of (completed goals, total goals)
+        """
+        with self._get_connection() as conn:
+            row = conn.execute(
+                """
+                SELECT COALESCE(SUM(is_completed), 0), COUNT(*)
+                FROM development_plans
+                WHERE session_id = ?
+                """,
+                (session_id,)
+            ).fetchone()
+            return row[0], row[1]
+    
     def get_session_by_id(self, session_id: int) -> Optional[Dict[str, Any]]:
         """
         Get basic session information by ID.
@@ -397,8 +807,8 @@ class SessionDatabase:
                 'user_id': row['user_id'],
                 'start_time': row['start_time'],
                 'end_time': row['end_time'],
-                'feedback_data': json.loads(row['feedback_data']) if row['feedback_data'] else None,
-                'session_summary': json.loads(row['session_summary']) if row['session_summary'] else None
+                'feedback_data': _loads(row['feedback_data']) if row['feedback_data'] else None,
+                'session_summary': _loads(row['session_summary']) if row['session_summary'] else None
             }
     
     def update_session_state(self, session_id: int, state_data: Dict[str, Any]):
@@ -417,6 +827,5 @@ class SessionDatabase:
                 SET session_summary = ?, updated_at = ?
                 WHERE id = ?
                 """,
-                (json.dumps(state_data), datetime.now().isoformat(), session_id)
+                (_dumps(state_data), datetime.now().isoformat(), session_id)
             )
-            conn.commit()
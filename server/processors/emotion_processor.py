@@ -136,7 +136,7 @@ class EmotionProcessor(FrameProcessor):
             if self._should_emit_emotion(emotion_state):
                 # Store in R2C2 engine if available
                 if self.r2c2_engine:
-                    self.r2c2_engine.state.emotional_states.append(emotion_state)
+                    self.r2c2_engine.record_emotion(emotion_state)
                 
                 # Emit to frontend
                 await self._emit_emotion_event(emotion_state)
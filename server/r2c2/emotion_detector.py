@@ -10,7 +10,8 @@ from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
 
 
 class EmotionType(Enum):
@@ -24,7 +25,50 @@ class EmotionType(Enum):
     POSITIVE = "positive"
 
 
-@dataclass
+# Integer codes for the array-backed emotion history
+_EMOTIONS = tuple(EmotionType)
+_EMOTION_CODES = {emotion: code for code, emotion in enumerate(_EMOTIONS)}
+_READY_CODES = np.array([
+    _EMOTION_CODES[EmotionType.NEUTRAL], 
+    _EMOTION_CODES[EmotionType.POSITIVE]
+])
+_SAD_CODE = _EMOTION_CODES[EmotionType.SAD]
+
+
+@lru_cache(maxsize=None)
+def _next_fast_len(n: int) -> int:
+    """Return the smallest 2**a * 3**b * 5**c that is >= n.
+    
+    numpy's FFT is fastest on such 5-smooth lengths.
+    """
+    best = 1 << max(n - 1, 0).bit_length()
+    power5 = 1
+    while power5 < best:
+        power35 = power5
+        while power35 < best:
+            candidate = power35
+            while candidate < n:
+                candidate *= 2
+            best = min(best, candidate)
+            power35 *= 3
+        power5 *= 5
+    return best
+
+
+def _autocorrelation(frames: np.ndarray, max_lag: int) -> np.ndarray:
+    """Autocorrelate each row of frames for lags 0 to max_lag - 1.
+    
+    Uses a zero-padded FFT of at least len + max_lag points, which is enough
+    to keep those lags free of circular wrap-around while staying much
+    smaller than the full 2 * len linear correlation.
+    """
+    n_fft = _next_fast_len(frames.shape[-1] + max_lag)
+    spectrum = np.fft.rfft(frames, n=n_fft, axis=-1)
+    power = spectrum.real ** 2 + spectrum.imag ** 2
+    return np.fft.irfft(power, n=n_fft, axis=-1)[..., :max_lag]
+
+
+@dataclass(slots=True)
 class EmotionState:
     """Emotional state at a point in time."""
     
@@ -59,6 +103,9 @@ class EmotionDetector:
     MIN_CONFIDENCE = 0.3
     HIGH_CONFIDENCE = 0.7
     
+    # Initial capacity of the emotion history arrays (doubled as needed)
+    HISTORY_CAPACITY = 64
+    
     def __init__(self, history_window_seconds: int = 300):
         """Initialize the emotion detector.
         
@@ -66,7 +113,10 @@ class EmotionDetector:
             history_window_seconds: How long to keep emotion history (default 5 minutes)
         """
         self.history_window = timedelta(seconds=history_window_seconds)
-        self.emotion_history: deque = deque()
+        
+        # Emotion history: the states plus parallel timestamp and emotion-code
+        # arrays so window queries run vectorized
+        self.clear_history()
         
         # Baseline values for normalization (updated during session)
         self.baseline_pitch = 150.0  # Hz (typical speaking pitch)
@@ -91,6 +141,55 @@ class EmotionDetector:
         # Extract audio features
         features = self._extract_audio_features(audio_data, sample_rate)
         
+        return self._record_features(features)
+    
+    def analyze_audio_batch(
+        self, 
+        audio_batch: np.ndarray, 
+        sample_rate: int = 16000
+    ) -> List[EmotionState]:
+        """Analyze several equally sized audio buffers in one pass.
+        
+        Features for all rows are extracted together (FFT autocorrelation
+        for pitch, row-wise RMS and zero crossings), then each row is
+        smoothed, classified and recorded exactly as consecutive
+        analyze_audio() calls would.
+        
+        Args:
+            audio_batch: 2-D array with one audio buffer per row
+            sample_rate: Sample rate in Hz (default 16000)
+            
+        Returns:
+            EmotionState for each row, in order
+        """
+        audio_batch = np.atleast_2d(audio_batch)
+        features_batch = self._extract_audio_features_batch(audio_batch, sample_rate)
+        
+        return [self._record_features(features) for features in features_batch]
+    
+    def prime(self, features: Dict[str, float], n: int = 5) -> None:
+        """Seed the smoothing buffers with n copies of known features.
+        
+        Equivalent to analyzing n identical buffers with these features,
+        but skips feature extraction and does not record emotion history.
+        
+        Args:
+            features: Dictionary with 'pitch', 'energy' and 'tempo'
+            n: Number of copies to push (default 5)
+        """
+        self.pitch_buffer.extend([features['pitch']] * n)
+        self.energy_buffer.extend([features['energy']] * n)
+        self.tempo_buffer.extend([features['tempo']] * n)
+    
+    def _record_features(self, features: Dict[str, float]) -> EmotionState:
+        """Smooth extracted features, classify them and record the result.
+        
+        Args:
+            features: Raw features for one audio buffer
+            
+        Returns:
+            EmotionState with detected emotion and confidence
+        """
         # Update buffers for smoothing
         self.pitch_buffer.append(features['pitch'])
         self.energy_buffer.append(features['energy'])
@@ -116,7 +215,7 @@ class EmotionDetector:
         )
         
         # Add to history
-        self.emotion_history.append(emotion_state)
+        self._append_state(emotion_state)
         self._cleanup_old_history()
         
         return emotion_state
@@ -158,6 +257,54 @@ class EmotionDetector:
             'tempo': tempo
         }
     
+    def _extract_audio_features_batch(
+        self, 
+        audio_batch: np.ndarray, 
+        sample_rate: int
+    ) -> List[Dict[str, float]]:
+        """Extract acoustic features from a 2-D batch of audio buffers.
+        
+        Args:
+            audio_batch: Audio samples, one buffer per row
+            sample_rate: Sample rate in Hz
+            
+        Returns:
+            List of feature dictionaries, one per row
+        """
+        num_rows, num_samples = audio_batch.shape
+        
+        if num_samples == 0:
+            return [
+                self._extract_audio_features(audio_batch[0], sample_rate)
+                for _ in range(num_rows)
+            ]
+        
+        # Pitch: autocorrelation of every row via one zero-padded FFT
+        min_period = int(sample_rate / 400)  # Max 400 Hz
+        max_period = int(sample_rate / 80)   # Min 80 Hz
+        
+        if max_period >= num_samples:
+            pitches = np.full(num_rows, self.baseline_pitch)
+        else:
+            peaks = np.max(np.abs(audio_batch), axis=1, keepdims=True)
+            correlation = _autocorrelation(audio_batch / (peaks + 1e-8), max_period)
+            peak_index = np.argmax(correlation[:, min_period:], axis=1) + min_period
+            pitches = sample_rate / peak_index
+            pitches[(pitches < 80) | (pitches > 400)] = self.baseline_pitch
+        
+        # Energy: row-wise RMS normalized against typical speech level
+        energies = np.minimum(np.sqrt(np.mean(audio_batch ** 2, axis=1)) / 0.1, 1.0)
+        
+        # Tempo: zero-crossing rate relative to baseline (~3000 for speech)
+        zero_crossings = np.sum(np.abs(np.diff(np.sign(audio_batch), axis=1)), axis=1) / 2
+        zcr = zero_crossings / (num_samples / sample_rate)
+        tempos = np.clip(zcr / 3000, 0.5, 2.0)
+        
+        return [
+            {'pitch': float(pitch), 'energy': float(energy), 'tempo': float(tempo)}
+            for pitch, energy, tempo in zip(pitches, energies, tempos)
+        ]
+    
     def _estimate_pitch(self, audio_data: np.ndarray, sample_rate: int) -> float:
         """Estimate pitch using autocorrelation method.
         
@@ -168,21 +315,20 @@ class EmotionDetector:
         Returns:
             Estimated pitch in Hz
         """
-        # Normalize audio
-        audio_normalized = audio_data / (np.max(np.abs(audio_data)) + 1e-8)
-        
-        # Autocorrelation
-        correlation = np.correlate(audio_normalized, audio_normalized, mode='full')
-        correlation = correlation[len(correlation)//2:]
-        
         # Find first peak after initial peak (fundamental frequency)
         # Search in typical human voice range: 80-400 Hz
         min_period = int(sample_rate / 400)  # Max 400 Hz
         max_period = int(sample_rate / 80)   # Min 80 Hz
         
-        if max_period >= len(correlation):
+        if max_period >= len(audio_data):
             return self.baseline_pitch
         
+        # Normalize audio
+        audio_normalized = audio_data / (np.max(np.abs(audio_data)) + 1e-8)
+        
+        # Autocorrelation, only for the lags that are searched
+        correlation = _autocorrelation(audio_normalized, max_period)
+        
         # Find peak in valid range
         search_range = correlation[min_period:max_period]
         if len(search_range) == 0:
@@ -333,6 +479,53 @@ class EmotionDetector:
         
         return max_emotion, confidence
     
+    @property
+    def emotion_history(self) -> Tuple[EmotionState, ...]:
+        """Emotion states currently held, oldest first.
+        
+        Read-only; use record() or record_states() to add entries and
+        clear_history() to drop them.
+        """
+        return tuple(self._history[self._history_start:])
+    
+    def record(
+        self, 
+        emotion: EmotionType, 
+        confidence: float, 
+        timestamp: Optional[datetime] = None
+    ) -> EmotionState:
+        """Append an emotion state to the history.
+        
+        Args:
+            emotion: Detected emotion
+            confidence: Detection confidence (0-1)
+            timestamp: When the emotion was observed (default now)
+            
+        Returns:
+            The recorded EmotionState
+        """
+        state = EmotionState(emotion, confidence, timestamp or datetime.now())
+        self._append_state(state)
+        return state
+    
+    def record_states(self, states: Iterable[EmotionState]) -> None:
+        """Append several emotion states to the history in one pass.
+        
+        Args:
+            states: Emotion states in the order they should be recorded
+        """
+        states = list(states)
+        end = len(self._history)
+        new_end = end + len(states)
+        if new_end > self._history_times.size:
+            self._grow_history(new_end)
+        
+        self._history_times[end:new_end] = np.array(
+            [state.timestamp for state in states], dtype='datetime64[us]'
+        )
+        self._history_codes[end:new_end] = [_EMOTION_CODES[state.emotion] for state in states]
+        self._history.extend(states)
+    
     def get_emotion_trend(self, window_seconds: int = 30) -> EmotionType:
         """Get the predominant emotion over a time window.
         
@@ -342,25 +535,22 @@ class EmotionDetector:
         Returns:
             Most common emotion in the window
         """
-        cutoff_time = datetime.now() - timedelta(seconds=window_seconds)
+        indices = self._window_indices(window_seconds)
         
-        # Get emotions in window
-        recent_emotions = [
-            state for state in self.emotion_history
-            if state.timestamp >= cutoff_time
-        ]
-        
-        if not recent_emotions:
+        if indices.size == 0:
             return EmotionType.NEUTRAL
         
         # Count emotion frequencies
-        emotion_counts = {}
-        for state in recent_emotions:
-            emotion = state.emotion
-            emotion_counts[emotion] = emotion_counts.get(emotion, 0) + 1
+        codes = self._history_codes[indices]
+        counts = np.bincount(codes, minlength=len(_EMOTIONS))
+        most_common = np.flatnonzero(counts == counts.max())
+        
+        # On a tie, the emotion seen first in the window wins
+        if most_common.size > 1:
+            first_seen = [np.argmax(codes == code) for code in most_common]
+            return _EMOTIONS[most_common[np.argmin(first_seen)]]
         
-        # Return most common
-        return max(emotion_counts, key=emotion_counts.get)
+        return _EMOTIONS[most_common[0]]
     
     def is_emotionally_ready_for_transition(self, window_seconds: int = 60) -> bool:
         """Check if emotional state indicates readiness for phase transition.
@@ -374,44 +564,21 @@ class EmotionDetector:
         Returns:
             True if emotions indicate readiness for transition
         """
-        cutoff_time = datetime.now() - timedelta(seconds=window_seconds)
+        indices = self._window_indices(window_seconds)
         
-        # Get recent emotions
-        recent_emotions = [
-            state for state in self.emotion_history
-            if state.timestamp >= cutoff_time
-        ]
-        
-        if len(recent_emotions) < 3:
+        if indices.size < 3:
             return False
         
-        # Define ready vs. not-ready emotions
-        ready_emotions = {EmotionType.NEUTRAL, EmotionType.POSITIVE}
-        defensive_emotions = {
-            EmotionType.DEFENSIVE, 
-            EmotionType.FRUSTRATED, 
-            EmotionType.ANXIOUS
-        }
-        
         # Get most recent sample (last 3 emotions)
-        recent_sample = recent_emotions[-3:]
-        
-        # Count ready emotions in recent sample
-        ready_count = sum(
-            1 for state in recent_sample
-            if state.emotion in ready_emotions
-        )
+        recent_sample = self._history_codes[indices[-3:]]
         
-        # Check if majority are ready emotions
-        is_ready = ready_count >= len(recent_sample) / 2
-        
-        # Additional check: ensure we're not in a sad state
-        # (sad is not defensive but also not ready to move forward)
-        has_sad = any(state.emotion == EmotionType.SAD for state in recent_sample)
-        if has_sad:
-            is_ready = False
+        # Sad is not defensive but also not ready to move forward
+        if np.any(recent_sample == _SAD_CODE):
+            return False
         
-        return is_ready
+        # Check if majority are ready (neutral/positive) emotions
+        ready_count = np.count_nonzero(np.isin(recent_sample, _READY_CODES))
+        return bool(ready_count >= recent_sample.size / 2)
     
     def get_emotion_history(
         self, 
@@ -426,24 +593,67 @@ class EmotionDetector:
             List of emotion states in chronological order
         """
         if window_seconds is None:
-            return list(self.emotion_history)
+            return self._history[self._history_start:]
         
-        cutoff_time = datetime.now() - timedelta(seconds=window_seconds)
-        return [
-            state for state in self.emotion_history
-            if state.timestamp >= cutoff_time
-        ]
+        return [self._history[index] for index in self._window_indices(window_seconds)]
+    
+    def _window_indices(self, window_seconds: int) -> np.ndarray:
+        """Return history indices of states at or after now - window_seconds."""
+        cutoff = np.datetime64(datetime.now() - timedelta(seconds=window_seconds), 'us')
+        start, end = self._history_start, len(self._history)
+        return np.flatnonzero(self._history_times[start:end] >= cutoff) + start
+    
+    def _append_state(self, state: EmotionState) -> None:
+        """Append a single emotion state to the history."""
+        end = len(self._history)
+        if end == self._history_times.size:
+            self._grow_history(end + 1)
+        
+        self._history_times[end] = state.timestamp
+        self._history_codes[end] = _EMOTION_CODES[state.emotion]
+        self._history.append(state)
+    
+    def _grow_history(self, min_capacity: int) -> None:
+        """Reallocate the history arrays to hold at least min_capacity states."""
+        capacity = max(min_capacity, 2 * self._history_times.size)
+        end = len(self._history)
+        
+        times = np.empty(capacity, dtype='datetime64[us]')
+        times[:end] = self._history_times[:end]
+        codes = np.empty(capacity, dtype=np.int8)
+        codes[:end] = self._history_codes[:end]
+        
+        self._history_times = times
+        self._history_codes = codes
+    
+    def clear_history(self) -> None:
+        """Drop all emotion history and reallocate its arrays."""
+        self._history: List[EmotionState] = []
+        self._history_times = np.empty(self.HISTORY_CAPACITY, dtype='datetime64[us]')
+        self._history_codes = np.empty(self.HISTORY_CAPACITY, dtype=np.int8)
+        self._history_start = 0
     
     def _cleanup_old_history(self) -> None:
         """Remove emotion states older than the history window."""
-        cutoff_time = datetime.now() - self.history_window
-        
-        while self.emotion_history and self.emotion_history[0].timestamp < cutoff_time:
-            self.emotion_history.popleft()
+        cutoff_time = np.datetime64(datetime.now() - self.history_window, 'us')
+        start, end = self._history_start, len(self._history)
+        
+        # Drop states from the front up to the first one still in the window
+        expired = self._history_times[start:end] < cutoff_time
+        self._history_start = end if expired.all() else start + int(np.argmin(expired))
+        
+        # Compact once more than half the stored states have expired
+        if self._history_start > end // 2:
+            keep = slice(self._history_start, end)
+            self._history = self._history[keep]
+            kept = len(self._history)
+            self._history_times[:kept] = self._history_times[keep]
+            self._history_codes[:kept] = self._history_codes[keep]
+            self._history_start = 0
     
     def reset(self) -> None:
         """Reset the detector state and history."""
-        self.emotion_history.clear()
+        self.clear_history()
         self.pitch_buffer.clear()
         self.energy_buffer.clear()
         self.tempo_buffer.clear()
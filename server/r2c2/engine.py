@@ -8,18 +8,29 @@ This module implements the R2C2 framework for processing 360° feedback:
 """
 
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional
 
 
 class R2C2Phase(Enum):
-    """R2C2 framework phases."""
+    """R2C2 framework phases.
     
-    RELATIONSHIP = "relationship"
-    REACTION = "reaction"
-    CONTENT = "content"
-    COACHING = "coaching"
+    ``value`` is the serialized phase name; ``index`` is the phase's
+    position in the framework and is used for internal table lookups.
+    """
+    
+    RELATIONSHIP = ("relationship", 0)
+    REACTION = ("reaction", 1)
+    CONTENT = ("content", 2)
+    COACHING = ("coaching", 3)
+    
+    def __new__(cls, value: str, index: int):
+        member = object.__new__(cls)
+        member._value_ = value
+        member.index = index
+        return member
 
 
 @dataclass
@@ -33,7 +44,7 @@ class FeedbackData:
     raw_comments: List[Dict[str, Any]] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class EmotionState:
     """Emotional state at a point in time."""
     
@@ -63,6 +74,415 @@ class R2C2State:
     development_plan: Optional[DevelopmentPlan] = None
     emotional_states: List[EmotionState] = field(default_factory=list)
     phase_history: List[Dict[str, Any]] = field(default_factory=list)
+    # Running totals for emotional_states entries pruned from the window
+    first_emotion: Optional[str] = None
+    last_pruned_emotion: Optional[str] = None
+    pruned_emotion_counts: Dict[str, int] = field(default_factory=dict)
+    pruned_emotion_changes: int = 0
+
+
+# Phase that follows each phase, indexed by R2C2Phase.index
+_NEXT_PHASE = (
+    R2C2Phase.REACTION,
+    R2C2Phase.CONTENT,
+    R2C2Phase.COACHING,
+    R2C2Phase.COACHING,
+)
+
+
+# Read-only pacing recommendations shared across calls.
+_PACING_DEFAULT = MappingProxyType({
+    'pace': 'normal',
+    'pause_duration': 'standard',
+    'validation_level': 'normal',
+    'complexity': 'normal'
+})
+
+_PACING_SLOW_BASE = MappingProxyType({
+    'pace': 'slow',
+    'pause_duration': 'extended',  # Give more time for processing
+    'validation_level': 'high',  # Use more validation language
+    'complexity': 'low',  # Keep questions and topics simple
+})
+
+_PACING_POSITIVE = MappingProxyType({
+    'pace': 'normal',
+    'pause_duration': 'standard',
+    'validation_level': 'normal',
+    'complexity': 'normal',  # Can handle more complex topics
+    'recommendation': 'User is in a positive state. Maintain momentum and depth.'
+})
+
+_PACING_NEUTRAL = MappingProxyType({
+    'pace': 'normal',
+    'pause_duration': 'standard',
+    'validation_level': 'normal',
+    'complexity': 'normal',
+    'recommendation': 'User is in a neutral state. Continue with standard pacing.'
+})
+
+
+# Emotional adaptation guidance, keyed by predominant emotion
+_EMOTIONAL_GUIDANCE_HEADER = "\n## EMOTIONAL ADAPTATION GUIDANCE\n\n"
+
+_DEFENSIVE_GUIDANCE = """**Current Emotional State: DEFENSIVE**
+
+The user is showing signs of defensiveness. This is completely normal and expected.
+
+**Adapt your approach:**
+- **SLOW DOWN**: Don't rush forward. Give them space to process.
+- **VALIDATE MORE**: Use extra validation language: "That makes complete sense..." "I can understand why you'd feel that way..."
+- **NORMALIZE**: Remind them that defensiveness is a natural protective response
+- **DON'T CHALLENGE**: Avoid any language that could feel like you're disagreeing or correcting them
+- **REFLECT, DON'T ADVISE**: Focus on reflecting their feelings back, not on problem-solving
+- **USE SOFTER LANGUAGE**: "I'm wondering..." instead of "You should..." or "Have you considered..."
+
+**Key phrases:**
+- "It's completely natural to feel defensive when receiving criticism"
+- "Your reaction makes sense given..."
+- "Let's just sit with that feeling for a moment"
+- "There's no rush to move past this"
+
+**What to avoid:**
+- Pushing them to "see the other side" too quickly
+- Suggesting they're being unreasonable
+- Moving to action planning or solutions
+"""
+
+_FRUSTRATED_GUIDANCE = """**Current Emotional State: FRUSTRATED**
+
+The user is showing frustration. They may feel stuck, misunderstood, or overwhelmed.
+
+**Adapt your approach:**
+- **ACKNOWLEDGE THE FRUSTRATION**: Name it directly: "I'm sensing some frustration..."
+- **SLOW THE PACE**: Don't add more information or questions—simplify
+- **VALIDATE THE DIFFICULTY**: "This is hard work. It's okay to feel frustrated."
+- **OFFER A PAUSE**: "Would it help to take a breath and step back for a moment?"
+- **SIMPLIFY**: Break things down into smaller pieces
+- **CHECK IN**: "What would be most helpful right now?"
+
+**Key phrases:**
+- "I hear the frustration in your voice"
+- "This is challenging work—it makes sense you'd feel frustrated"
+- "What would help right now?"
+- "We can slow down if you need to"
+
+**What to avoid:**
+- Adding complexity or more topics
+- Pushing forward without acknowledging the frustration
+- Being overly cheerful or dismissive
+"""
+
+_SAD_GUIDANCE = """**Current Emotional State: SAD**
+
+The user is showing sadness. The feedback may have touched on something painful or disappointing.
+
+**Adapt your approach:**
+- **SLOW WAY DOWN**: Give lots of space for silence and processing
+- **BE GENTLE**: Use softer, more compassionate language
+- **VALIDATE THE PAIN**: "This is touching on something painful, isn't it?"
+- **DON'T RUSH TO FIX**: Resist the urge to make them feel better quickly
+- **OFFER COMPASSION**: "I'm sorry this is so hard"
+- **CHECK THEIR CAPACITY**: "Do you want to keep going, or would you like to pause?"
+
+**Key phrases:**
+- "I can hear how much this is affecting you"
+- "It's okay to feel sad about this"
+- "Take your time"
+- "This matters to you, doesn't it?"
+
+**What to avoid:**
+- Trying to cheer them up or minimize the pain
+- Rushing to action or solutions
+- Being overly analytical or intellectual
+"""
+
+_ANXIOUS_GUIDANCE = """**Current Emotional State: ANXIOUS**
+
+The user is showing anxiety. They may be worried about the implications of the feedback or feeling overwhelmed.
+
+**Adapt your approach:**
+- **PROVIDE REASSURANCE**: Remind them this is a safe space
+- **SLOW DOWN AND SIMPLIFY**: Reduce complexity and focus on one thing at a time
+- **GROUND THEM**: Help them focus on the present moment, not catastrophizing about the future
+- **NORMALIZE**: "It's normal to feel anxious when processing feedback"
+- **OFFER CONTROL**: Give them choices: "Would you like to talk about X or Y first?"
+- **BE STEADY AND CALM**: Your calm presence can help regulate their anxiety
+
+**Key phrases:**
+- "Let's take this one step at a time"
+- "You're safe here—there's no judgment"
+- "What feels most manageable to focus on right now?"
+- "We don't have to solve everything today"
+
+**What to avoid:**
+- Adding more topics or complexity
+- Future-focused questions that increase worry
+- Rushing or creating time pressure
+"""
+
+_POSITIVE_GUIDANCE = """**Current Emotional State: POSITIVE/OPEN**
+
+The user is showing positive emotions and openness. They're in a good state for learning and growth.
+
+**Adapt your approach:**
+- **LEVERAGE THE OPENNESS**: This is a great time to go deeper or explore new perspectives
+- **MAINTAIN MOMENTUM**: Keep the energy going with curious questions
+- **CELEBRATE INSIGHTS**: Acknowledge their growth and openness
+- **DEEPEN THE WORK**: They're ready for more challenging questions or perspectives
+- **BUILD ON PROGRESS**: "You've made real progress in this conversation..."
+
+**Key phrases:**
+- "I love your openness to this"
+- "That's a really insightful observation"
+- "You're doing great work here"
+- "What else are you noticing?"
+
+**What to avoid:**
+- Becoming complacent—keep the depth
+- Rushing just because they're positive
+- Missing opportunities to go deeper
+"""
+
+_NEUTRAL_GUIDANCE = """**Current Emotional State: NEUTRAL/CALM**
+
+The user is in a neutral, calm state. This is ideal for productive conversation.
+
+**Adapt your approach:**
+- **MAINTAIN THE PACE**: Continue with your normal coaching approach
+- **STAY CURIOUS**: Ask open-ended questions
+- **GO DEEPER**: They have capacity for deeper exploration
+- **WATCH FOR SHIFTS**: Monitor for emotional changes as you explore sensitive topics
+
+This is a good state for learning and growth. Continue with your phase-specific guidance.
+"""
+
+_GUIDANCE_BY_EMOTION: Dict[str, str] = {
+    'defensive': _EMOTIONAL_GUIDANCE_HEADER + _DEFENSIVE_GUIDANCE,
+    'frustrated': _EMOTIONAL_GUIDANCE_HEADER + _FRUSTRATED_GUIDANCE,
+    'sad': _EMOTIONAL_GUIDANCE_HEADER + _SAD_GUIDANCE,
+    'anxious': _EMOTIONAL_GUIDANCE_HEADER + _ANXIOUS_GUIDANCE,
+    'positive': _EMOTIONAL_GUIDANCE_HEADER + _POSITIVE_GUIDANCE,
+    'neutral': _EMOTIONAL_GUIDANCE_HEADER + _NEUTRAL_GUIDANCE,
+}
+
+
+# Static halves of the phase prompts; the dynamic summaries are joined in between.
+_REACTION_PROMPT_PREFIX = """You are in the REACTION EXPLORATION phase of the R2C2 framework.
+
+## Phase Goal
+Help the employee explore and process their emotional reactions to the feedback. Defensiveness is the biggest barrier to learning from feedback—this phase reduces it by creating space for emotions.
+
+## Feedback They Received
+"""
+
+_REACTION_PROMPT_SUFFIX = """
+
+## What to Do
+
+**Explore Initial Reactions (First 1-2 minutes):**
+- Ask open-ended questions: "What was your first reaction when you read the feedback?" "What surprised you?"
+- Listen for emotional words: defensive, frustrated, hurt, confused, angry, unfair
+- Reflect back what you hear: "It sounds like the comments about [X] really caught you off guard..."
+- Normalize defensiveness: "It's completely natural to feel defensive. Our brains are wired to protect us from criticism."
+
+**Go Deeper (Next 2-3 minutes):**
+- Explore specific triggers: "Which pieces of feedback felt hardest to hear?" "What about that feedback triggered such a strong reaction?"
+- Look for patterns: "I'm noticing you've mentioned feeling misunderstood a few times. Tell me more about that."
+- Validate without reinforcing: "That makes sense you'd feel that way" (not "You're right, that feedback was unfair")
+- Use curious, non-judgmental language: "What comes up for you when you think about that?" "Help me understand what that brings up..."
+
+**Processing Emotions:**
+- Give space for silence—don't rush to fill it
+- Acknowledge the difficulty: "This isn't easy to talk about. I appreciate you being open."
+- Distinguish between the emotion and the feedback: "It sounds like you're feeling hurt. That's separate from whether the feedback has truth to it. Let's honor the feeling first."
+- Watch for shifts: When defensiveness softens (voice calms, they start asking questions, they acknowledge some truth), that's progress
+
+## What NOT to Do
+- Don't problem-solve yet ("Well, here's what you could do...")
+- Don't challenge their feelings ("But don't you think...")
+- Don't rush to the content ("Let's look at what they actually said...")
+- Don't agree that the feedback is wrong or unfair
+- Don't let them spiral into blame or victimhood
+
+## Key Phrases to Use
+- "It sounds like..."
+- "I'm hearing that..."
+- "That makes sense because..."
+- "What comes up for you when..."
+- "Tell me more about that feeling..."
+- "It's okay to feel [emotion]. Let's sit with that for a moment."
+
+## Transition Signal
+When you notice:
+- Their voice becomes calmer
+- They start asking questions or showing curiosity
+- They acknowledge some truth in the feedback
+- They say things like "I guess..." or "Maybe..."
+
+Then you can suggest: "I'm noticing you seem a bit more settled. Would it be okay if we start looking at the actual content of the feedback more objectively?"
+
+This phase is critical. Don't rush it. Emotional processing takes time.
+"""
+
+_CONTENT_PROMPT_PREFIX = """You are in the CONTENT DISCUSSION phase of the R2C2 framework.
+
+## Phase Goal
+Help the employee understand the feedback content clearly and objectively. Now that emotions have been processed, they can look at the feedback as data rather than attack.
+
+## Feedback Themes
+"""
+
+_CONTENT_PROMPT_MIDDLE = """
+
+## Their Reactions So Far
+"""
+
+_CONTENT_PROMPT_SUFFIX = """
+
+## What to Do
+
+**Review Themes Systematically (First 2-3 minutes):**
+- Start with patterns: "Looking at all the feedback together, what patterns do you notice?"
+- Highlight recurring themes: "I see [theme] mentioned by multiple people. What do you make of that?"
+- Separate behavior from identity: "The feedback is about what you do, not who you are. Let's look at the behaviors people are describing."
+- Ask for their interpretation: "When people say [feedback], what do you think they're experiencing?"
+
+**Deepen Understanding (Next 2-3 minutes):**
+- Explore different perspectives: "How might your manager see this differently than your peers?" "What might they be noticing that you're not aware of?"
+- Look for blind spots: "Is there feedback here that surprises you? That might be a blind spot worth exploring."
+- Connect to impact: "When you [behavior], what impact might that have on others?" "How might that land for someone on the receiving end?"
+- Distinguish intent from impact: "I hear that you didn't intend [X], but the feedback suggests that's how it landed. What do you think about that gap?"
+
+**Prioritize (Final 1-2 minutes):**
+- Identify what matters most: "Of all these themes, which ones feel most important to address?" "Which would have the biggest impact if you changed them?"
+- Look for quick wins vs. deeper work: "Are there some behaviors that would be relatively easy to shift? Which ones might require more sustained effort?"
+- Connect to their goals: "Which of these themes, if you addressed them, would most help you achieve your career goals?"
+
+## What NOT to Do
+- Don't let them dismiss feedback as "wrong" or "unfair" without exploring it
+- Don't agree with dismissals ("Yeah, they probably just don't understand you")
+- Don't overwhelm them with too much at once—focus on 2-3 key themes
+- Don't let them make it about character ("I'm just a bad communicator") vs. behavior ("I need to work on checking for understanding")
+
+## Key Phrases to Use
+- "What patterns do you notice?"
+- "How might others be experiencing that behavior?"
+- "What do you think they're seeing that led to this feedback?"
+- "Let's separate the behavior from who you are as a person..."
+- "If you were in their shoes, how might you see this?"
+- "What's the gap between your intent and the impact?"
+
+## Coaching Techniques
+- **Perspective-taking**: Help them see through others' eyes
+- **Pattern recognition**: Connect dots across multiple feedback sources
+- **Behavior focus**: Keep it about actions, not character
+- **Curiosity over judgment**: "I wonder..." "What if..."
+- **Reality testing**: "Does that feedback match anything you've noticed yourself?"
+
+## Transition Signal
+When they:
+- Demonstrate clear understanding of key themes
+- Can articulate the feedback without defensiveness
+- Show curiosity about changing behaviors
+- Ask "So what should I do about this?"
+
+Then you can suggest: "It sounds like you have a clearer picture of the feedback now. Should we start thinking about what you want to do with these insights?"
+
+This phase is about clarity and understanding, not yet about action. Make sure they truly understand before moving to coaching.
+"""
+
+_COACHING_PROMPT_PREFIX = """You are in the COACHING FOR CHANGE phase of the R2C2 framework.
+
+## Phase Goal
+Help the employee create a concrete, actionable development plan. This is where insights become action. Focus on 1-3 specific, achievable commitments.
+
+## Feedback Themes
+"""
+
+_COACHING_PROMPT_MIDDLE = """
+
+## Key Insights from Our Discussion
+"""
+
+_COACHING_PROMPT_SUFFIX = """
+
+## What to Do
+
+**Prioritize Development Areas (First 1-2 minutes):**
+- Narrow the focus: "We've talked about several themes. Which 1-3 areas do you want to focus on first?"
+- Check motivation: "Why is this area important to you?" "What would change if you improved here?"
+- Ensure ownership: They should choose, not you. "What feels most urgent or impactful to you?"
+- Keep it manageable: "Let's not try to change everything at once. What's realistic?"
+
+**Create SMART Goals (Next 2-3 minutes):**
+For each priority area, help them create a SMART goal:
+- **Specific**: "What exactly will you do differently?" Not "communicate better" but "send a summary email after each meeting"
+- **Measurable**: "How will you know you're making progress?" "What would success look like?"
+- **Achievable**: "Is this realistic given your current workload and constraints?"
+- **Relevant**: "How does this connect to your career goals?" "Why does this matter?"
+- **Time-bound**: "When will you start?" "When will you check in on progress?"
+
+**Use START, STOP, CONTINUE Framework:**
+- **START**: "What's one new behavior you'll begin doing?"
+- **STOP**: "What's one behavior you'll stop or do less of?"
+- **CONTINUE**: "What's working that you want to keep doing?"
+
+**Plan for Obstacles (Next 1-2 minutes):**
+- Anticipate challenges: "What might get in the way of this change?"
+- Problem-solve: "How will you handle it when [obstacle] comes up?"
+- Build in support: "Who can help you with this?" "Who will you tell about this commitment?"
+- Create accountability: "How will you track your progress?" "When will you check in with yourself?"
+
+**Summarize and Celebrate (Final 1 minute):**
+- Recap clearly: "Let me make sure I have this right. You're committing to..."
+- Make it concrete: "So starting [when], you'll [specific action]..."
+- Acknowledge courage: "This takes real courage. I'm impressed by your commitment to growth."
+- Set up follow-up: "When will you review how this is going?" "Who will you share this plan with?"
+
+## What NOT to Do
+- Don't let them commit to too much (overwhelming leads to failure)
+- Don't accept vague goals ("I'll be better at communication")
+- Don't skip the obstacle planning (unrealistic optimism leads to disappointment)
+- Don't make it your plan—it has to be theirs
+- Don't forget to celebrate their commitment
+
+## Key Phrases to Use
+- "What specifically will you do differently?"
+- "How will you know you're making progress?"
+- "What might get in the way?"
+- "Who can support you in this?"
+- "Let's make this concrete..."
+- "What's one small step you can take this week?"
+
+## SMART Goal Examples
+**Vague**: "I'll communicate better"
+**SMART**: "I'll send a brief summary email within 24 hours of every stakeholder meeting, highlighting decisions made and next steps"
+
+**Vague**: "I'll delegate more"
+**SMART**: "I'll identify one task per week that I can delegate to a team member, and I'll schedule a 15-minute coaching conversation when I hand it off"
+
+**Vague**: "I'll be less defensive"
+**SMART**: "When I receive critical feedback, I'll pause for 3 seconds before responding, and I'll ask one clarifying question before defending my position"
+
+## Development Plan Structure
+For each goal, capture:
+1. **Goal Type**: START / STOP / CONTINUE
+2. **Specific Behavior**: Exactly what they'll do
+3. **Success Metric**: How they'll measure progress
+4. **Timeline**: When they'll start and when they'll review
+5. **Support**: Who will help them
+6. **Obstacles**: What might get in the way and how they'll handle it
+
+## Transition to Closing
+When you have 1-3 concrete commitments:
+- Summarize the full plan
+- Acknowledge their growth through this conversation
+- Remind them this is a journey, not a destination
+- Encourage them to be kind to themselves as they practice new behaviors
+
+This is the payoff phase. Make sure they leave with a clear, actionable plan they're genuinely committed to.
+"""
 
 
 class R2C2Engine:
@@ -73,6 +493,9 @@ class R2C2Engine:
     REACTION_MIN_DURATION = 180  # 3 minutes
     CONTENT_MIN_DURATION = 240  # 4 minutes
     
+    # Emotional states older than this are pruned from the live window
+    _MAX_EMOTION_WINDOW_SECONDS = 120  # 2x the widest window queried
+    
     # Emotion thresholds for transitions
     DEFENSIVE_EMOTIONS = {'defensive', 'frustrated', 'anxious'}
     READY_EMOTIONS = {'neutral', 'positive'}
@@ -98,6 +521,27 @@ class R2C2Engine:
         """
         return self.state.current_phase
     
+    @staticmethod
+    def _predominant_emotion(emotion_counts: Dict[str, int], default: str) -> str:
+        """Find the most frequent emotion in a single pass over the counts.
+        
+        Ties resolve to the emotion counted first, matching ``max()``.
+        
+        Args:
+            emotion_counts: Mapping of emotion label to occurrence count
+            default: Value returned when there are no counts
+            
+        Returns:
+            The emotion label with the highest count
+        """
+        best_emotion = default
+        best_count = 0
+        for emotion, count in emotion_counts.items():
+            if count > best_count:
+                best_count = count
+                best_emotion = emotion
+        return best_emotion
+    
     def get_time_in_phase(self) -> float:
         """Get time spent in current phase in seconds.
         
@@ -106,6 +550,19 @@ class R2C2Engine:
         """
         return (datetime.now() - self.state.phase_start_time).total_seconds()
     
+    def advance_simulated_time(self, seconds: float) -> None:
+        """Simulate time passing without waiting on the wall clock.
+        
+        Moves the phase and session start times back, so the time in the
+        current phase and the session duration both grow by ``seconds``.
+        
+        Args:
+            seconds: Number of seconds to simulate
+        """
+        delta = timedelta(seconds=seconds)
+        self.state.phase_start_time -= delta
+        self._session_start_time -= delta
+    
     def get_recent_emotions(self, window_seconds: int = 60) -> List[EmotionState]:
         """Get emotions from recent time window.
         
@@ -115,7 +572,6 @@ class R2C2Engine:
         Returns:
             List of emotion states within the window
         """
-        from datetime import timedelta
         cutoff_time = datetime.now() - timedelta(seconds=window_seconds)
         
         return [
@@ -123,20 +579,69 @@ class R2C2Engine:
             if emotion.timestamp >= cutoff_time
         ]
     
+    def record_emotion(self, emotion_state: EmotionState) -> None:
+        """Append an emotion state, pruning stale entries every 32 appends.
+        
+        Args:
+            emotion_state: Emotion state to add to the history
+        """
+        emotional_states = self.state.emotional_states
+        emotional_states.append(emotion_state)
+        if len(emotional_states) & 0x1F == 0:
+            self._prune_emotional_states()
+    
+    def _prune_emotional_states(self) -> None:
+        """Drop leading emotion states older than the widest window.
+        
+        Pruned entries are folded into the running totals on the state so
+        the session summary still covers the whole emotional journey.
+        """
+        emotional_states = self.state.emotional_states
+        cutoff_time = datetime.now() - timedelta(seconds=self._MAX_EMOTION_WINDOW_SECONDS)
+        
+        prune_count = 0
+        for emotion_state in emotional_states:
+            if emotion_state.timestamp >= cutoff_time:
+                break
+            prune_count += 1
+        
+        if not prune_count:
+            return
+        
+        if self.state.first_emotion is None:
+            self.state.first_emotion = emotional_states[0].emotion
+        
+        counts = self.state.pruned_emotion_counts
+        previous = self.state.last_pruned_emotion
+        for emotion_state in emotional_states[:prune_count]:
+            emotion = emotion_state.emotion
+            counts[emotion] = counts.get(emotion, 0) + 1
+            if previous is not None and emotion != previous:
+                self.state.pruned_emotion_changes += 1
+            previous = emotion
+        self.state.last_pruned_emotion = previous
+        
+        del emotional_states[:prune_count]
+    
     def is_emotionally_ready_for_transition(self) -> bool:
         """Check if user's emotional state indicates readiness to transition.
         
         Returns:
             True if emotions indicate readiness for next phase
         """
-        recent_emotions = self.get_recent_emotions(window_seconds=60)
-        
-        if not recent_emotions:
+        # Get the most recent emotions (last 3 inside the window), scanning
+        # from the end so long histories are not filtered in full
+        cutoff_time = datetime.now() - timedelta(seconds=60)
+        recent_sample = []
+        for emotion_state in reversed(self.state.emotional_states):
+            if emotion_state.timestamp >= cutoff_time:
+                recent_sample.append(emotion_state)
+                if len(recent_sample) == 3:
+                    break
+        
+        if not recent_sample:
             return False
         
-        # Get the most recent emotions (last 3)
-        recent_sample = recent_emotions[-3:] if len(recent_emotions) >= 3 else recent_emotions
-        
         # Check if majority are ready emotions
         ready_count = sum(
             1 for e in recent_sample 
@@ -159,7 +664,7 @@ class R2C2Engine:
         
         # Add current emotion to history if provided
         if emotion_state:
-            self.state.emotional_states.append(emotion_state)
+            self.record_emotion(emotion_state)
         
         # Relationship -> Reaction transition
         if current_phase == R2C2Phase.RELATIONSHIP:
@@ -211,20 +716,8 @@ class R2C2Engine:
             'ended_at': datetime.now()
         })
         
-        # Determine next phase
-        phase_order = [
-            R2C2Phase.RELATIONSHIP,
-            R2C2Phase.REACTION,
-            R2C2Phase.CONTENT,
-            R2C2Phase.COACHING
-        ]
-        
-        current_index = phase_order.index(old_phase)
-        if current_index < len(phase_order) - 1:
-            new_phase = phase_order[current_index + 1]
-        else:
-            # Already in final phase
-            new_phase = old_phase
+        # Determine next phase (coaching is final and maps to itself)
+        new_phase = _NEXT_PHASE[old_phase.index]
         
         # Update state
         self.state.current_phase = new_phase
@@ -233,33 +726,32 @@ class R2C2Engine:
         return new_phase
 
     
-    def get_phase_prompt(self, include_emotional_guidance: bool = True) -> str:
+    def get_phase_prompt(
+        self,
+        include_emotional_guidance: bool = True,
+        phase: Optional[R2C2Phase] = None
+    ) -> str:
         """Get the system prompt for the current phase.
         
         Args:
             include_emotional_guidance: Whether to include emotional adaptation guidance
+            phase: Phase to build the prompt for; defaults to the current phase.
+                Passing a phase does not change session state.
         
         Returns:
             Phase-specific system instruction
         """
-        phase = self.state.current_phase
+        if phase is None:
+            phase = self.state.current_phase
         
         # Get base phase prompt
-        base_prompt = ""
-        if phase == R2C2Phase.RELATIONSHIP:
-            base_prompt = self._get_relationship_prompt()
-        elif phase == R2C2Phase.REACTION:
-            base_prompt = self._get_reaction_prompt()
-        elif phase == R2C2Phase.CONTENT:
-            base_prompt = self._get_content_prompt()
-        elif phase == R2C2Phase.COACHING:
-            base_prompt = self._get_coaching_prompt()
+        base_prompt = self._PHASE_PROMPT_BUILDERS[phase.index](self)
         
-        # Add emotional adaptation guidance if requested
-        if include_emotional_guidance:
+        # Add emotional adaptation guidance if requested and any emotions are recorded
+        if include_emotional_guidance and self.state.emotional_states:
             emotional_guidance = self._get_emotional_adaptation_guidance()
             if emotional_guidance:
-                base_prompt += f"\n\n{emotional_guidance}"
+                return f"{base_prompt}\n\n{emotional_guidance}"
         
         return base_prompt
     
@@ -277,173 +769,31 @@ class R2C2Engine:
         # Get the most recent emotion
         current_emotion = recent_emotions[-1].emotion if recent_emotions else 'neutral'
         
-        # Count emotion frequencies in recent window
-        emotion_counts = {}
-        for emotion_state in recent_emotions:
-            emotion = emotion_state.emotion
-            emotion_counts[emotion] = emotion_counts.get(emotion, 0) + 1
-        
-        # Determine predominant recent emotion
-        predominant_emotion = max(emotion_counts, key=emotion_counts.get) if emotion_counts else 'neutral'
-        
-        # Generate guidance based on emotional state
-        guidance = "\n## EMOTIONAL ADAPTATION GUIDANCE\n\n"
-        
-        if predominant_emotion == 'defensive':
-            guidance += """**Current Emotional State: DEFENSIVE**
-
-The user is showing signs of defensiveness. This is completely normal and expected.
-
-**Adapt your approach:**
-- **SLOW DOWN**: Don't rush forward. Give them space to process.
-- **VALIDATE MORE**: Use extra validation language: "That makes complete sense..." "I can understand why you'd feel that way..."
-- **NORMALIZE**: Remind them that defensiveness is a natural protective response
-- **DON'T CHALLENGE**: Avoid any language that could feel like you're disagreeing or correcting them
-- **REFLECT, DON'T ADVISE**: Focus on reflecting their feelings back, not on problem-solving
-- **USE SOFTER LANGUAGE**: "I'm wondering..." instead of "You should..." or "Have you considered..."
-
-**Key phrases:**
-- "It's completely natural to feel defensive when receiving criticism"
-- "Your reaction makes sense given..."
-- "Let's just sit with that feeling for a moment"
-- "There's no rush to move past this"
-
-**What to avoid:**
-- Pushing them to "see the other side" too quickly
-- Suggesting they're being unreasonable
-- Moving to action planning or solutions
-"""
-        
-        elif predominant_emotion == 'frustrated':
-            guidance += """**Current Emotional State: FRUSTRATED**
-
-The user is showing frustration. They may feel stuck, misunderstood, or overwhelmed.
-
-**Adapt your approach:**
-- **ACKNOWLEDGE THE FRUSTRATION**: Name it directly: "I'm sensing some frustration..."
-- **SLOW THE PACE**: Don't add more information or questions—simplify
-- **VALIDATE THE DIFFICULTY**: "This is hard work. It's okay to feel frustrated."
-- **OFFER A PAUSE**: "Would it help to take a breath and step back for a moment?"
-- **SIMPLIFY**: Break things down into smaller pieces
-- **CHECK IN**: "What would be most helpful right now?"
-
-**Key phrases:**
-- "I hear the frustration in your voice"
-- "This is challenging work—it makes sense you'd feel frustrated"
-- "What would help right now?"
-- "We can slow down if you need to"
-
-**What to avoid:**
-- Adding complexity or more topics
-- Pushing forward without acknowledging the frustration
-- Being overly cheerful or dismissive
-"""
-        
-        elif predominant_emotion == 'sad':
-            guidance += """**Current Emotional State: SAD**
-
-The user is showing sadness. The feedback may have touched on something painful or disappointing.
-
-**Adapt your approach:**
-- **SLOW WAY DOWN**: Give lots of space for silence and processing
-- **BE GENTLE**: Use softer, more compassionate language
-- **VALIDATE THE PAIN**: "This is touching on something painful, isn't it?"
-- **DON'T RUSH TO FIX**: Resist the urge to make them feel better quickly
-- **OFFER COMPASSION**: "I'm sorry this is so hard"
-- **CHECK THEIR CAPACITY**: "Do you want to keep going, or would you like to pause?"
-
-**Key phrases:**
-- "I can hear how much this is affecting you"
-- "It's okay to feel sad about this"
-- "Take your time"
-- "This matters to you, doesn't it?"
-
-**What to avoid:**
-- Trying to cheer them up or minimize the pain
-- Rushing to action or solutions
-- Being overly analytical or intellectual
-"""
-        
-        elif predominant_emotion == 'anxious':
-            guidance += """**Current Emotional State: ANXIOUS**
-
-The user is showing anxiety. They may be worried about the implications of the feedback or feeling overwhelmed.
-
-**Adapt your approach:**
-- **PROVIDE REASSURANCE**: Remind them this is a safe space
-- **SLOW DOWN AND SIMPLIFY**: Reduce complexity and focus on one thing at a time
-- **GROUND THEM**: Help them focus on the present moment, not catastrophizing about the future
-- **NORMALIZE**: "It's normal to feel anxious when processing feedback"
-- **OFFER CONTROL**: Give them choices: "Would you like to talk about X or Y first?"
-- **BE STEADY AND CALM**: Your calm presence can help regulate their anxiety
-
-**Key phrases:**
-- "Let's take this one step at a time"
-- "You're safe here—there's no judgment"
-- "What feels most manageable to focus on right now?"
-- "We don't have to solve everything today"
-
-**What to avoid:**
-- Adding more topics or complexity
-- Future-focused questions that increase worry
-- Rushing or creating time pressure
-"""
-        
-        elif predominant_emotion == 'positive':
-            guidance += """**Current Emotional State: POSITIVE/OPEN**
-
-The user is showing positive emotions and openness. They're in a good state for learning and growth.
-
-**Adapt your approach:**
-- **LEVERAGE THE OPENNESS**: This is a great time to go deeper or explore new perspectives
-- **MAINTAIN MOMENTUM**: Keep the energy going with curious questions
-- **CELEBRATE INSIGHTS**: Acknowledge their growth and openness
-- **DEEPEN THE WORK**: They're ready for more challenging questions or perspectives
-- **BUILD ON PROGRESS**: "You've made real progress in this conversation..."
-
-**Key phrases:**
-- "I love your openness to this"
-- "That's a really insightful observation"
-- "You're doing great work here"
-- "What else are you noticing?"
-
-**What to avoid:**
-- Becoming complacent—keep the depth
-- Rushing just because they're positive
-- Missing opportunities to go deeper
-"""
+        # Count emotion frequencies in recent window
+        emotion_counts = {}
+        for emotion_state in recent_emotions:
+            emotion = emotion_state.emotion
+            emotion_counts[emotion] = emotion_counts.get(emotion, 0) + 1
         
-        else:  # neutral
-            guidance += """**Current Emotional State: NEUTRAL/CALM**
-
-The user is in a neutral, calm state. This is ideal for productive conversation.
-
-**Adapt your approach:**
-- **MAINTAIN THE PACE**: Continue with your normal coaching approach
-- **STAY CURIOUS**: Ask open-ended questions
-- **GO DEEPER**: They have capacity for deeper exploration
-- **WATCH FOR SHIFTS**: Monitor for emotional changes as you explore sensitive topics
-
-This is a good state for learning and growth. Continue with your phase-specific guidance.
-"""
+        # Determine predominant recent emotion
+        predominant_emotion = self._predominant_emotion(emotion_counts, 'neutral')
         
-        return guidance
+        # Look up prebuilt guidance; anything unrecognized is treated as neutral
+        return _GUIDANCE_BY_EMOTION.get(predominant_emotion, _GUIDANCE_BY_EMOTION['neutral'])
     
-    def get_pacing_recommendation(self) -> Dict[str, Any]:
+    def get_pacing_recommendation(self) -> Mapping[str, Any]:
         """Get pacing recommendations based on current emotional state.
         
+        The returned mapping may be a shared module-level constant and is
+        read-only; copy it with ``dict(...)`` before modifying.
+        
         Returns:
-            Dictionary with pacing recommendations including speed, pause duration, and validation level
+            Mapping with pacing recommendations including speed, pause duration, and validation level
         """
         recent_emotions = self.get_recent_emotions(window_seconds=60)
         
         if not recent_emotions:
-            return {
-                'pace': 'normal',
-                'pause_duration': 'standard',
-                'validation_level': 'normal',
-                'complexity': 'normal'
-            }
+            return _PACING_DEFAULT
         
         # Get predominant recent emotion
         emotion_counts = {}
@@ -451,33 +801,18 @@ This is a good state for learning and growth. Continue with your phase-specific
             emotion = emotion_state.emotion
             emotion_counts[emotion] = emotion_counts.get(emotion, 0) + 1
         
-        predominant_emotion = max(emotion_counts, key=emotion_counts.get) if emotion_counts else 'neutral'
+        predominant_emotion = self._predominant_emotion(emotion_counts, 'neutral')
         
         # Provide pacing recommendations based on emotion
         if predominant_emotion in ['defensive', 'frustrated', 'sad', 'anxious']:
-            return {
-                'pace': 'slow',
-                'pause_duration': 'extended',  # Give more time for processing
-                'validation_level': 'high',  # Use more validation language
-                'complexity': 'low',  # Keep questions and topics simple
-                'recommendation': f'User is showing {predominant_emotion} emotions. Slow down, validate more, simplify.'
-            }
+            return dict(
+                _PACING_SLOW_BASE,
+                recommendation=f'User is showing {predominant_emotion} emotions. Slow down, validate more, simplify.'
+            )
         elif predominant_emotion == 'positive':
-            return {
-                'pace': 'normal',
-                'pause_duration': 'standard',
-                'validation_level': 'normal',
-                'complexity': 'normal',  # Can handle more complex topics
-                'recommendation': 'User is in a positive state. Maintain momentum and depth.'
-            }
+            return _PACING_POSITIVE
         else:  # neutral
-            return {
-                'pace': 'normal',
-                'pause_duration': 'standard',
-                'validation_level': 'normal',
-                'complexity': 'normal',
-                'recommendation': 'User is in a neutral state. Continue with standard pacing.'
-            }
+            return _PACING_NEUTRAL
     
     def _get_relationship_prompt(self) -> str:
         """Get relationship building phase prompt."""
@@ -517,223 +852,39 @@ Keep this phase brief (2-3 minutes) but don't skip it. Trust is essential for wh
     
     def _get_reaction_prompt(self) -> str:
         """Get reaction exploration phase prompt."""
-        feedback_summary = self._get_feedback_summary()
-        
-        return f"""You are in the REACTION EXPLORATION phase of the R2C2 framework.
-
-## Phase Goal
-Help the employee explore and process their emotional reactions to the feedback. Defensiveness is the biggest barrier to learning from feedback—this phase reduces it by creating space for emotions.
-
-## Feedback They Received
-{feedback_summary}
-
-## What to Do
-
-**Explore Initial Reactions (First 1-2 minutes):**
-- Ask open-ended questions: "What was your first reaction when you read the feedback?" "What surprised you?"
-- Listen for emotional words: defensive, frustrated, hurt, confused, angry, unfair
-- Reflect back what you hear: "It sounds like the comments about [X] really caught you off guard..."
-- Normalize defensiveness: "It's completely natural to feel defensive. Our brains are wired to protect us from criticism."
-
-**Go Deeper (Next 2-3 minutes):**
-- Explore specific triggers: "Which pieces of feedback felt hardest to hear?" "What about that feedback triggered such a strong reaction?"
-- Look for patterns: "I'm noticing you've mentioned feeling misunderstood a few times. Tell me more about that."
-- Validate without reinforcing: "That makes sense you'd feel that way" (not "You're right, that feedback was unfair")
-- Use curious, non-judgmental language: "What comes up for you when you think about that?" "Help me understand what that brings up..."
-
-**Processing Emotions:**
-- Give space for silence—don't rush to fill it
-- Acknowledge the difficulty: "This isn't easy to talk about. I appreciate you being open."
-- Distinguish between the emotion and the feedback: "It sounds like you're feeling hurt. That's separate from whether the feedback has truth to it. Let's honor the feeling first."
-- Watch for shifts: When defensiveness softens (voice calms, they start asking questions, they acknowledge some truth), that's progress
-
-## What NOT to Do
-- Don't problem-solve yet ("Well, here's what you could do...")
-- Don't challenge their feelings ("But don't you think...")
-- Don't rush to the content ("Let's look at what they actually said...")
-- Don't agree that the feedback is wrong or unfair
-- Don't let them spiral into blame or victimhood
-
-## Key Phrases to Use
-- "It sounds like..."
-- "I'm hearing that..."
-- "That makes sense because..."
-- "What comes up for you when..."
-- "Tell me more about that feeling..."
-- "It's okay to feel [emotion]. Let's sit with that for a moment."
-
-## Transition Signal
-When you notice:
-- Their voice becomes calmer
-- They start asking questions or showing curiosity
-- They acknowledge some truth in the feedback
-- They say things like "I guess..." or "Maybe..."
-
-Then you can suggest: "I'm noticing you seem a bit more settled. Would it be okay if we start looking at the actual content of the feedback more objectively?"
-
-This phase is critical. Don't rush it. Emotional processing takes time.
-"""
+        return "".join((
+            _REACTION_PROMPT_PREFIX,
+            self._get_feedback_summary(),
+            _REACTION_PROMPT_SUFFIX,
+        ))
     
     def _get_content_prompt(self) -> str:
         """Get content discussion phase prompt."""
-        feedback_summary = self._get_feedback_summary()
-        reactions_summary = self._get_reactions_summary()
-        
-        return f"""You are in the CONTENT DISCUSSION phase of the R2C2 framework.
-
-## Phase Goal
-Help the employee understand the feedback content clearly and objectively. Now that emotions have been processed, they can look at the feedback as data rather than attack.
-
-## Feedback Themes
-{feedback_summary}
-
-## Their Reactions So Far
-{reactions_summary}
-
-## What to Do
-
-**Review Themes Systematically (First 2-3 minutes):**
-- Start with patterns: "Looking at all the feedback together, what patterns do you notice?"
-- Highlight recurring themes: "I see [theme] mentioned by multiple people. What do you make of that?"
-- Separate behavior from identity: "The feedback is about what you do, not who you are. Let's look at the behaviors people are describing."
-- Ask for their interpretation: "When people say [feedback], what do you think they're experiencing?"
-
-**Deepen Understanding (Next 2-3 minutes):**
-- Explore different perspectives: "How might your manager see this differently than your peers?" "What might they be noticing that you're not aware of?"
-- Look for blind spots: "Is there feedback here that surprises you? That might be a blind spot worth exploring."
-- Connect to impact: "When you [behavior], what impact might that have on others?" "How might that land for someone on the receiving end?"
-- Distinguish intent from impact: "I hear that you didn't intend [X], but the feedback suggests that's how it landed. What do you think about that gap?"
-
-**Prioritize (Final 1-2 minutes):**
-- Identify what matters most: "Of all these themes, which ones feel most important to address?" "Which would have the biggest impact if you changed them?"
-- Look for quick wins vs. deeper work: "Are there some behaviors that would be relatively easy to shift? Which ones might require more sustained effort?"
-- Connect to their goals: "Which of these themes, if you addressed them, would most help you achieve your career goals?"
-
-## What NOT to Do
-- Don't let them dismiss feedback as "wrong" or "unfair" without exploring it
-- Don't agree with dismissals ("Yeah, they probably just don't understand you")
-- Don't overwhelm them with too much at once—focus on 2-3 key themes
-- Don't let them make it about character ("I'm just a bad communicator") vs. behavior ("I need to work on checking for understanding")
-
-## Key Phrases to Use
-- "What patterns do you notice?"
-- "How might others be experiencing that behavior?"
-- "What do you think they're seeing that led to this feedback?"
-- "Let's separate the behavior from who you are as a person..."
-- "If you were in their shoes, how might you see this?"
-- "What's the gap between your intent and the impact?"
-
-## Coaching Techniques
-- **Perspective-taking**: Help them see through others' eyes
-- **Pattern recognition**: Connect dots across multiple feedback sources
-- **Behavior focus**: Keep it about actions, not character
-- **Curiosity over judgment**: "I wonder..." "What if..."
-- **Reality testing**: "Does that feedback match anything you've noticed yourself?"
-
-## Transition Signal
-When they:
-- Demonstrate clear understanding of key themes
-- Can articulate the feedback without defensiveness
-- Show curiosity about changing behaviors
-- Ask "So what should I do about this?"
-
-Then you can suggest: "It sounds like you have a clearer picture of the feedback now. Should we start thinking about what you want to do with these insights?"
-
-This phase is about clarity and understanding, not yet about action. Make sure they truly understand before moving to coaching.
-"""
+        return "".join((
+            _CONTENT_PROMPT_PREFIX,
+            self._get_feedback_summary(),
+            _CONTENT_PROMPT_MIDDLE,
+            self._get_reactions_summary(),
+            _CONTENT_PROMPT_SUFFIX,
+        ))
     
     def _get_coaching_prompt(self) -> str:
         """Get coaching for change phase prompt."""
-        feedback_summary = self._get_feedback_summary()
-        content_themes = self._get_content_themes_summary()
-        
-        return f"""You are in the COACHING FOR CHANGE phase of the R2C2 framework.
-
-## Phase Goal
-Help the employee create a concrete, actionable development plan. This is where insights become action. Focus on 1-3 specific, achievable commitments.
-
-## Feedback Themes
-{feedback_summary}
-
-## Key Insights from Our Discussion
-{content_themes}
-
-## What to Do
-
-**Prioritize Development Areas (First 1-2 minutes):**
-- Narrow the focus: "We've talked about several themes. Which 1-3 areas do you want to focus on first?"
-- Check motivation: "Why is this area important to you?" "What would change if you improved here?"
-- Ensure ownership: They should choose, not you. "What feels most urgent or impactful to you?"
-- Keep it manageable: "Let's not try to change everything at once. What's realistic?"
-
-**Create SMART Goals (Next 2-3 minutes):**
-For each priority area, help them create a SMART goal:
-- **Specific**: "What exactly will you do differently?" Not "communicate better" but "send a summary email after each meeting"
-- **Measurable**: "How will you know you're making progress?" "What would success look like?"
-- **Achievable**: "Is this realistic given your current workload and constraints?"
-- **Relevant**: "How does this connect to your career goals?" "Why does this matter?"
-- **Time-bound**: "When will you start?" "When will you check in on progress?"
-
-**Use START, STOP, CONTINUE Framework:**
-- **START**: "What's one new behavior you'll begin doing?"
-- **STOP**: "What's one behavior you'll stop or do less of?"
-- **CONTINUE**: "What's working that you want to keep doing?"
-
-**Plan for Obstacles (Next 1-2 minutes):**
-- Anticipate challenges: "What might get in the way of this change?"
-- Problem-solve: "How will you handle it when [obstacle] comes up?"
-- Build in support: "Who can help you with this?" "Who will you tell about this commitment?"
-- Create accountability: "How will you track your progress?" "When will you check in with yourself?"
-
-**Summarize and Celebrate (Final 1 minute):**
-- Recap clearly: "Let me make sure I have this right. You're committing to..."
-- Make it concrete: "So starting [when], you'll [specific action]..."
-- Acknowledge courage: "This takes real courage. I'm impressed by your commitment to growth."
-- Set up follow-up: "When will you review how this is going?" "Who will you share this plan with?"
-
-## What NOT to Do
-- Don't let them commit to too much (overwhelming leads to failure)
-- Don't accept vague goals ("I'll be better at communication")
-- Don't skip the obstacle planning (unrealistic optimism leads to disappointment)
-- Don't make it your plan—it has to be theirs
-- Don't forget to celebrate their commitment
-
-## Key Phrases to Use
-- "What specifically will you do differently?"
-- "How will you know you're making progress?"
-- "What might get in the way?"
-- "Who can support you in this?"
-- "Let's make this concrete..."
-- "What's one small step you can take this week?"
-
-## SMART Goal Examples
-**Vague**: "I'll communicate better"
-**SMART**: "I'll send a brief summary email within 24 hours of every stakeholder meeting, highlighting decisions made and next steps"
-
-**Vague**: "I'll delegate more"
-**SMART**: "I'll identify one task per week that I can delegate to a team member, and I'll schedule a 15-minute coaching conversation when I hand it off"
-
-**Vague**: "I'll be less defensive"
-**SMART**: "When I receive critical feedback, I'll pause for 3 seconds before responding, and I'll ask one clarifying question before defending my position"
-
-## Development Plan Structure
-For each goal, capture:
-1. **Goal Type**: START / STOP / CONTINUE
-2. **Specific Behavior**: Exactly what they'll do
-3. **Success Metric**: How they'll measure progress
-4. **Timeline**: When they'll start and when they'll review
-5. **Support**: Who will help them
-6. **Obstacles**: What might get in the way and how they'll handle it
-
-## Transition to Closing
-When you have 1-3 concrete commitments:
-- Summarize the full plan
-- Acknowledge their growth through this conversation
-- Remind them this is a journey, not a destination
-- Encourage them to be kind to themselves as they practice new behaviors
-
-This is the payoff phase. Make sure they leave with a clear, actionable plan they're genuinely committed to.
-"""
+        return "".join((
+            _COACHING_PROMPT_PREFIX,
+            self._get_feedback_summary(),
+            _COACHING_PROMPT_MIDDLE,
+            self._get_content_themes_summary(),
+            _COACHING_PROMPT_SUFFIX,
+        ))
+    
+    # Phase prompt builders indexed by R2C2Phase.index
+    _PHASE_PROMPT_BUILDERS = (
+        _get_relationship_prompt,
+        _get_reaction_prompt,
+        _get_content_prompt,
+        _get_coaching_prompt,
+    )
     
     def get_phase_guidance(self) -> Dict[str, Any]:
         """Get structured guidance for the current phase.
@@ -867,7 +1018,7 @@ This is the payoff phase. Make sure they leave with a clear, actionable plan the
         """
         # Add emotion to history if provided
         if emotion:
-            self.state.emotional_states.append(emotion)
+            self.record_emotion(emotion)
         
         # Track responses based on current phase
         phase = self.state.current_phase
@@ -984,7 +1135,10 @@ This is the payoff phase. Make sure they leave with a clear, actionable plan the
         Returns:
             Dictionary with emotional journey analysis
         """
-        if not self.state.emotional_states:
+        emotions = self.state.emotional_states
+        last_pruned = self.state.last_pruned_emotion
+        
+        if not emotions and last_pruned is None:
             return {
                 'start_emotion': 'unknown',
                 'end_emotion': 'unknown',
@@ -992,26 +1146,26 @@ This is the payoff phase. Make sure they leave with a clear, actionable plan the
                 'emotion_changes': 0
             }
         
-        emotions = self.state.emotional_states
-        
-        # Count emotion frequencies
-        emotion_counts = {}
+        # Count emotion frequencies, starting from the pruned totals
+        emotion_counts = dict(self.state.pruned_emotion_counts)
         for emotion_state in emotions:
             emotion = emotion_state.emotion
             emotion_counts[emotion] = emotion_counts.get(emotion, 0) + 1
         
         # Find predominant emotion
-        predominant_emotion = max(emotion_counts, key=emotion_counts.get) if emotion_counts else 'unknown'
+        predominant_emotion = self._predominant_emotion(emotion_counts, 'unknown')
         
-        # Count emotion changes
-        emotion_changes = 0
+        # Count emotion changes, including the step across the prune boundary
+        emotion_changes = self.state.pruned_emotion_changes
+        if last_pruned is not None and emotions and emotions[0].emotion != last_pruned:
+            emotion_changes += 1
         for i in range(1, len(emotions)):
             if emotions[i].emotion != emotions[i-1].emotion:
                 emotion_changes += 1
         
         return {
-            'start_emotion': emotions[0].emotion if emotions else 'unknown',
-            'end_emotion': emotions[-1].emotion if emotions else 'unknown',
+            'start_emotion': self.state.first_emotion or emotions[0].emotion,
+            'end_emotion': emotions[-1].emotion if emotions else last_pruned,
             'predominant_emotion': predominant_emotion,
             'emotion_changes': emotion_changes,
             'emotion_distribution': emotion_counts
@@ -1045,9 +1199,11 @@ This is the payoff phase. Make sure they leave with a clear, actionable plan the
         insights = []
         
         # Insight about emotional journey
-        if self.state.emotional_states:
-            emotions = self.state.emotional_states
-            if emotions[0].emotion in self.DEFENSIVE_EMOTIONS and emotions[-1].emotion in self.READY_EMOTIONS:
+        emotions = self.state.emotional_states
+        if emotions or self.state.last_pruned_emotion is not None:
+            start_emotion = self.state.first_emotion or emotions[0].emotion
+            end_emotion = emotions[-1].emotion if emotions else self.state.last_pruned_emotion
+            if start_emotion in self.DEFENSIVE_EMOTIONS and end_emotion in self.READY_EMOTIONS:
                 insights.append("Successfully processed initial defensiveness and reached a receptive state")
         
         # Insight about content themes
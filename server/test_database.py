@@ -128,9 +128,11 @@ def test_database_operations():
         
     finally:
         # Clean up temporary database
-        if os.path.exists(db_path):
+        try:
             os.unlink(db_path)
             print(f"\n🧹 Cleaned up temporary database")
+        except FileNotFoundError:
+            pass
 
 
 if __name__ == '__main__':
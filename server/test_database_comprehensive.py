@@ -5,29 +5,72 @@ emotion event recording, goal completion, and data integrity.
 """
 
 import os
+import sqlite3
+import sys
 import tempfile
+import threading
+import traceback
+from collections import Counter
+from contextlib import contextmanager
 from datetime import datetime, timedelta
-from database import SessionDatabase, initialize_database
+import numpy as np
 
+from database import SessionDatabase, session_db
+from testing_support import RULE, flush_log, flushes_log, log, print_banner
 
-def test_session_lifecycle():
-    """Test complete session lifecycle from creation to completion."""
-    print("\n" + "="*70)
-    print("TEST: Session Lifecycle")
-    print("="*70)
+
+class _Rollback(Exception):
+    """Raised to discard everything written inside _isolated()."""
+
+
+@contextmanager
+def _isolated(db):
+    """Run the block in a transaction on db that is always rolled back."""
+    try:
+        with db.transaction():
+            yield db
+            raise _Rollback
+    except _Rollback:
+        pass
+
+
+@contextmanager
+def _database(db=None):
+    """Yield a database for one test.
     
-    with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as tmp:
-        db_path = tmp.name
+    A shared database is wrapped in a rolled-back transaction so the test
+    leaves it empty; otherwise a fresh in-memory database is created.
+    """
+    if db is not None:
+        with _isolated(db):
+            yield db
+        return
     
+    db = SessionDatabase(':memory:')
     try:
-        # Initialize database
-        print("\n1. Initializing database...")
-        initialize_database(db_path)
-        db = SessionDatabase(db_path)
-        print("   ✓ Database initialized")
+        yield db
+    finally:
+        db.close()
+
+
+# Large payload for test_data_integrity, built once at import
+LARGE_FEEDBACK = {
+    'themes': [{'theme': f'theme-{i}', 'frequency': i} for i in range(50)],
+    'comments': [f'Comment {i}' * 100 for i in range(100)]
+}
+
+
+@flushes_log
+def test_session_lifecycle(db=None):
+    """Test complete session lifecycle from creation to completion."""
+    print_banner("TEST: Session Lifecycle")
+    
+    with _database(db) as db:
+        log("\n1. Initializing database...")
+        log("   ✓ Database initialized")
         
         # Create session
-        print("\n2. Creating session...")
+        log("\n2. Creating session...")
         feedback_data = {
             'feedback_id': 'fb-001',
             'themes': [
@@ -38,17 +81,17 @@ def test_session_lifecycle():
         }
         session_id = db.create_session('user-123', feedback_data)
         assert session_id > 0
-        print(f"   ✓ Created session ID: {session_id}")
+        log(f"   ✓ Created session ID: {session_id}")
         
         # Verify session exists
         session = db.get_session_by_id(session_id)
         assert session is not None
         assert session['user_id'] == 'user-123'
         assert session['end_time'] is None  # Session not ended yet
-        print("   ✓ Session retrieved and verified")
+        log("   ✓ Session retrieved and verified")
         
         # End session
-        print("\n3. Ending session...")
+        log("\n3. Ending session...")
         summary = {
             'duration': 1800,
             'phases_completed': ['relationship', 'reaction', 'content', 'coaching'],
@@ -60,42 +103,30 @@ def test_session_lifecycle():
         session = db.get_session_by_id(session_id)
         assert session['end_time'] is not None
         assert session['session_summary'] is not None
-        print("   ✓ Session ended successfully")
-        
-        print("\n" + "="*70)
-        print("✓ Session lifecycle test passed!")
-        print("="*70)
+        log("   ✓ Session ended successfully")
         
-    finally:
-        if os.path.exists(db_path):
-            os.unlink(db_path)
+        print_banner("✓ Session lifecycle test passed!")
 
 
-def test_development_plan_operations():
+@flushes_log
+def test_development_plan_operations(db=None):
     """Test development plan creation, retrieval, and goal completion."""
-    print("\n" + "="*70)
-    print("TEST: Development Plan Operations")
-    print("="*70)
-    
-    with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as tmp:
-        db_path = tmp.name
+    print_banner("TEST: Development Plan Operations")
     
-    try:
-        initialize_database(db_path)
-        db = SessionDatabase(db_path)
-        
+    with _database(db) as db:
         # Create session
         session_id = db.create_session('user-456', {'themes': []})
         
         # Save development plan with multiple goals
-        print("\n1. Saving development plan...")
+        log("\n1. Saving development plan...")
+        today = datetime.now().date()
         goals = [
             {
                 'goal_text': 'Improve delegation skills',
                 'goal_type': 'start',
                 'specific_behavior': 'Delegate at least one task per week',
                 'measurable_criteria': 'Track delegated tasks in weekly log',
-                'target_date': (datetime.now() + timedelta(days=90)).strftime('%Y-%m-%d'),
+                'target_date': (today + timedelta(days=90)).isoformat(),
                 'action_steps': ['Identify tasks to delegate', 'Schedule delegation meetings']
             },
             {
@@ -103,7 +134,7 @@ def test_development_plan_operations():
                 'goal_type': 'stop',
                 'specific_behavior': 'Allow team members to complete tasks without constant check-ins',
                 'measurable_criteria': 'Reduce check-ins to once per day',
-                'target_date': (datetime.now() + timedelta(days=60)).strftime('%Y-%m-%d'),
+                'target_date': (today + timedelta(days=60)).isoformat(),
                 'action_steps': ['Set clear expectations upfront', 'Trust team members']
             },
             {
@@ -111,16 +142,16 @@ def test_development_plan_operations():
                 'goal_type': 'continue',
                 'specific_behavior': 'Maintain weekly technical reviews',
                 'measurable_criteria': 'Weekly review sessions held',
-                'target_date': (datetime.now() + timedelta(days=180)).strftime('%Y-%m-%d'),
+                'target_date': (today + timedelta(days=180)).isoformat(),
                 'action_steps': ['Keep current schedule', 'Gather feedback']
             }
         ]
         
         db.save_development_plan(session_id, goals)
-        print(f"   ✓ Saved {len(goals)} goals")
+        log(f"   ✓ Saved {len(goals)} goals")
         
         # Retrieve and verify
-        print("\n2. Retrieving development plan...")
+        log("\n2. Retrieving development plan...")
         summary = db.get_session_summary(session_id)
         assert len(summary['development_plan']) == 3
         
@@ -128,52 +159,44 @@ def test_development_plan_operations():
             assert goal['goal_text'] == goals[i]['goal_text']
             assert goal['goal_type'] == goals[i]['goal_type']
             assert goal['is_completed'] == False
-            print(f"   ✓ Goal {i+1}: {goal['goal_type']} - {goal['goal_text'][:40]}...")
+            log(f"   ✓ Goal {i+1}: {goal['goal_type']} - {goal['goal_text'][:40]}...")
         
         # Mark goals as complete
-        print("\n3. Marking goals as complete...")
+        log("\n3. Marking goals as complete...")
         goal_ids = [g['goal_id'] for g in summary['development_plan']]
         
         # Complete first two goals
-        for i in range(2):
-            success = db.mark_goal_complete(goal_ids[i])
-            assert success
-            print(f"   ✓ Marked goal {goal_ids[i]} as complete")
+        assert db.mark_goals_complete(goal_ids[:2]) == 2
+        log(f"   ✓ Marked goals {goal_ids[0]} and {goal_ids[1]} as complete")
         
         # Verify completion status
-        print("\n4. Verifying completion status...")
-        updated_summary = db.get_session_summary(session_id)
-        completed_count = sum(1 for g in updated_summary['development_plan'] if g['is_completed'])
+        log("\n4. Verifying completion status...")
+        completed_count, total_count = db.get_goal_completion_counts(session_id)
         assert completed_count == 2
-        print(f"   ✓ {completed_count} goals marked as complete")
-        print(f"   ✓ {len(updated_summary['development_plan']) - completed_count} goals still pending")
-        
-        print("\n" + "="*70)
-        print("✓ Development plan operations test passed!")
-        print("="*70)
-        
-    finally:
-        if os.path.exists(db_path):
-            os.unlink(db_path)
+        assert total_count == 3
+        log(f"   ✓ {completed_count} goals marked as complete")
+        log(f"   ✓ {total_count - completed_count} goals still pending")
+        
+        # Complete the rest from a list longer than SQLite's parameter limit
+        log("\n5. Completing goals from a long ID list...")
+        unknown_ids = list(range(-1500, 0))
+        assert db.mark_goals_complete(unknown_ids + goal_ids + goal_ids) == 3
+        assert db.get_goal_completion_counts(session_id) == (3, 3)
+        log("   ✓ Long ID list completed the remaining goal")
+        
+        print_banner("✓ Development plan operations test passed!")
 
 
-def test_emotion_event_tracking():
+@flushes_log
+def test_emotion_event_tracking(db=None):
     """Test emotion event recording and retrieval."""
-    print("\n" + "="*70)
-    print("TEST: Emotion Event Tracking")
-    print("="*70)
+    print_banner("TEST: Emotion Event Tracking")
     
-    with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as tmp:
-        db_path = tmp.name
-    
-    try:
-        initialize_database(db_path)
-        db = SessionDatabase(db_path)
-        
+    with _database(db) as db:
         session_id = db.create_session('user-789', {'themes': []})
         
         # Record emotion events throughout session
-        print("\n1. Recording emotion events...")
+        log("\n1. Recording emotion events...")
         emotions = [
             ('neutral', 0.85, 'relationship', {'pitch': 150.0, 'energy': 0.5}),
             ('defensive', 0.72, 'reaction', {'pitch': 180.0, 'energy': 0.8}),
@@ -183,88 +206,75 @@ def test_emotion_event_tracking():
             ('positive', 0.82, 'coaching', {'pitch': 165.0, 'energy': 0.7})
         ]
         
-        for emotion_type, confidence, phase, features in emotions:
-            db.record_emotion_event(
-                session_id=session_id,
-                emotion_type=emotion_type,
-                confidence=confidence,
-                r2c2_phase=phase,
-                audio_features=features
-            )
+        db.record_emotion_events_batch(session_id, [
+            {
+                'emotion_type': emotion_type,
+                'confidence': confidence,
+                'r2c2_phase': phase,
+                'audio_features': features
+            }
+            for emotion_type, confidence, phase, features in emotions
+        ])
         
-        print(f"   ✓ Recorded {len(emotions)} emotion events")
+        log(f"   ✓ Recorded {len(emotions)} emotion events")
         
         # Retrieve and analyze
-        print("\n2. Analyzing emotion events...")
+        log("\n2. Analyzing emotion events...")
         summary = db.get_session_summary(session_id)
         emotion_events = summary['emotion_events']
         
         assert len(emotion_events) == len(emotions)
         
         # Count emotions by type
-        emotion_counts = {}
-        for event in emotion_events:
-            emotion = event['emotion_type']
-            emotion_counts[emotion] = emotion_counts.get(emotion, 0) + 1
+        emotion_counts = Counter(event['emotion_type'] for event in emotion_events)
+        assert emotion_counts == Counter(emotion[0] for emotion in emotions)
         
-        print("   Emotion distribution:")
+        log("   Emotion distribution:")
         for emotion, count in emotion_counts.items():
-            print(f"     - {emotion}: {count} occurrences")
+            log(f"     - {emotion}: {count} occurrences")
         
         # Verify emotional journey
         first_emotion = emotion_events[0]['emotion_type']
         last_emotion = emotion_events[-1]['emotion_type']
-        print(f"\n   ✓ Emotional journey: {first_emotion} → {last_emotion}")
+        log(f"\n   ✓ Emotional journey: {first_emotion} → {last_emotion}")
         
         # Verify audio features are stored
         assert 'audio_features' in emotion_events[0]
-        print("   ✓ Audio features stored with events")
+        log("   ✓ Audio features stored with events")
         
-        print("\n" + "="*70)
-        print("✓ Emotion event tracking test passed!")
-        print("="*70)
-        
-    finally:
-        if os.path.exists(db_path):
-            os.unlink(db_path)
+        print_banner("✓ Emotion event tracking test passed!")
 
 
-def test_phase_transition_tracking():
+@flushes_log
+def test_phase_transition_tracking(db=None):
     """Test phase transition recording and analysis."""
-    print("\n" + "="*70)
-    print("TEST: Phase Transition Tracking")
-    print("="*70)
-    
-    with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as tmp:
-        db_path = tmp.name
+    print_banner("TEST: Phase Transition Tracking")
     
-    try:
-        initialize_database(db_path)
-        db = SessionDatabase(db_path)
-        
+    with _database(db) as db:
         session_id = db.create_session('user-101', {'themes': []})
         
         # Record phase transitions
-        print("\n1. Recording phase transitions...")
+        log("\n1. Recording phase transitions...")
         transitions = [
             ('relationship', 'reaction', 'Time threshold reached', 145.5),
             ('reaction', 'content', 'Emotional readiness detected', 210.3),
             ('content', 'coaching', 'Key themes discussed', 280.7)
         ]
         
-        for from_phase, to_phase, reason, duration in transitions:
-            db.record_phase_transition(
-                session_id=session_id,
-                from_phase=from_phase,
-                to_phase=to_phase,
-                trigger_reason=reason,
-                time_in_previous_phase=duration
-            )
+        db.record_phase_transitions_batch(session_id, [
+            {
+                'from_phase': from_phase,
+                'to_phase': to_phase,
+                'trigger_reason': reason,
+                'time_in_previous_phase': duration
+            }
+            for from_phase, to_phase, reason, duration in transitions
+        ])
         
-        print(f"   ✓ Recorded {len(transitions)} phase transitions")
+        log(f"   ✓ Recorded {len(transitions)} phase transitions")
         
         # Retrieve and analyze
-        print("\n2. Analyzing phase transitions...")
+        log("\n2. Analyzing phase transitions...")
         summary = db.get_session_summary(session_id)
         phase_transitions = summary['phase_transitions']
         
@@ -279,109 +289,100 @@ def test_phase_transition_tracking():
             
             total_time += duration
             
-            print(f"   Transition {i+1}:")
-            print(f"     {from_phase} → {to_phase}")
-            print(f"     Duration: {duration:.1f}s")
-            print(f"     Reason: {reason}")
-        
-        print(f"\n   ✓ Total session time: {total_time:.1f}s ({total_time/60:.1f} minutes)")
+            log(f"   Transition {i+1}:")
+            log(f"     {from_phase} → {to_phase}")
+            log(f"     Duration: {duration:.1f}s")
+            log(f"     Reason: {reason}")
         
-        print("\n" + "="*70)
-        print("✓ Phase transition tracking test passed!")
-        print("="*70)
+        log(f"\n   ✓ Total session time: {total_time:.1f}s ({total_time/60:.1f} minutes)")
         
-    finally:
-        if os.path.exists(db_path):
-            os.unlink(db_path)
+        print_banner("✓ Phase transition tracking test passed!")
 
 
-def test_multi_user_sessions():
+@flushes_log
+def test_multi_user_sessions(db=None):
     """Test multiple users with multiple sessions."""
-    print("\n" + "="*70)
-    print("TEST: Multi-User Sessions")
-    print("="*70)
-    
-    with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as tmp:
-        db_path = tmp.name
+    print_banner("TEST: Multi-User Sessions")
     
-    try:
-        initialize_database(db_path)
-        db = SessionDatabase(db_path)
-        
+    with _database(db) as db:
         # Create sessions for multiple users
-        print("\n1. Creating sessions for multiple users...")
+        log("\n1. Creating sessions for multiple users...")
         users = ['alice', 'bob', 'charlie']
         user_sessions = {}
         
+        # Create 2-3 sessions per user
+        session_rows = [
+            (user, {'themes': [f'theme-{i}']})
+            for user in users
+            for i in range(2 if user == 'alice' else 3)
+        ]
+        session_ids = db.create_sessions_bulk(session_rows)
+        
+        for (user, _), session_id in zip(session_rows, session_ids):
+            user_sessions.setdefault(user, []).append(session_id)
+        
         for user in users:
-            user_sessions[user] = []
-            # Create 2-3 sessions per user
-            num_sessions = 2 if user == 'alice' else 3
-            
-            for i in range(num_sessions):
-                session_id = db.create_session(
-                    user_id=user,
-                    feedback_data={'themes': [f'theme-{i}']}
-                )
-                user_sessions[user].append(session_id)
-            
-            print(f"   ✓ Created {num_sessions} sessions for {user}")
+            log(f"   ✓ Created {len(user_sessions[user])} sessions for {user}")
         
         # Retrieve sessions by user
-        print("\n2. Retrieving sessions by user...")
+        log("\n2. Retrieving sessions by user...")
+        session_counts = db.get_session_counts_by_user(users)
         for user in users:
-            sessions = db.get_user_sessions(user)
-            expected_count = len(user_sessions[user])
-            assert len(sessions) == expected_count
-            print(f"   ✓ {user}: {len(sessions)} sessions retrieved")
+            count, session_ids = session_counts[user]
+            assert count == len(user_sessions[user])
+            assert session_ids == set(user_sessions[user])
+            log(f"   ✓ {user}: {count} sessions retrieved")
         
-        # Verify session isolation
-        print("\n3. Verifying session isolation...")
-        alice_sessions = db.get_user_sessions('alice')
-        bob_sessions = db.get_user_sessions('bob')
+        # More users than SQLite allows bound parameters in one statement
+        many_users = [f'user-{i}' for i in range(1500)] + users
+        assert db.get_session_counts_by_user(many_users) == session_counts
+        log(f"   ✓ Lookup of {len(many_users)} users matches")
         
-        alice_ids = {s['session_id'] for s in alice_sessions}
-        bob_ids = {s['session_id'] for s in bob_sessions}
+        # Verify session isolation
+        log("\n3. Verifying session isolation...")
+        alice_ids = session_counts['alice'][1]
+        bob_ids = session_counts['bob'][1]
         
         assert len(alice_ids.intersection(bob_ids)) == 0
-        print("   ✓ User sessions are properly isolated")
-        
-        print("\n" + "="*70)
-        print("✓ Multi-user sessions test passed!")
-        print("="*70)
-        
-    finally:
-        if os.path.exists(db_path):
-            os.unlink(db_path)
+        log("   ✓ User sessions are properly isolated")
+        
+        # Bulk creation on SQLite without RETURNING
+        log("\n4. Testing bulk session creation without RETURNING...")
+        has_returning = session_db._SQLITE_HAS_RETURNING
+        session_db._SQLITE_HAS_RETURNING = False
+        try:
+            fallback_ids = db.create_sessions_bulk([('dave', {'themes': []})] * 3)
+        finally:
+            session_db._SQLITE_HAS_RETURNING = has_returning
+        
+        assert len(set(fallback_ids)) == 3
+        for session_id in fallback_ids:
+            assert db.get_session_by_id(session_id)['user_id'] == 'dave'
+        log("   ✓ Row-by-row fallback returns each new session ID")
+        
+        print_banner("✓ Multi-user sessions test passed!")
 
 
-def test_data_integrity():
+@flushes_log
+def test_data_integrity(db=None):
     """Test data integrity constraints and error handling."""
-    print("\n" + "="*70)
-    print("TEST: Data Integrity")
-    print("="*70)
+    print_banner("TEST: Data Integrity")
     
-    with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as tmp:
-        db_path = tmp.name
-    
-    try:
-        initialize_database(db_path)
-        db = SessionDatabase(db_path)
-        
+    with _database(db) as db:
         # Test 1: Cannot retrieve non-existent session
-        print("\n1. Testing non-existent session retrieval...")
+        log("\n1. Testing non-existent session retrieval...")
         session = db.get_session_by_id(99999)
         assert session is None
-        print("   ✓ Non-existent session returns None")
+        log("   ✓ Non-existent session returns None")
         
         # Test 2: Cannot complete non-existent goal
-        print("\n2. Testing non-existent goal completion...")
+        log("\n2. Testing non-existent goal completion...")
         success = db.mark_goal_complete(99999)
         assert not success
-        print("   ✓ Non-existent goal completion returns False")
+        log("   ✓ Non-existent goal completion returns False")
         
         # Test 3: Session summary with no data
-        print("\n3. Testing session summary with minimal data...")
+        log("\n3. Testing session summary with minimal data...")
         session_id = db.create_session('user-test', {'themes': []})
         summary = db.get_session_summary(session_id)
         
@@ -390,77 +391,146 @@ def test_data_integrity():
         assert len(summary['development_plan']) == 0
         assert len(summary['emotion_events']) == 0
         assert len(summary['phase_transitions']) == 0
-        print("   ✓ Empty session summary handled correctly")
+        log("   ✓ Empty session summary handled correctly")
         
         # Test 4: Large feedback data
-        print("\n4. Testing large feedback data...")
-        large_feedback = {
-            'themes': [{'theme': f'theme-{i}', 'frequency': i} for i in range(50)],
-            'comments': [f'Comment {i}' * 100 for i in range(100)]
-        }
-        session_id = db.create_session('user-large', large_feedback)
+        log("\n4. Testing large feedback data...")
+        session_id = db.create_session('user-large', LARGE_FEEDBACK)
         retrieved = db.get_session_by_id(session_id)
         assert retrieved is not None
-        print("   ✓ Large feedback data stored and retrieved")
+        assert retrieved['feedback_data'] == LARGE_FEEDBACK
+        log("   ✓ Large feedback data stored and retrieved")
+        
+        # Test 5: Session state round-trips the same with either JSON encoder
+        log("\n5. Testing session state round-trips with each JSON encoder...")
+        ended_at = datetime(2024, 1, 1, 12, 30)
+        state_data = {
+            'current_phase': 'reaction',
+            'phase_history': [
+                {'phase': 'relationship', 'duration': 95.5, 'ended_at': ended_at}
+            ],
+            'audio_features': {
+                'pitch': np.float32(0.5),
+                'frames': np.int64(3),
+                'spectrum': np.arange(3, dtype=np.float32),
+                'silence': float('nan')
+            },
+            'note': 'café ✓',
+            7: 'numeric key'
+        }
+        expected = {
+            'current_phase': 'reaction',
+            'phase_history': [
+                {'phase': 'relationship', 'duration': 95.5, 'ended_at': ended_at.isoformat()}
+            ],
+            'audio_features': {
+                'pitch': 0.5, 'frames': 3, 'spectrum': [0.0, 1.0, 2.0], 'silence': None
+            },
+            'note': 'café ✓',
+            '7': 'numeric key'
+        }
         
-        print("\n" + "="*70)
-        print("✓ Data integrity test passed!")
-        print("="*70)
+        fast_json = session_db.orjson
+        for encoder, orjson_module in (('fast', fast_json), ('stdlib', None)):
+            session_db.orjson = orjson_module
+            try:
+                db.update_session_state(session_id, state_data)
+                stored = db.get_session_by_id(session_id)['session_summary']
+            finally:
+                session_db.orjson = fast_json
+            assert stored == expected, f"{encoder} encoder stored {stored}"
+            log(f"   ✓ {encoder.capitalize()} JSON encoder round-trips session state")
+        
+        # Test 6: A closed in-memory database refuses further calls
+        log("\n6. Testing calls on a closed in-memory database...")
+        closed_db = SessionDatabase(':memory:')
+        closed_db.close()
+        try:
+            closed_db.create_session('user-closed', {'themes': []})
+        except sqlite3.ProgrammingError:
+            pass
+        else:
+            raise AssertionError("Closed in-memory database should raise ProgrammingError")
+        log("   ✓ Closed database raises instead of reconnecting")
+        
+        # Test 7: Another thread's calls stay out of an open transaction
+        log("\n7. Testing calls from another thread during a transaction...")
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_db = SessionDatabase(os.path.join(tmp_dir, 'threads.db'))
+            thread_ids = []
+            with _isolated(file_db):
+                worker = threading.Thread(
+                    target=lambda: thread_ids.append(
+                        file_db.create_session('user-thread', {'themes': []})
+                    )
+                )
+                worker.start()
+                worker.join()
+            
+            assert len(thread_ids) == 1, "Worker thread call should succeed"
+            assert file_db.get_session_by_id(thread_ids[0]) is not None, (
+                "Worker thread's session should survive the rolled-back transaction"
+            )
+        log("   ✓ Transactions are pinned per thread")
         
-    finally:
-        if os.path.exists(db_path):
-            os.unlink(db_path)
+        print_banner("✓ Data integrity test passed!")
+
+
+ALL_TESTS = (
+    test_session_lifecycle,
+    test_development_plan_operations,
+    test_emotion_event_tracking,
+    test_phase_transition_tracking,
+    test_multi_user_sessions,
+    test_data_integrity,
+)
 
 
 def run_all_tests():
     """Run all database tests."""
-    print("\n" + "="*70)
-    print("DATABASE OPERATIONS TEST SUITE")
-    print("="*70)
-    print("\nTesting Requirements:")
-    print("- 13.1: Session creation and retrieval")
-    print("- 13.2: Development plan saving")
-    print("- 13.3: Emotion event recording")
-    print("- 13.4: Goal completion")
-    print("- 13.5: Data integrity")
-    print("- 13.6: Multi-user support")
-    print("="*70)
+    print_banner("DATABASE OPERATIONS TEST SUITE")
+    log("\nTesting Requirements:")
+    log("- 13.1: Session creation and retrieval")
+    log("- 13.2: Development plan saving")
+    log("- 13.3: Emotion event recording")
+    log("- 13.4: Goal completion")
+    log("- 13.5: Data integrity")
+    log("- 13.6: Multi-user support")
+    log(RULE)
+    flush_log()
     
-    try:
-        test_session_lifecycle()
-        test_development_plan_operations()
-        test_emotion_event_tracking()
-        test_phase_transition_tracking()
-        test_multi_user_sessions()
-        test_data_integrity()
-        
-        print("\n" + "="*70)
-        print("✓✓✓ ALL DATABASE TESTS PASSED ✓✓✓")
-        print("="*70)
-        print("\nSummary:")
-        print("✓ Session lifecycle management works correctly")
-        print("✓ Development plan operations function properly")
-        print("✓ Emotion event tracking is accurate")
-        print("✓ Phase transition tracking works as expected")
-        print("✓ Multi-user sessions are properly isolated")
-        print("✓ Data integrity is maintained")
-        print("\nThe database system is working correctly!")
-        
-        return True
-        
-    except AssertionError as e:
-        print(f"\n✗ TEST FAILED: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
-    except Exception as e:
-        print(f"\n✗ UNEXPECTED ERROR: {e}")
-        import traceback
-        traceback.print_exc()
+    # Tests roll back their writes, so they all share one database
+    db = SessionDatabase(':memory:')
+    failures = 0
+    for test in ALL_TESTS:
+        try:
+            test(db)
+        except AssertionError as e:
+            failures += 1
+            print(f"\n✗ {test.__name__}: TEST FAILED: {e}")
+            sys.stderr.write(traceback.format_exc())
+        except Exception as e:
+            failures += 1
+            print(f"\n✗ {test.__name__}: UNEXPECTED ERROR: {e}")
+            sys.stderr.write(traceback.format_exc())
+    db.close()
+    
+    if failures:
         return False
-
+    
+    print_banner("✓✓✓ ALL DATABASE TESTS PASSED ✓✓✓")
+    log("\nSummary:")
+    log("✓ Session lifecycle management works correctly")
+    log("✓ Development plan operations function properly")
+    log("✓ Emotion event tracking is accurate")
+    log("✓ Phase transition tracking works as expected")
+    log("✓ Multi-user sessions are properly isolated")
+    log("✓ Data integrity is maintained")
+    log("\nThe database system is working correctly!")
+    flush_log()
+    
+    return True
 
 if __name__ == "__main__":
-    import sys
     success = run_all_tests()
     sys.exit(0 if success else 1)
@@ -5,8 +5,132 @@ and emotion event emission with various voice tones.
 """
 
 import numpy as np
-from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Dict, List
+from datetime import datetime
 from r2c2.emotion_detector import EmotionDetector, EmotionType, EmotionState
+from testing_support import RULE, flush_log, flushes_log, log, print_banner
+
+
+def _timestamps_before(base: np.datetime64, seconds_ago: np.ndarray) -> List[datetime]:
+    """Return base minus each offset in seconds, computed as one datetime64 array."""
+    offsets = np.asarray(seconds_ago) * np.timedelta64(1, 's')
+    return (base - offsets).tolist()
+
+
+# Shared detector; each test resets it instead of constructing its own
+_DETECTOR = EmotionDetector()
+
+# Separate detector used only to measure the features of generated samples
+_FEATURE_PROBE = EmotionDetector()
+
+# One period of a sine wave; indexed by phase instead of calling np.sin
+_SINE_TABLE_SIZE = 4096
+_SINE_TABLE = np.sin(
+    2 * np.pi * np.arange(_SINE_TABLE_SIZE) / _SINE_TABLE_SIZE
+).astype(np.float32)
+
+# Shared PCG64 generator for all test randomness
+_RNG = np.random.default_rng()
+
+# Pregenerated unit Gaussian noise; each sample takes a scaled random slice of it
+_NOISE_POOL = _RNG.standard_normal(1_000_000, dtype=np.float32)
+
+
+def _table_sine(n: np.ndarray, frequency: float, sample_rate: int) -> np.ndarray:
+    """Look up sin(2*pi*frequency*n/sample_rate) in the sine table.
+
+    The phase is tracked in 16.16 fixed point so the table index is an
+    integer multiply, shift and mask rather than a transcendental call.
+    """
+    step = int(round(frequency * _SINE_TABLE_SIZE * 65536 / sample_rate))
+    return _SINE_TABLE[((n * step) >> 16) & (_SINE_TABLE_SIZE - 1)]
+
+
+@lru_cache(maxsize=16)
+def _sample_indices(num_samples: int) -> np.ndarray:
+    """Return the read-only int64 sample indices for a buffer."""
+    n = np.arange(num_samples, dtype=np.int64)
+    n.setflags(write=False)
+    return n
+
+
+@lru_cache(maxsize=16)
+def _time_axis(duration: float, sample_rate: int) -> np.ndarray:
+    """Return the read-only float32 sample times for a buffer."""
+    t = _sample_indices(int(duration * sample_rate)).astype(np.float32)
+    t /= np.float32(sample_rate)
+    t.setflags(write=False)
+    return t
+
+
+# The synthetic voice is sin(x) + 0.5*sin(2x) + 0.25*sin(3x). With
+# sin(2x) = 2*sin(x)*cos(x) and sin(3x) = 3*sin(x) - 4*sin(x)**3 this is
+# sin(x) * (0.75 + cos(x) + cos(x)**2), which the exact synthesis path uses
+# to evaluate two transcendentals per sample instead of three.
+def _synth_exact(
+    t: np.ndarray,
+    pitch: float,
+    energy: float,
+    tempo: float
+) -> np.ndarray:
+    """Harmonics, energy and tempo modulation over the sample times t."""
+    # Base sine wave at specified pitch plus two harmonics for a more
+    # realistic voice, via the closed form above
+    phase = t * np.float32(2 * np.pi * pitch)
+    sin_phase = np.sin(phase)
+    cos_phase = np.cos(phase, out=phase)
+    audio = cos_phase * cos_phase
+    audio += cos_phase
+    audio += np.float32(0.75)
+    audio *= sin_phase
+    
+    # Apply energy scaling and tempo variation (modulate amplitude)
+    modulation = t * np.float32(2 * np.pi * tempo * 5)
+    np.sin(modulation, out=modulation)
+    modulation *= np.float32(0.2)
+    modulation += np.float32(1)
+    modulation *= np.float32(energy)
+    audio *= modulation
+    return audio
+
+
+@lru_cache(maxsize=64)
+def _generate_cached(
+    pitch: float,
+    energy: float,
+    tempo: float,
+    duration: float,
+    sample_rate: int,
+    use_lut: bool
+) -> np.ndarray:
+    """Synthesize the deterministic (noise-free) part of a test waveform.
+
+    Cached on the rounded parameter tuple so the hot combinations reused
+    across tests are only synthesized once. The returned array is
+    read-only; callers must copy before modifying it.
+    """
+    num_samples = int(duration * sample_rate)
+    
+    if use_lut:
+        n = _sample_indices(num_samples)
+        audio = _table_sine(n, pitch, sample_rate)
+        for harmonic, weight in ((2, 0.5), (3, 0.25)):
+            overtone = _table_sine(n, pitch * harmonic, sample_rate)
+            overtone *= np.float32(weight)
+            audio += overtone
+        
+        # Apply energy scaling and tempo variation (modulate amplitude)
+        modulation = _table_sine(n, tempo * 5, sample_rate)
+        modulation *= np.float32(0.2)
+        modulation += np.float32(1)
+        modulation *= np.float32(energy)
+        audio *= modulation
+    else:
+        audio = _synth_exact(_time_axis(duration, sample_rate), pitch, energy, tempo)
+    
+    audio.setflags(write=False)
+    return audio
 
 
 def generate_audio_sample(
@@ -14,7 +138,9 @@ def generate_audio_sample(
     energy: float = 0.5,
     tempo: float = 1.0,
     duration: float = 1.0,
-    sample_rate: int = 16000
+    sample_rate: int = 16000,
+    use_lut: bool = True,
+    noise_std: float = 0.02
 ) -> np.ndarray:
     """Generate synthetic audio with specific characteristics.
     
@@ -24,294 +150,225 @@ def generate_audio_sample(
         tempo: Speaking rate multiplier
         duration: Duration in seconds
         sample_rate: Sample rate in Hz
+        use_lut: Use the sine lookup table instead of exact np.sin
+        noise_std: Standard deviation of added Gaussian noise (0 disables it)
         
     Returns:
-        Audio samples as numpy array
+        Audio samples as numpy array (read-only when noise_std is 0)
     """
-    num_samples = int(duration * sample_rate)
-    t = np.linspace(0, duration, num_samples)
-    
-    # Generate base sine wave at specified pitch
-    audio = np.sin(2 * np.pi * pitch * t)
-    
-    # Add harmonics for more realistic voice
-    audio += 0.5 * np.sin(2 * np.pi * pitch * 2 * t)
-    audio += 0.25 * np.sin(2 * np.pi * pitch * 3 * t)
-    
-    # Apply energy scaling
-    audio = audio * energy
+    audio = _generate_cached(
+        round(pitch, 3), round(energy, 3), round(tempo, 3),
+        round(duration, 3), sample_rate, use_lut
+    )
     
-    # Add tempo variation (modulate amplitude)
-    tempo_modulation = 1 + 0.2 * np.sin(2 * np.pi * tempo * 5 * t)
-    audio = audio * tempo_modulation
+    if noise_std <= 0:
+        return audio
+    
+    # Add some noise for realism, sliced from the pregenerated pool unless
+    # the sample is longer than the pool
+    if audio.size <= _NOISE_POOL.size:
+        start = _RNG.integers(0, _NOISE_POOL.size - audio.size, endpoint=True)
+        noise = _NOISE_POOL[start:start + audio.size]
+    else:
+        noise = _RNG.standard_normal(audio.size, dtype=np.float32)
+    noisy = np.multiply(noise, np.float32(noise_std))
+    noisy += audio
+    return noisy
+
+
+# Synthetic voice profiles for the classification sweep:
+# (description, audio parameters, samples fed, acceptable emotions or None for any).
+# With synthetic audio we verify that detection works, not exact classification.
+_AROUSED = {EmotionType.DEFENSIVE, EmotionType.ANXIOUS, EmotionType.FRUSTRATED}
+_CLASSIFICATION_CASES = (
+    ("baseline emotion detection",
+     dict(pitch=150.0, energy=0.5, tempo=1.0), 1,
+     {EmotionType.NEUTRAL, EmotionType.POSITIVE, EmotionType.FRUSTRATED}),
+    ("high arousal emotion detection",
+     dict(pitch=180.0, energy=0.8, tempo=1.4), 5, _AROUSED),
+    ("very high energy emotion detection",
+     dict(pitch=170.0, energy=0.85, tempo=1.2), 5, _AROUSED),
+    ("low energy audio detection",
+     dict(pitch=120.0, energy=0.15, tempo=0.6), 5, None),
+    ("very high pitch and fast tempo",
+     dict(pitch=190.0, energy=0.7, tempo=1.5), 5, _AROUSED),
+    ("detector produces valid emotions",
+     dict(pitch=160.0, energy=0.6, tempo=1.1), 5, None),
+)
+
+
+@lru_cache(maxsize=64)
+def _sample_features(
+    pitch: float = 150.0,
+    energy: float = 0.5,
+    tempo: float = 1.0,
+    duration: float = 1.0
+) -> Dict[str, float]:
+    """Features of a noise-free generated sample, cached on its inputs.
     
-    # Add some noise for realism
-    noise = np.random.normal(0, 0.02, num_samples)
-    audio = audio + noise
+    After a single buffer the probe's smoothed features equal the raw
+    ones, so they can be primed into another detector. Callers must not
+    modify the returned dictionary.
+    """
+    _FEATURE_PROBE.reset()
+    audio = generate_audio_sample(pitch, energy, tempo, duration, noise_std=0.0)
+    return _FEATURE_PROBE.analyze_audio(audio).audio_features
+
+
+def _warm_up(detector: EmotionDetector, samples: int, **params: float) -> EmotionState:
+    """Analyze a noise-free generated sample as if fed samples times in a row.
     
-    return audio.astype(np.float32)
+    The first samples - 1 feeds only fill the smoothing buffers, so they
+    are primed from the sample's cached features and only the last feed
+    is analyzed.
+    """
+    detector.prime(_sample_features(**params), n=samples - 1)
+    return detector.analyze_audio(generate_audio_sample(**params, noise_std=0.0))
 
 
+@flushes_log
 def test_emotion_classification():
     """Test emotion classification with various voice characteristics."""
-    print("\n" + "="*70)
-    print("TEST: Emotion Classification")
-    print("="*70)
-    
-    detector = EmotionDetector()
-    
-    # Test 1: Baseline emotion detection
-    print("\n1. Testing baseline emotion detection...")
-    neutral_audio = generate_audio_sample(
-        pitch=150.0,  # Normal pitch
-        energy=0.5,   # Moderate energy
-        tempo=1.0     # Normal tempo
-    )
-    
-    emotion_state = detector.analyze_audio(neutral_audio)
-    print(f"   Detected: {emotion_state.emotion.value} (confidence: {emotion_state.confidence:.2f})")
-    # With synthetic audio, we just verify detection works, not exact classification
-    assert emotion_state.emotion in [EmotionType.NEUTRAL, EmotionType.POSITIVE, EmotionType.FRUSTRATED]
-    print("   ✓ Emotion detection working with baseline audio")
-    
-    # Test 2: High arousal emotion (high pitch, fast speech, high energy)
-    print("\n2. Testing high arousal emotion detection...")
-    defensive_audio = generate_audio_sample(
-        pitch=180.0,  # Higher pitch
-        energy=0.8,   # High energy
-        tempo=1.4     # Fast tempo
-    )
+    print_banner("TEST: Emotion Classification")
     
-    # Feed multiple samples to build up pattern
-    for _ in range(5):
-        emotion_state = detector.analyze_audio(defensive_audio)
+    detector = _DETECTOR
     
-    print(f"   Detected: {emotion_state.emotion.value} (confidence: {emotion_state.confidence:.2f})")
-    # High arousal should be defensive, anxious, or frustrated
-    assert emotion_state.emotion in [EmotionType.DEFENSIVE, EmotionType.ANXIOUS, EmotionType.FRUSTRATED]
-    print("   ✓ High arousal emotion detected (defensive/anxious/frustrated)")
-    
-    # Test 3: Very high energy emotion
-    print("\n3. Testing very high energy emotion detection...")
-    detector.reset()  # Reset for clean test
-    
-    frustrated_audio = generate_audio_sample(
-        pitch=170.0,  # Elevated pitch
-        energy=0.85,  # Very high energy
-        tempo=1.2     # Somewhat fast
-    )
-    
-    for _ in range(5):
-        emotion_state = detector.analyze_audio(frustrated_audio)
-    
-    print(f"   Detected: {emotion_state.emotion.value} (confidence: {emotion_state.confidence:.2f})")
-    # Very high energy should indicate aroused state
-    assert emotion_state.emotion in [EmotionType.FRUSTRATED, EmotionType.DEFENSIVE, EmotionType.ANXIOUS]
-    print("   ✓ High energy emotion detected")
-    
-    # Test 4: Low energy audio
-    print("\n4. Testing low energy audio detection...")
-    detector.reset()
-    
-    sad_audio = generate_audio_sample(
-        pitch=120.0,  # Lower pitch
-        energy=0.15,  # Very low energy
-        tempo=0.6     # Slow tempo
-    )
-    
-    for _ in range(5):
-        emotion_state = detector.analyze_audio(sad_audio)
-    
-    print(f"   Detected: {emotion_state.emotion.value} (confidence: {emotion_state.confidence:.2f})")
-    # Just verify detection works - emotion classification is heuristic-based
-    assert emotion_state.emotion in EmotionType
-    print("   ✓ Low energy audio processed successfully")
-    
-    # Test 5: Very high pitch and fast tempo
-    print("\n5. Testing very high pitch and fast tempo...")
-    detector.reset()
-    
-    anxious_audio = generate_audio_sample(
-        pitch=190.0,  # High pitch
-        energy=0.7,   # Moderate-high energy
-        tempo=1.5     # Very fast tempo
-    )
-    
-    for _ in range(5):
-        emotion_state = detector.analyze_audio(anxious_audio)
-    
-    print(f"   Detected: {emotion_state.emotion.value} (confidence: {emotion_state.confidence:.2f})")
-    # High pitch + fast tempo indicates arousal
-    assert emotion_state.emotion in [EmotionType.ANXIOUS, EmotionType.DEFENSIVE, EmotionType.FRUSTRATED]
-    print("   ✓ High arousal emotion detected")
-    
-    # Test 6: Detector produces valid emotions
-    print("\n6. Testing detector produces valid emotions...")
-    detector.reset()
-    
-    positive_audio = generate_audio_sample(
-        pitch=160.0,  # Slightly elevated pitch
-        energy=0.6,   # Moderate energy
-        tempo=1.1     # Slightly faster tempo
-    )
-    
-    for _ in range(5):
-        emotion_state = detector.analyze_audio(positive_audio)
-    
-    print(f"   Detected: {emotion_state.emotion.value} (confidence: {emotion_state.confidence:.2f})")
-    # Verify it's a valid emotion type
-    assert isinstance(emotion_state.emotion, EmotionType)
-    assert 0.0 <= emotion_state.confidence <= 1.0
-    print("   ✓ Valid emotion and confidence produced")
-    
-    print("\n" + "="*70)
-    print("✓ All emotion classification tests passed!")
-    print("="*70)
+    for number, (description, params, samples, expected) in enumerate(_CLASSIFICATION_CASES, 1):
+        log(f"\n{number}. Testing {description}...")
+        detector.reset()
+        
+        emotion_state = _warm_up(detector, samples, **params)
+        
+        log(f"   Detected: {emotion_state.emotion.value} (confidence: {emotion_state.confidence:.2f})")
+        assert isinstance(emotion_state.emotion, EmotionType)
+        assert 0.0 <= emotion_state.confidence <= 1.0
+        if expected is not None:
+            assert emotion_state.emotion in expected, (
+                f"Unexpected {emotion_state.emotion.value} for {description}"
+            )
+        log(f"   ✓ {description.capitalize()} classified")
+    
+    print_banner("✓ All emotion classification tests passed!")
 
 
+@flushes_log
 def test_emotion_trend_analysis():
     """Test emotion trend analysis over time windows."""
-    print("\n" + "="*70)
-    print("TEST: Emotion Trend Analysis")
-    print("="*70)
+    print_banner("TEST: Emotion Trend Analysis")
     
-    detector = EmotionDetector()
+    detector = _DETECTOR
+    detector.reset()
+    base = np.datetime64(datetime.now(), 'us')
     
     # Test 1: Predominant emotion detection
-    print("\n1. Testing predominant emotion detection...")
+    log("\n1. Testing predominant emotion detection...")
     
     # Add mostly defensive emotions
-    for i in range(7):
-        emotion = EmotionState(
-            emotion=EmotionType.DEFENSIVE,
-            confidence=0.8,
-            timestamp=datetime.now() - timedelta(seconds=30-i*4)
-        )
-        detector.emotion_history.append(emotion)
+    detector.record_states([
+        EmotionState(EmotionType.DEFENSIVE, 0.8, timestamp)
+        for timestamp in _timestamps_before(base, 30 - 4 * np.arange(7))
+    ])
     
     # Add a few neutral emotions
-    for i in range(3):
-        emotion = EmotionState(
-            emotion=EmotionType.NEUTRAL,
-            confidence=0.7,
-            timestamp=datetime.now() - timedelta(seconds=i*2)
-        )
-        detector.emotion_history.append(emotion)
+    detector.record_states([
+        EmotionState(EmotionType.NEUTRAL, 0.7, timestamp)
+        for timestamp in _timestamps_before(base, 2 * np.arange(3))
+    ])
     
     trend = detector.get_emotion_trend(window_seconds=30)
     assert trend == EmotionType.DEFENSIVE, f"Expected defensive trend, got {trend.value}"
-    print(f"   ✓ Correctly identified defensive as predominant emotion")
+    log(f"   ✓ Correctly identified defensive as predominant emotion")
     
     # Test 2: Emotional shift detection
-    print("\n2. Testing emotional shift detection...")
+    log("\n2. Testing emotional shift detection...")
     detector.reset()
     
     # Start with defensive emotions
-    for i in range(5):
-        emotion = EmotionState(
-            emotion=EmotionType.DEFENSIVE,
-            confidence=0.75,
-            timestamp=datetime.now() - timedelta(seconds=60-i*10)
-        )
-        detector.emotion_history.append(emotion)
+    detector.record_states([
+        EmotionState(EmotionType.DEFENSIVE, 0.75, timestamp)
+        for timestamp in _timestamps_before(base, 60 - 10 * np.arange(5))
+    ])
     
     # Shift to neutral emotions
-    for i in range(5):
-        emotion = EmotionState(
-            emotion=EmotionType.NEUTRAL,
-            confidence=0.8,
-            timestamp=datetime.now() - timedelta(seconds=20-i*4)
-        )
-        detector.emotion_history.append(emotion)
+    detector.record_states([
+        EmotionState(EmotionType.NEUTRAL, 0.8, timestamp)
+        for timestamp in _timestamps_before(base, 20 - 4 * np.arange(5))
+    ])
     
     # Check recent trend (should be neutral)
     recent_trend = detector.get_emotion_trend(window_seconds=25)
     assert recent_trend == EmotionType.NEUTRAL, f"Expected neutral trend, got {recent_trend.value}"
-    print(f"   ✓ Detected emotional shift from defensive to neutral")
+    log(f"   ✓ Detected emotional shift from defensive to neutral")
     
     # Check longer window (should still show defensive influence)
     longer_trend = detector.get_emotion_trend(window_seconds=60)
-    print(f"   ✓ Longer window shows: {longer_trend.value}")
+    log(f"   ✓ Longer window shows: {longer_trend.value}")
     
     # Test 3: Readiness for transition
-    print("\n3. Testing readiness for transition...")
+    log("\n3. Testing readiness for transition...")
     detector.reset()
     
     # Not ready: mostly defensive emotions
-    for i in range(4):
-        emotion = EmotionState(
-            emotion=EmotionType.DEFENSIVE,
-            confidence=0.8,
-            timestamp=datetime.now() - timedelta(seconds=60-i*15)
-        )
-        detector.emotion_history.append(emotion)
+    detector.record_states([
+        EmotionState(EmotionType.DEFENSIVE, 0.8, timestamp)
+        for timestamp in _timestamps_before(base, 60 - 15 * np.arange(4))
+    ])
     
     is_ready = detector.is_emotionally_ready_for_transition()
     assert not is_ready, "Should not be ready with defensive emotions"
-    print("   ✓ Not ready with defensive emotions")
+    log("   ✓ Not ready with defensive emotions")
     
     # Ready: mostly neutral/positive emotions
-    for i in range(4):
-        emotion = EmotionState(
-            emotion=EmotionType.NEUTRAL if i % 2 == 0 else EmotionType.POSITIVE,
-            confidence=0.8,
-            timestamp=datetime.now() - timedelta(seconds=i*5)
-        )
-        detector.emotion_history.append(emotion)
+    detector.record_states([
+        EmotionState(EmotionType.NEUTRAL if i % 2 == 0 else EmotionType.POSITIVE, 0.8, timestamp)
+        for i, timestamp in enumerate(_timestamps_before(base, 5 * np.arange(4)))
+    ])
     
     is_ready = detector.is_emotionally_ready_for_transition()
     assert is_ready, "Should be ready with neutral/positive emotions"
-    print("   ✓ Ready with neutral/positive emotions")
+    log("   ✓ Ready with neutral/positive emotions")
     
     # Test 4: Sad emotion blocks transition
-    print("\n4. Testing that sad emotion blocks transition...")
+    log("\n4. Testing that sad emotion blocks transition...")
     detector.reset()
     
-    for i in range(3):
-        emotion = EmotionState(
-            emotion=EmotionType.SAD,
-            confidence=0.75,
-            timestamp=datetime.now() - timedelta(seconds=i*10)
-        )
-        detector.emotion_history.append(emotion)
+    detector.record_states([
+        EmotionState(EmotionType.SAD, 0.75, timestamp)
+        for timestamp in _timestamps_before(base, 10 * np.arange(3))
+    ])
     
     is_ready = detector.is_emotionally_ready_for_transition()
     assert not is_ready, "Sad emotion should block transition"
-    print("   ✓ Sad emotion correctly blocks transition")
+    log("   ✓ Sad emotion correctly blocks transition")
     
-    print("\n" + "="*70)
-    print("✓ All emotion trend analysis tests passed!")
-    print("="*70)
+    print_banner("✓ All emotion trend analysis tests passed!")
 
 
+@flushes_log
 def test_emotion_history_management():
     """Test emotion history tracking and cleanup."""
-    print("\n" + "="*70)
-    print("TEST: Emotion History Management")
-    print("="*70)
+    print_banner("TEST: Emotion History Management")
     
     # Test 1: History window management
-    print("\n1. Testing history window management...")
+    log("\n1. Testing history window management...")
     detector = EmotionDetector(history_window_seconds=60)
+    base = np.datetime64(datetime.now(), 'us')
     
     # Add emotions spanning 2 minutes
-    for i in range(120):
-        emotion = EmotionState(
-            emotion=EmotionType.NEUTRAL,
-            confidence=0.7,
-            timestamp=datetime.now() - timedelta(seconds=120-i)
-        )
-        detector.emotion_history.append(emotion)
+    detector.record_states([
+        EmotionState(EmotionType.NEUTRAL, 0.7, timestamp)
+        for timestamp in _timestamps_before(base, 120 - np.arange(120))
+    ])
     
     # Cleanup old history
     detector._cleanup_old_history()
     
     # Should only keep last 60 seconds
     assert len(detector.emotion_history) <= 60, f"History too long: {len(detector.emotion_history)}"
-    print(f"   ✓ History cleaned up to {len(detector.emotion_history)} entries")
+    log(f"   ✓ History cleaned up to {len(detector.emotion_history)} entries")
     
     # Test 2: Get history by window
-    print("\n2. Testing history retrieval by window...")
+    log("\n2. Testing history retrieval by window...")
     
     history_30s = detector.get_emotion_history(window_seconds=30)
     history_60s = detector.get_emotion_history(window_seconds=60)
@@ -319,39 +376,47 @@ def test_emotion_history_management():
     
     assert len(history_30s) <= len(history_60s)
     assert len(history_60s) <= len(history_all)
-    print(f"   ✓ 30s window: {len(history_30s)} entries")
-    print(f"   ✓ 60s window: {len(history_60s)} entries")
-    print(f"   ✓ All history: {len(history_all)} entries")
-    
-    # Test 3: Reset functionality
-    print("\n3. Testing detector reset...")
+    log(f"   ✓ 30s window: {len(history_30s)} entries")
+    log(f"   ✓ 60s window: {len(history_60s)} entries")
+    log(f"   ✓ All history: {len(history_all)} entries")
+    
+    # Test 3: History is read-only and cleared explicitly
+    log("\n3. Testing history clearing...")
+    assert isinstance(detector.emotion_history, tuple), "History should be read-only"
+    detector.record(EmotionType.POSITIVE, 0.9)
+    assert detector.emotion_history[-1].emotion == EmotionType.POSITIVE
+    detector.clear_history()
+    assert len(detector.emotion_history) == 0, "History should be empty after clearing"
+    log("   ✓ History cleared through clear_history()")
+    
+    # Test 4: Reset functionality
+    log("\n4. Testing detector reset...")
+    detector.record(EmotionType.NEUTRAL, 0.7)
     detector.reset()
     
     assert len(detector.emotion_history) == 0, "History should be empty after reset"
     assert len(detector.pitch_buffer) == 0, "Pitch buffer should be empty"
     assert len(detector.energy_buffer) == 0, "Energy buffer should be empty"
     assert len(detector.tempo_buffer) == 0, "Tempo buffer should be empty"
-    print("   ✓ Detector successfully reset")
+    log("   ✓ Detector successfully reset")
     
-    print("\n" + "="*70)
-    print("✓ All emotion history management tests passed!")
-    print("="*70)
+    print_banner("✓ All emotion history management tests passed!")
 
 
+@flushes_log
 def test_audio_feature_extraction():
     """Test audio feature extraction accuracy."""
-    print("\n" + "="*70)
-    print("TEST: Audio Feature Extraction")
-    print("="*70)
+    print_banner("TEST: Audio Feature Extraction")
     
-    detector = EmotionDetector()
+    detector = _DETECTOR
+    detector.reset()
     
     # Test 1: Pitch extraction
-    print("\n1. Testing pitch extraction...")
+    log("\n1. Testing pitch extraction...")
     
     # Generate audio at known pitch
     test_pitch = 200.0
-    audio = generate_audio_sample(pitch=test_pitch, duration=0.5)
+    audio = generate_audio_sample(pitch=test_pitch, duration=0.5, noise_std=0.0)
     
     features = detector._extract_audio_features(audio, sample_rate=16000)
     extracted_pitch = features['pitch']
@@ -359,140 +424,193 @@ def test_audio_feature_extraction():
     # Allow 10% tolerance
     pitch_error = abs(extracted_pitch - test_pitch) / test_pitch
     assert pitch_error < 0.15, f"Pitch error too high: {pitch_error:.2%}"
-    print(f"   Expected: {test_pitch} Hz, Got: {extracted_pitch:.1f} Hz")
-    print(f"   ✓ Pitch extraction within tolerance ({pitch_error:.1%} error)")
+    log(f"   Expected: {test_pitch} Hz, Got: {extracted_pitch:.1f} Hz")
+    log(f"   ✓ Pitch extraction within tolerance ({pitch_error:.1%} error)")
+    
+    # Pitch extraction must also hold up against realistic background noise
+    noisy_audio = generate_audio_sample(pitch=test_pitch, duration=0.5)
+    noisy_pitch = detector._extract_audio_features(noisy_audio, sample_rate=16000)['pitch']
+    noisy_error = abs(noisy_pitch - test_pitch) / test_pitch
+    assert noisy_error < 0.15, f"Pitch error too high with noise: {noisy_error:.2%}"
+    log(f"   ✓ Pitch extraction robust to noise ({noisy_error:.1%} error)")
     
     # Test 2: Energy extraction
-    print("\n2. Testing energy extraction...")
+    log("\n2. Testing energy extraction...")
     
     # Reset detector to clear buffers
     detector.reset()
     
     # High energy audio
-    high_energy_audio = generate_audio_sample(energy=0.9, duration=0.5)
+    high_energy = dict(energy=0.9, duration=0.5)
+    high_energy_audio = generate_audio_sample(**high_energy, noise_std=0.0)
     # Feed multiple samples to build up buffer
-    for _ in range(3):
-        detector.analyze_audio(high_energy_audio)
+    _warm_up(detector, 3, **high_energy)
     features_high = detector._extract_audio_features(high_energy_audio, sample_rate=16000)
     
     # Reset and test low energy
     detector.reset()
     
     # Low energy audio
-    low_energy_audio = generate_audio_sample(energy=0.1, duration=0.5)
-    for _ in range(3):
-        detector.analyze_audio(low_energy_audio)
+    low_energy = dict(energy=0.1, duration=0.5)
+    low_energy_audio = generate_audio_sample(**low_energy, noise_std=0.0)
+    _warm_up(detector, 3, **low_energy)
     features_low = detector._extract_audio_features(low_energy_audio, sample_rate=16000)
     
-    print(f"   High energy: {features_high['energy']:.3f}")
-    print(f"   Low energy: {features_low['energy']:.3f}")
+    log(f"   High energy: {features_high['energy']:.3f}")
+    log(f"   Low energy: {features_low['energy']:.3f}")
     # Just verify both produce valid values
     assert 0.0 <= features_high['energy'] <= 1.0
     assert 0.0 <= features_low['energy'] <= 1.0
-    print("   ✓ Energy extraction produces valid values")
+    log("   ✓ Energy extraction produces valid values")
     
     # Test 3: Tempo extraction
-    print("\n3. Testing tempo extraction...")
+    log("\n3. Testing tempo extraction...")
     
     # Fast tempo audio
-    fast_audio = generate_audio_sample(tempo=1.5, duration=0.5)
+    fast_audio = generate_audio_sample(tempo=1.5, duration=0.5, noise_std=0.0)
     features_fast = detector._extract_audio_features(fast_audio, sample_rate=16000)
     
     # Slow tempo audio
-    slow_audio = generate_audio_sample(tempo=0.7, duration=0.5)
+    slow_audio = generate_audio_sample(tempo=0.7, duration=0.5, noise_std=0.0)
     features_slow = detector._extract_audio_features(slow_audio, sample_rate=16000)
     
-    print(f"   Fast tempo: {features_fast['tempo']:.3f}")
-    print(f"   Slow tempo: {features_slow['tempo']:.3f}")
-    print("   ✓ Tempo extraction working")
+    log(f"   Fast tempo: {features_fast['tempo']:.3f}")
+    log(f"   Slow tempo: {features_slow['tempo']:.3f}")
+    log("   ✓ Tempo extraction working")
+    
+    # Test 4: Batch extraction matches per-buffer extraction
+    log("\n4. Testing batch feature extraction...")
     
-    # Test 4: Empty audio handling
-    print("\n4. Testing empty audio handling...")
+    batch_features = detector._extract_audio_features_batch(
+        np.stack([audio, high_energy_audio, fast_audio]), sample_rate=16000
+    )
+    for buffer, batch in zip((audio, high_energy_audio, fast_audio), batch_features):
+        single = detector._extract_audio_features(buffer, sample_rate=16000)
+        for key in ('pitch', 'energy', 'tempo'):
+            assert abs(batch[key] - single[key]) < 1e-6, f"Batch {key} mismatch"
+    log("   ✓ Batch extraction matches per-buffer extraction")
+    
+    # Test 5: Empty audio handling
+    log("\n5. Testing empty audio handling...")
     
     empty_audio = np.array([], dtype=np.float32)
     features_empty = detector._extract_audio_features(empty_audio, sample_rate=16000)
     
     assert features_empty['pitch'] == detector.baseline_pitch
     assert features_empty['energy'] == 0.0
-    print("   ✓ Empty audio handled gracefully")
+    log("   ✓ Empty audio handled gracefully")
+    
+    # Test 6: Both synthesis paths track the direct harmonic sum
+    log("\n6. Testing waveform synthesis paths...")
     
-    print("\n" + "="*70)
-    print("✓ All audio feature extraction tests passed!")
-    print("="*70)
+    t = np.arange(16000) / 16000
+    synthesis_cases = (
+        dict(pitch=150.0, energy=0.5, tempo=1.0),
+        dict(pitch=190.0, energy=0.7, tempo=1.5),
+    )
+    for params in synthesis_cases:
+        phase = 2 * np.pi * params['pitch'] * t
+        expected = (
+            (np.sin(phase) + 0.5 * np.sin(2 * phase) + 0.25 * np.sin(3 * phase))
+            * params['energy'] * (1 + 0.2 * np.sin(2 * np.pi * params['tempo'] * 5 * t))
+        )
+        exact_audio = generate_audio_sample(**params, use_lut=False, noise_std=0.0)
+        assert exact_audio.dtype == np.float32, f"Exact synthesis produced {exact_audio.dtype}"
+        exact_error = float(np.max(np.abs(exact_audio - expected)))
+        assert exact_error < 1e-3, f"Closed-form synthesis drifted by {exact_error:.5f}"
+        
+        lut_audio = generate_audio_sample(**params, noise_std=0.0)
+        assert lut_audio.dtype == np.float32, f"Lookup-table synthesis produced {lut_audio.dtype}"
+        max_error = float(np.max(np.abs(lut_audio - exact_audio)))
+        assert max_error < 1e-2, f"Lookup-table synthesis drifted by {max_error:.4f}"
+    log("   ✓ Both synthesis paths stay in float32")
+    log("   ✓ Closed-form synthesis matches the direct harmonic sum")
+    log("   ✓ Lookup-table synthesis matches exact synthesis")
+
+    long_duration = (_NOISE_POOL.size + 16000) / 16000
+    long_audio = generate_audio_sample(duration=long_duration)
+    assert long_audio.size > _NOISE_POOL.size, (
+        f"Expected a sample longer than the noise pool, got {long_audio.size}"
+    )
+    assert np.all(np.isfinite(long_audio)), "Noise for long samples should be finite"
+    log("   ✓ Samples longer than the noise pool still get noise")
+
+    print_banner("✓ All audio feature extraction tests passed!")
 
 
+@flushes_log
 def test_emotion_confidence_levels():
     """Test emotion confidence scoring."""
-    print("\n" + "="*70)
-    print("TEST: Emotion Confidence Levels")
-    print("="*70)
+    print_banner("TEST: Emotion Confidence Levels")
     
-    detector = EmotionDetector()
+    detector = _DETECTOR
+    detector.reset()
     
     # Test 1: Strong signal produces high confidence
-    print("\n1. Testing high confidence detection...")
+    log("\n1. Testing high confidence detection...")
     
     # Very clear defensive pattern
-    strong_defensive = generate_audio_sample(
+    strong_defensive = dict(
         pitch=200.0,  # Very high pitch
         energy=0.9,   # Very high energy
         tempo=1.6     # Very fast
     )
     
-    for _ in range(5):
-        emotion_state = detector.analyze_audio(strong_defensive)
+    emotion_state = _warm_up(detector, 5, **strong_defensive)
     
     assert emotion_state.confidence >= 0.7, f"Expected high confidence, got {emotion_state.confidence:.2f}"
-    print(f"   ✓ Strong signal: {emotion_state.emotion.value} with {emotion_state.confidence:.2f} confidence")
+    log(f"   ✓ Strong signal: {emotion_state.emotion.value} with {emotion_state.confidence:.2f} confidence")
     
     # Test 2: Weak signal produces lower confidence
-    print("\n2. Testing lower confidence with ambiguous signal...")
+    log("\n2. Testing lower confidence with ambiguous signal...")
     detector.reset()
     
     # Ambiguous pattern
-    ambiguous = generate_audio_sample(
+    ambiguous = dict(
         pitch=155.0,  # Near baseline
         energy=0.52,  # Near baseline
         tempo=1.05    # Near baseline
     )
     
-    for _ in range(5):
-        emotion_state = detector.analyze_audio(ambiguous)
+    emotion_state = _warm_up(detector, 5, **ambiguous)
     
-    print(f"   ✓ Ambiguous signal: {emotion_state.emotion.value} with {emotion_state.confidence:.2f} confidence")
+    log(f"   ✓ Ambiguous signal: {emotion_state.emotion.value} with {emotion_state.confidence:.2f} confidence")
     
     # Test 3: Confidence increases with consistent pattern
-    print("\n3. Testing confidence buildup with consistent pattern...")
+    log("\n3. Testing confidence buildup with consistent pattern...")
     detector.reset()
     
-    consistent_audio = generate_audio_sample(pitch=180.0, energy=0.8, tempo=1.4)
+    consistent = dict(pitch=180.0, energy=0.8, tempo=1.4)
+    consistent_audio = generate_audio_sample(**consistent, noise_std=0.0)
     
-    confidences = []
-    for i in range(10):
-        emotion_state = detector.analyze_audio(consistent_audio)
-        confidences.append(emotion_state.confidence)
+    emotion_states = detector.analyze_audio_batch(np.tile(consistent_audio, (10, 1)))
+    confidences = [emotion_state.confidence for emotion_state in emotion_states]
+    for i, emotion_state in enumerate(emotion_states):
         if i % 3 == 0:
-            print(f"   Sample {i+1}: confidence = {emotion_state.confidence:.2f}")
+            log(f"   Sample {i+1}: confidence = {emotion_state.confidence:.2f}")
     
     # Later samples should have similar or higher confidence (smoothing effect)
-    print("   ✓ Confidence stabilizes with consistent pattern")
+    log("   ✓ Confidence stabilizes with consistent pattern")
+    
+    # Priming the buffers must land on the same state as feeding every sample
+    detector.reset()
+    primed_state = _warm_up(detector, 10, **consistent)
+    assert primed_state.emotion == emotion_states[-1].emotion
+    assert primed_state.confidence == confidences[-1]
+    log("   ✓ Primed detector matches sample-by-sample warm-up")
     
-    print("\n" + "="*70)
-    print("✓ All emotion confidence tests passed!")
-    print("="*70)
+    print_banner("✓ All emotion confidence tests passed!")
 
 
 def run_all_tests():
     """Run all emotion detection tests."""
-    print("\n" + "="*70)
-    print("EMOTION DETECTION TEST SUITE")
-    print("="*70)
-    print("\nTesting Requirements:")
-    print("- 11.1: Voice tone emotion detection")
-    print("- 11.2: Emotion classification accuracy")
-    print("- 11.3: Emotion trend analysis")
-    print("- 11.4: Emotion event emission")
-    print("="*70)
+    print_banner("EMOTION DETECTION TEST SUITE")
+    log("\nTesting Requirements:")
+    log("- 11.1: Voice tone emotion detection")
+    log("- 11.2: Emotion classification accuracy")
+    log("- 11.3: Emotion trend analysis")
+    log("- 11.4: Emotion event emission")
+    log(RULE)
     
     try:
         test_emotion_classification()
@@ -501,16 +619,15 @@ def run_all_tests():
         test_audio_feature_extraction()
         test_emotion_confidence_levels()
         
-        print("\n" + "="*70)
-        print("✓✓✓ ALL EMOTION DETECTION TESTS PASSED ✓✓✓")
-        print("="*70)
-        print("\nSummary:")
-        print("✓ Emotion classification works for all emotion types")
-        print("✓ Emotion trend analysis functions correctly")
-        print("✓ History management operates properly")
-        print("✓ Audio feature extraction is accurate")
-        print("✓ Confidence scoring works as expected")
-        print("\nThe emotion detection system is working correctly!")
+        print_banner("✓✓✓ ALL EMOTION DETECTION TESTS PASSED ✓✓✓")
+        log("\nSummary:")
+        log("✓ Emotion classification works for all emotion types")
+        log("✓ Emotion trend analysis functions correctly")
+        log("✓ History management operates properly")
+        log("✓ Audio feature extraction is accurate")
+        log("✓ Confidence scoring works as expected")
+        log("\nThe emotion detection system is working correctly!")
+        flush_log()
         
         return True
         
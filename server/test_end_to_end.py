@@ -4,299 +4,257 @@ Tests complete R2C2 session flow from start to finish,
 including all components working together.
 """
 
+import json
 import os
-import tempfile
-import numpy as np
+import sys
+import traceback
+from dataclasses import replace
 from datetime import datetime
+from functools import lru_cache
+from types import MappingProxyType
 from r2c2 import R2C2Engine, R2C2Phase, FeedbackData, EmotionState
 from r2c2.emotion_detector import EmotionDetector, EmotionType
-from database import SessionDatabase, initialize_database
+from database import SessionDatabase
+from testing_support import RULE, flush_log, flushes_log, log, print_banner
+
+
+# Sample 360° feedback, built once at import time.  Tests never modify these;
+# create_sample_feedback() hands the engine fresh copies.
+_SAMPLE_FEEDBACK_THEMES = (
+    {
+        'category': 'improvement',
+        'theme': 'communication clarity',
+        'frequency': 5,
+        'examples': [
+            'Could be more clear in emails',
+            'Sometimes hard to understand in meetings',
+            'Needs to check for understanding more often'
+        ]
+    },
+    {
+        'category': 'improvement',
+        'theme': 'delegation',
+        'frequency': 4,
+        'examples': [
+            'Tends to do too much themselves',
+            'Could empower team more',
+            'Needs to trust team members'
+        ]
+    },
+    {
+        'category': 'strength',
+        'theme': 'technical expertise',
+        'frequency': 8,
+        'examples': [
+            'Very knowledgeable',
+            'Great problem solver',
+            'Go-to person for technical questions'
+        ]
+    },
+    {
+        'category': 'strength',
+        'theme': 'work ethic',
+        'frequency': 6,
+        'examples': [
+            'Always delivers on time',
+            'Very reliable',
+            'Dedicated to quality'
+        ]
+    }
+)
+
+_SAMPLE_FEEDBACK_COMMENTS = (
+    {
+        'source': 'manager',
+        'category': 'communication',
+        'comment': 'Could be more clear in written communication',
+        'sentiment': 'negative'
+    },
+    {
+        'source': 'peer',
+        'category': 'technical',
+        'comment': 'Excellent technical skills',
+        'sentiment': 'positive'
+    },
+    {
+        'source': 'direct_report',
+        'category': 'delegation',
+        'comment': 'Would like more autonomy',
+        'sentiment': 'negative'
+    }
+)
+
+_SAMPLE_COLLECTION_DATE = datetime.now()
 
 
 def create_sample_feedback():
-    """Create sample 360° feedback data."""
+    """Create sample 360° feedback data from the shared template."""
     return FeedbackData(
         feedback_id="e2e-test-001",
         user_id="test-user-e2e",
-        collection_date=datetime.now(),
+        collection_date=_SAMPLE_COLLECTION_DATE,
         themes=[
-            {
-                'category': 'improvement',
-                'theme': 'communication clarity',
-                'frequency': 5,
-                'examples': [
-                    'Could be more clear in emails',
-                    'Sometimes hard to understand in meetings',
-                    'Needs to check for understanding more often'
-                ]
-            },
-            {
-                'category': 'improvement',
-                'theme': 'delegation',
-                'frequency': 4,
-                'examples': [
-                    'Tends to do too much themselves',
-                    'Could empower team more',
-                    'Needs to trust team members'
-                ]
-            },
-            {
-                'category': 'strength',
-                'theme': 'technical expertise',
-                'frequency': 8,
-                'examples': [
-                    'Very knowledgeable',
-                    'Great problem solver',
-                    'Go-to person for technical questions'
-                ]
-            },
-            {
-                'category': 'strength',
-                'theme': 'work ethic',
-                'frequency': 6,
-                'examples': [
-                    'Always delivers on time',
-                    'Very reliable',
-                    'Dedicated to quality'
-                ]
-            }
+            dict(theme, examples=list(theme['examples']))
+            for theme in _SAMPLE_FEEDBACK_THEMES
         ],
-        raw_comments=[
-            {
-                'source': 'manager',
-                'category': 'communication',
-                'comment': 'Could be more clear in written communication',
-                'sentiment': 'negative'
-            },
-            {
-                'source': 'peer',
-                'category': 'technical',
-                'comment': 'Excellent technical skills',
-                'sentiment': 'positive'
-            },
-            {
-                'source': 'direct_report',
-                'category': 'delegation',
-                'comment': 'Would like more autonomy',
-                'sentiment': 'negative'
-            }
-        ]
+        raw_comments=[dict(comment) for comment in _SAMPLE_FEEDBACK_COMMENTS]
     )
 
 
+# Simulated emotion for each user response, per phase
+_RELATIONSHIP_EMOTIONS = ('anxious', 'neutral', 'neutral')
+# Emotional journey: defensive → frustrated → neutral
+_REACTION_EMOTIONS = ('defensive', 'defensive', 'frustrated', 'neutral', 'neutral')
+_CONTENT_EMOTIONS = ('neutral',) * 3 + ('positive',)
+_COACHING_EMOTIONS = ('positive',) * 5
+
+# (phase, title, emotions, confidences, seconds spent before transitioning, trigger reason);
+# the final phase has no transition
+_PHASE_SCRIPT = (
+    (R2C2Phase.RELATIONSHIP, "RELATIONSHIP BUILDING PHASE", _RELATIONSHIP_EMOTIONS,
+     (0.75,) * 3, 130, 'Time threshold reached'),
+    (R2C2Phase.REACTION, "REACTION EXPLORATION PHASE", _REACTION_EMOTIONS,
+     tuple(0.70 + (i * 0.02) for i in range(5)), 200, 'Emotional readiness detected'),
+    (R2C2Phase.CONTENT, "CONTENT DISCUSSION PHASE", _CONTENT_EMOTIONS,
+     (0.78,) * 4, 250, 'Key themes discussed'),
+    (R2C2Phase.COACHING, "COACHING FOR CHANGE PHASE", _COACHING_EMOTIONS,
+     (0.82,) * 5, None, None),
+)
+
+
+# Simulated user responses throughout the session, per phase
+_USER_RESPONSES = MappingProxyType({
+    'relationship': (
+        "I'm feeling a bit nervous about this feedback.",
+        "I've read through it, and some parts were hard to hear.",
+        "I'm ready to talk about it though."
+    ),
+    'reaction': (
+        "The comments about my communication really surprised me.",
+        "I feel like I'm being misunderstood - I try so hard to be clear!",
+        "Maybe I'm being defensive... I guess I do feel hurt by some of this.",
+        "Okay, I can see that my initial reaction was pretty strong.",
+        "I'm starting to feel more calm about it now."
+    ),
+    'content': (
+        "Looking at the patterns, communication and delegation come up a lot.",
+        "I think the communication issue might be about checking for understanding.",
+        "The delegation feedback makes sense - I do tend to do things myself.",
+        "I can see how my behavior might impact my team's growth."
+    ),
+    'coaching': (
+        "I want to focus on communication and delegation.",
+        "For communication, I'll start sending summary emails after meetings.",
+        "For delegation, I'll identify one task per week to delegate.",
+        "I'll track my progress in a weekly log.",
+        "I think I can start this next week."
+    )
+})
+
+# Response previews shown in verbose output, truncated once up front
+_RESPONSE_PREVIEWS = MappingProxyType({
+    phase: tuple(response[:60] for response in responses)
+    for phase, responses in _USER_RESPONSES.items()
+})
+
+
 def simulate_user_responses():
     """Simulate user responses throughout the session."""
-    return {
-        'relationship': [
-            "I'm feeling a bit nervous about this feedback.",
-            "I've read through it, and some parts were hard to hear.",
-            "I'm ready to talk about it though."
-        ],
-        'reaction': [
-            "The comments about my communication really surprised me.",
-            "I feel like I'm being misunderstood - I try so hard to be clear!",
-            "Maybe I'm being defensive... I guess I do feel hurt by some of this.",
-            "Okay, I can see that my initial reaction was pretty strong.",
-            "I'm starting to feel more calm about it now."
-        ],
-        'content': [
-            "Looking at the patterns, communication and delegation come up a lot.",
-            "I think the communication issue might be about checking for understanding.",
-            "The delegation feedback makes sense - I do tend to do things myself.",
-            "I can see how my behavior might impact my team's growth."
-        ],
-        'coaching': [
-            "I want to focus on communication and delegation.",
-            "For communication, I'll start sending summary emails after meetings.",
-            "For delegation, I'll identify one task per week to delegate.",
-            "I'll track my progress in a weekly log.",
-            "I think I can start this next week."
-        ]
-    }
+    return _USER_RESPONSES
+
+
+def _run_phase(engine, db, session_id, phase_name, responses, emotions, confidences):
+    """Feed one phase's simulated responses to the engine and record their emotions."""
+    base = EmotionState(emotion='neutral', confidence=0.0, timestamp=datetime.now())
+    events = []
+    for i, (response, emotion_type, confidence) in enumerate(
+        zip(responses, emotions, confidences)
+    ):
+        emotion = replace(base, emotion=emotion_type, confidence=confidence)
+        
+        engine.record_user_response(response, emotion)
+        events.append({
+            'emotion_type': emotion_type,
+            'confidence': confidence,
+            'r2c2_phase': phase_name
+        })
+        
+        log(f"   User: {_RESPONSE_PREVIEWS[phase_name][i]}...")
+        log(f"   Emotion: {emotion_type} ({confidence:.2f})")
+    
+    db.record_emotion_events_batch(session_id, events)
 
 
+@flushes_log
 def test_complete_r2c2_session():
     """Test a complete R2C2 session from start to finish."""
-    print("\n" + "="*70)
-    print("TEST: Complete R2C2 Session Flow")
-    print("="*70)
+    print_banner("TEST: Complete R2C2 Session Flow")
     
-    # Setup
-    with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as tmp:
-        db_path = tmp.name
+    # Setup: a private in-memory database, schema created by SessionDatabase
+    db = SessionDatabase(':memory:')
     
     try:
         # Initialize components
-        print("\n1. Initializing components...")
-        initialize_database(db_path)
-        db = SessionDatabase(db_path)
+        log("\n1. Initializing components...")
         
         feedback = create_sample_feedback()
         r2c2_engine = R2C2Engine(feedback)
         emotion_detector = EmotionDetector()
         
-        print("   ✓ Database initialized")
-        print("   ✓ R2C2 engine created")
-        print("   ✓ Emotion detector ready")
+        log("   ✓ Database initialized")
+        log("   ✓ R2C2 engine created")
+        log("   ✓ Emotion detector ready")
         
         # Create session in database
         session_id = db.create_session(feedback.user_id, {
             'feedback_id': feedback.feedback_id,
             'themes': feedback.themes
         })
-        print(f"   ✓ Session created: ID {session_id}")
+        log(f"   ✓ Session created: ID {session_id}")
         
         # Simulate session flow
         user_responses = simulate_user_responses()
         
-        # Phase 1: Relationship Building
-        print("\n2. RELATIONSHIP BUILDING PHASE")
-        print("   " + "-"*66)
-        assert r2c2_engine.get_current_phase() == R2C2Phase.RELATIONSHIP
+        transitions = []
         
-        for i, response in enumerate(user_responses['relationship']):
-            # Simulate neutral/slightly anxious emotions
-            emotion = EmotionState(
-                emotion='anxious' if i == 0 else 'neutral',
-                confidence=0.75,
-                timestamp=datetime.now()
-            )
+        for step, (phase, title, emotions, confidences, seconds, reason) in enumerate(
+            _PHASE_SCRIPT, start=2
+        ):
+            log(f"\n{step}. {title}")
+            log("   " + "-"*66)
+            assert r2c2_engine.get_current_phase() == phase
             
-            r2c2_engine.record_user_response(response, emotion)
-            db.record_emotion_event(
-                session_id=session_id,
-                emotion_type=emotion.emotion,
-                confidence=emotion.confidence,
-                r2c2_phase='relationship'
+            _run_phase(
+                r2c2_engine, db, session_id, phase.value,
+                user_responses[phase.value], emotions, confidences
             )
             
-            print(f"   User: {response[:60]}...")
-            print(f"   Emotion: {emotion.emotion} ({emotion.confidence:.2f})")
-        
-        # Transition to Reaction
-        r2c2_engine.state.phase_start_time = datetime.now()
-        from datetime import timedelta
-        r2c2_engine.state.phase_start_time -= timedelta(seconds=130)
-        
-        assert r2c2_engine.should_transition()
-        new_phase = r2c2_engine.transition_to_next_phase()
-        db.record_phase_transition(
-            session_id=session_id,
-            from_phase='relationship',
-            to_phase='reaction',
-            trigger_reason='Time threshold reached',
-            time_in_previous_phase=130.0
-        )
-        print(f"   ✓ Transitioned to {new_phase.value} phase")
-        
-        # Phase 2: Reaction Exploration
-        print("\n3. REACTION EXPLORATION PHASE")
-        print("   " + "-"*66)
-        
-        for i, response in enumerate(user_responses['reaction']):
-            # Simulate emotional journey: defensive → frustrated → neutral
-            if i < 2:
-                emotion_type = 'defensive'
-            elif i < 3:
-                emotion_type = 'frustrated'
-            else:
-                emotion_type = 'neutral'
-            
-            emotion = EmotionState(
-                emotion=emotion_type,
-                confidence=0.70 + (i * 0.02),
-                timestamp=datetime.now()
-            )
-            
-            r2c2_engine.record_user_response(response, emotion)
-            db.record_emotion_event(
-                session_id=session_id,
-                emotion_type=emotion.emotion,
-                confidence=emotion.confidence,
-                r2c2_phase='reaction'
-            )
-            
-            print(f"   User: {response[:60]}...")
-            print(f"   Emotion: {emotion.emotion} ({emotion.confidence:.2f})")
-        
-        # Transition to Content
-        r2c2_engine.state.phase_start_time -= timedelta(seconds=200)
-        assert r2c2_engine.should_transition()
-        new_phase = r2c2_engine.transition_to_next_phase()
-        db.record_phase_transition(
-            session_id=session_id,
-            from_phase='reaction',
-            to_phase='content',
-            trigger_reason='Emotional readiness detected',
-            time_in_previous_phase=200.0
-        )
-        print(f"   ✓ Transitioned to {new_phase.value} phase")
-        
-        # Phase 3: Content Discussion
-        print("\n4. CONTENT DISCUSSION PHASE")
-        print("   " + "-"*66)
-        
-        for i, response in enumerate(user_responses['content']):
-            emotion = EmotionState(
-                emotion='neutral' if i < 3 else 'positive',
-                confidence=0.78,
-                timestamp=datetime.now()
-            )
-            
-            r2c2_engine.record_user_response(response, emotion)
-            db.record_emotion_event(
-                session_id=session_id,
-                emotion_type=emotion.emotion,
-                confidence=emotion.confidence,
-                r2c2_phase='content'
-            )
-            
-            print(f"   User: {response[:60]}...")
-            print(f"   Emotion: {emotion.emotion} ({emotion.confidence:.2f})")
-        
-        # Verify content themes were extracted
-        assert len(r2c2_engine.state.content_themes) >= 2
-        print(f"   ✓ Identified themes: {', '.join(r2c2_engine.state.content_themes)}")
-        
-        # Transition to Coaching
-        r2c2_engine.state.phase_start_time -= timedelta(seconds=250)
-        assert r2c2_engine.should_transition()
-        new_phase = r2c2_engine.transition_to_next_phase()
-        db.record_phase_transition(
-            session_id=session_id,
-            from_phase='content',
-            to_phase='coaching',
-            trigger_reason='Key themes discussed',
-            time_in_previous_phase=250.0
-        )
-        print(f"   ✓ Transitioned to {new_phase.value} phase")
-        
-        # Phase 4: Coaching for Change
-        print("\n5. COACHING FOR CHANGE PHASE")
-        print("   " + "-"*66)
-        
-        for i, response in enumerate(user_responses['coaching']):
-            emotion = EmotionState(
-                emotion='positive',
-                confidence=0.82,
-                timestamp=datetime.now()
-            )
+            if seconds is None:
+                break
             
-            r2c2_engine.record_user_response(response, emotion)
-            db.record_emotion_event(
-                session_id=session_id,
-                emotion_type=emotion.emotion,
-                confidence=emotion.confidence,
-                r2c2_phase='coaching'
-            )
+            if phase == R2C2Phase.CONTENT:
+                # Verify content themes were extracted
+                assert len(r2c2_engine.state.content_themes) >= 2
+                log(f"   ✓ Identified themes: {', '.join(r2c2_engine.state.content_themes)}")
             
-            print(f"   User: {response[:60]}...")
-            print(f"   Emotion: {emotion.emotion} ({emotion.confidence:.2f})")
+            # Transition to the next phase
+            r2c2_engine.advance_simulated_time(seconds)
+            assert r2c2_engine.should_transition()
+            new_phase = r2c2_engine.transition_to_next_phase()
+            transitions.append({
+                'from_phase': phase.value,
+                'to_phase': new_phase.value,
+                'trigger_reason': reason,
+                'time_in_previous_phase': float(seconds)
+            })
+            log(f"   ✓ Transitioned to {new_phase.value} phase")
+        
+        db.record_phase_transitions_batch(session_id, transitions)
         
         # Verify development plan was created
         assert r2c2_engine.state.development_plan is not None
         assert len(r2c2_engine.state.development_plan.goals) >= 2
-        print(f"   ✓ Development plan created with {len(r2c2_engine.state.development_plan.goals)} goals")
+        log(f"   ✓ Development plan created with {len(r2c2_engine.state.development_plan.goals)} goals")
         
         # Save development plan to database
         goals = [
@@ -318,24 +276,28 @@ def test_complete_r2c2_session():
             }
         ]
         db.save_development_plan(session_id, goals)
-        print("   ✓ Development plan saved to database")
+        log("   ✓ Development plan saved to database")
         
         # End session
-        print("\n6. ENDING SESSION")
-        print("   " + "-"*66)
+        log("\n6. ENDING SESSION")
+        log("   " + "-"*66)
         
         summary = r2c2_engine.get_session_summary()
         db.end_session(session_id, summary)
         
-        print(f"   Session duration: {summary['duration_seconds']:.1f}s")
-        print(f"   Phases completed: {', '.join(summary['phases_completed'])}")
-        print(f"   Emotional journey: {summary['emotional_journey']['start_emotion']} → {summary['emotional_journey']['end_emotion']}")
-        print(f"   Development plan: {summary['development_plan']['goal_count']} goals")
-        print("   ✓ Session ended successfully")
+        # Simulated phase time counts towards the session duration
+        simulated_seconds = sum(row[4] for row in _PHASE_SCRIPT if row[4] is not None)
+        assert summary['duration_seconds'] >= simulated_seconds
+        
+        log(f"   Session duration: {summary['duration_seconds']:.1f}s")
+        log(f"   Phases completed: {', '.join(summary['phases_completed'])}")
+        log(f"   Emotional journey: {summary['emotional_journey']['start_emotion']} → {summary['emotional_journey']['end_emotion']}")
+        log(f"   Development plan: {summary['development_plan']['goal_count']} goals")
+        log("   ✓ Session ended successfully")
         
         # Verify complete session data
-        print("\n7. VERIFYING SESSION DATA")
-        print("   " + "-"*66)
+        log("\n7. VERIFYING SESSION DATA")
+        log("   " + "-"*66)
         
         session_data = db.get_session_summary(session_id)
         
@@ -344,33 +306,27 @@ def test_complete_r2c2_session():
         assert len(session_data['phase_transitions']) == 3
         assert len(session_data['development_plan']) == 2
         
-        print(f"   ✓ Emotion events: {len(session_data['emotion_events'])}")
-        print(f"   ✓ Phase transitions: {len(session_data['phase_transitions'])}")
-        print(f"   ✓ Development plan goals: {len(session_data['development_plan'])}")
+        log(f"   ✓ Emotion events: {len(session_data['emotion_events'])}")
+        log(f"   ✓ Phase transitions: {len(session_data['phase_transitions'])}")
+        log(f"   ✓ Development plan goals: {len(session_data['development_plan'])}")
         
         # Verify emotional progression
         emotions = [e['emotion_type'] for e in session_data['emotion_events']]
-        print(f"   ✓ Emotional progression: {' → '.join(emotions[:3])} ... {' → '.join(emotions[-3:])}")
+        log(f"   ✓ Emotional progression: {' → '.join(emotions[:3])} ... {' → '.join(emotions[-3:])}")
         
-        print("\n" + "="*70)
-        print("✓ Complete R2C2 session flow test passed!")
-        print("="*70)
-        
-        return True
+        print_banner("✓ Complete R2C2 session flow test passed!")
         
     finally:
-        if os.path.exists(db_path):
-            os.unlink(db_path)
+        db.close()
 
 
+@flushes_log
 def test_error_scenarios():
     """Test error handling scenarios."""
-    print("\n" + "="*70)
-    print("TEST: Error Scenarios")
-    print("="*70)
+    print_banner("TEST: Error Scenarios")
     
     # Test 1: Session with minimal feedback
-    print("\n1. Testing session with minimal feedback...")
+    log("\n1. Testing session with minimal feedback...")
     feedback = FeedbackData(
         feedback_id="minimal-001",
         user_id="user-minimal",
@@ -385,121 +341,119 @@ def test_error_scenarios():
     # Should still generate prompts
     prompt = engine.get_phase_prompt()
     assert len(prompt) > 0
-    print("   ✓ Engine handles minimal feedback gracefully")
+    log("   ✓ Engine handles minimal feedback gracefully")
     
     # Test 2: Empty user responses
-    print("\n2. Testing empty user responses...")
+    log("\n2. Testing empty user responses...")
     engine.record_user_response("", None)
     engine.record_user_response("   ", None)
     # Should not crash
-    print("   ✓ Empty responses handled gracefully")
+    log("   ✓ Empty responses handled gracefully")
     
     # Test 3: Rapid phase transitions
-    print("\n3. Testing rapid phase transitions...")
+    log("\n3. Testing rapid phase transitions...")
     for _ in range(5):
         engine.transition_to_next_phase()
     # Should stay in final phase
     assert engine.get_current_phase() == R2C2Phase.COACHING
-    print("   ✓ Rapid transitions handled correctly")
+    log("   ✓ Rapid transitions handled correctly")
     
     # Test 4: Emotion detector with no history
-    print("\n4. Testing emotion detector with no history...")
+    log("\n4. Testing emotion detector with no history...")
     detector = EmotionDetector()
     trend = detector.get_emotion_trend()
     assert trend == EmotionType.NEUTRAL
     is_ready = detector.is_emotionally_ready_for_transition()
     assert not is_ready
-    print("   ✓ Emotion detector handles empty history")
+    log("   ✓ Emotion detector handles empty history")
     
-    print("\n" + "="*70)
-    print("✓ Error scenarios test passed!")
-    print("="*70)
+    print_banner("✓ Error scenarios test passed!")
+
+
+@lru_cache(maxsize=1)
+def _load_sample_feedback(path):
+    """Parse a sample feedback file once, or return None if it does not exist."""
+    if not os.path.exists(path):
+        return None
+    
+    with open(path, 'r') as f:
+        feedback_json = json.load(f)
+    
+    return FeedbackData(
+        feedback_id=feedback_json.get('feedback_id', 'sample-001'),
+        user_id=feedback_json.get('user_id', 'sample-user'),
+        collection_date=datetime.now(),
+        themes=feedback_json.get('themes', []),
+        raw_comments=feedback_json.get('comments', [])
+    )
 
 
+@flushes_log
 def test_session_with_sample_feedback():
     """Test session with realistic sample feedback."""
-    print("\n" + "="*70)
-    print("TEST: Session with Sample Feedback")
-    print("="*70)
+    print_banner("TEST: Session with Sample Feedback")
     
     # Load sample feedback if available
     sample_feedback_path = "../sample-feedback/sample_feedback.json"
     
-    if os.path.exists(sample_feedback_path):
-        print("\n1. Loading sample feedback file...")
-        import json
-        with open(sample_feedback_path, 'r') as f:
-            feedback_json = json.load(f)
-        
-        feedback = FeedbackData(
-            feedback_id=feedback_json.get('feedback_id', 'sample-001'),
-            user_id=feedback_json.get('user_id', 'sample-user'),
-            collection_date=datetime.now(),
-            themes=feedback_json.get('themes', []),
-            raw_comments=feedback_json.get('comments', [])
-        )
-        print(f"   ✓ Loaded feedback with {len(feedback.themes)} themes")
+    feedback = _load_sample_feedback(sample_feedback_path)
+    if feedback is not None:
+        log("\n1. Loaded sample feedback file...")
+        log(f"   ✓ Loaded feedback with {len(feedback.themes)} themes")
     else:
-        print("\n1. Using generated sample feedback...")
+        log("\n1. Using generated sample feedback...")
         feedback = create_sample_feedback()
-        print(f"   ✓ Created feedback with {len(feedback.themes)} themes")
+        log(f"   ✓ Created feedback with {len(feedback.themes)} themes")
     
     # Create engine and verify it works
-    print("\n2. Testing engine with sample feedback...")
+    log("\n2. Testing engine with sample feedback...")
     engine = R2C2Engine(feedback)
     
-    # Get prompts for each phase
-    for phase in [R2C2Phase.RELATIONSHIP, R2C2Phase.REACTION, R2C2Phase.CONTENT, R2C2Phase.COACHING]:
-        engine.state.current_phase = phase
-        prompt = engine.get_phase_prompt()
-        assert len(prompt) > 0
-        print(f"   ✓ {phase.value} phase prompt generated ({len(prompt)} chars)")
+    # Get prompts for each phase without moving the session along
+    prompts = {phase: engine.get_phase_prompt(phase=phase) for phase in R2C2Phase}
+    assert all(prompts.values())
+    assert engine.get_current_phase() == R2C2Phase.RELATIONSHIP
+    for phase, prompt in prompts.items():
+        log(f"   ✓ {phase.value} phase prompt generated ({len(prompt)} chars)")
     
-    print("\n" + "="*70)
-    print("✓ Sample feedback test passed!")
-    print("="*70)
+    print_banner("✓ Sample feedback test passed!")
 
 
 def run_all_tests():
-    """Run all end-to-end tests."""
-    print("\n" + "="*70)
-    print("END-TO-END INTEGRATION TEST SUITE")
-    print("="*70)
-    print("\nTesting Requirements:")
-    print("- 1.1-1.5: Complete R2C2 session flow")
-    print("- 16.1-16.7: Error handling and recovery")
-    print("="*70)
+    """Run all end-to-end tests.
+    
+    Each test builds its own engine, detector and in-memory database, so
+    the tests are independent and can also be collected by a parallel
+    test runner. pytest collects the test functions directly; this runner
+    only exists for running the module as a script.
+    """
+    print_banner("END-TO-END INTEGRATION TEST SUITE")
+    log("\nTesting Requirements:")
+    log("- 1.1-1.5: Complete R2C2 session flow")
+    log("- 16.1-16.7: Error handling and recovery")
+    log(RULE)
     
     try:
         test_complete_r2c2_session()
         test_error_scenarios()
         test_session_with_sample_feedback()
-        
-        print("\n" + "="*70)
-        print("✓✓✓ ALL END-TO-END TESTS PASSED ✓✓✓")
-        print("="*70)
-        print("\nSummary:")
-        print("✓ Complete R2C2 session flow works correctly")
-        print("✓ All components integrate properly")
-        print("✓ Error scenarios are handled gracefully")
-        print("✓ Sample feedback processing works")
-        print("\nThe R2C2 Voice Coach system is working end-to-end!")
-        
-        return True
-        
-    except AssertionError as e:
-        print(f"\n✗ TEST FAILED: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
     except Exception as e:
-        print(f"\n✗ UNEXPECTED ERROR: {e}")
-        import traceback
+        label = "TEST FAILED" if isinstance(e, AssertionError) else "UNEXPECTED ERROR"
+        print(f"\n✗ {label}: {e}")
         traceback.print_exc()
         return False
+    
+    print_banner("✓✓✓ ALL END-TO-END TESTS PASSED ✓✓✓")
+    log("\nSummary:")
+    log("✓ Complete R2C2 session flow works correctly")
+    log("✓ All components integrate properly")
+    log("✓ Error scenarios are handled gracefully")
+    log("✓ Sample feedback processing works")
+    log("\nThe R2C2 Voice Coach system is working end-to-end!")
+    flush_log()
+    
+    return True
 
 
 if __name__ == "__main__":
-    import sys
-    success = run_all_tests()
-    sys.exit(0 if success else 1)
+    sys.exit(0 if run_all_tests() else 1)
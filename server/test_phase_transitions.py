@@ -2,436 +2,799 @@
 
 Tests automatic transitions based on time, emotion-based transitions,
 manual phase progression, and phase prompt correctness.
+
+Checks go through ``_check`` rather than ``assert`` so the suite still
+fails correctly when run with ``python -O`` or ``-OO``.
 """
 
-import time
+import asyncio
+import re
+import sys
+import traceback
 from datetime import datetime, timedelta
-from r2c2 import R2C2Engine, R2C2Phase, FeedbackData, EmotionState
 
+import numpy as np
+
+from r2c2 import EmotionState, EmotionType, FeedbackData, R2C2Engine, R2C2Phase
+from r2c2.emotion_detector import EmotionState as DetectedEmotionState
+from testing_support import RULE, VERBOSE, flush_log, flushes_log, log, print_banner
+
+try:
+    from pipecat.frames.frames import InputAudioRawFrame
+
+    from processors.emotion_processor import EmotionProcessor  # Optional: needs pipecat
+except ImportError:
+    EmotionProcessor = None
+
+
+def _check(condition, message):
+    """Fail the test unless ``condition`` holds, even when run with ``python -O``."""
+    if not condition:
+        raise AssertionError(message)
+
+
+def _elapsed(engine):
+    """Describe how long the engine has been in its current phase, for failure messages."""
+    return f"{engine.get_time_in_phase():.0f}s in phase"
+
+
+def _prompt_terms(prompt):
+    """Return a prompt lowercased once and the known phrases found in it."""
+    prompt_lower = prompt.lower()
+    return prompt_lower, frozenset(_PHRASE_RE.findall(prompt_lower))
+
+
+# Multi-word phrases the prompt checks look for, matched in one pass
+_PHRASE_RE = re.compile(r'psychological safety|safe space|time management|problem solving')
+
+# Offsets for seeded emotion timestamps, indexed by position in the seeding loop
+_DELTAS_60_10 = tuple(timedelta(seconds=60 - i*10) for i in range(5))
+_DELTAS_60_15 = tuple(timedelta(seconds=60 - i*15) for i in range(4))
+_DELTAS_5 = tuple(timedelta(seconds=i*5) for i in range(4))
+_DELTAS_1 = tuple(timedelta(seconds=i) for i in range(3))
 
+# How long ago a phase started, for simulating time spent in it
+_PHASE_AGE_95 = timedelta(seconds=95)
+_PHASE_AGE_130 = timedelta(seconds=130)
+_PHASE_AGE_200 = timedelta(seconds=200)
+_PHASE_AGE_250 = timedelta(seconds=250)
+_PHASE_AGE_300 = timedelta(seconds=300)
+_PHASE_AGE_650 = timedelta(seconds=650)
+
+
+# Clock anchor taken at import, for values whose age the engine never checks
+_NOW = datetime.now()
+
+# Feedback for each test, built once at import; the engine only reads it
+
+_TIME_BASED_FEEDBACK = FeedbackData(
+    feedback_id="test-001",
+    user_id="user-123",
+    collection_date=_NOW,
+    themes=[
+        {
+            'category': 'improvement',
+            'theme': 'communication clarity',
+            'frequency': 5,
+            'examples': ['Could be more clear in emails']
+        }
+    ]
+)
+
+_EMOTION_BASED_FEEDBACK = FeedbackData(
+    feedback_id="test-002",
+    user_id="user-456",
+    collection_date=_NOW,
+    themes=[{'category': 'improvement', 'theme': 'delegation', 'frequency': 3}]
+)
+
+_MANUAL_PROGRESSION_FEEDBACK = FeedbackData(
+    feedback_id="test-003",
+    user_id="user-789",
+    collection_date=_NOW,
+    themes=[{'category': 'strength', 'theme': 'technical skills', 'frequency': 7}]
+)
+
+_PROMPT_FEEDBACK = FeedbackData(
+    feedback_id="test-004",
+    user_id="user-101",
+    collection_date=_NOW,
+    themes=[
+        {'category': 'improvement', 'theme': 'time management', 'frequency': 4},
+        {'category': 'strength', 'theme': 'problem solving', 'frequency': 6}
+    ]
+)
+
+_ENGINE_SMOKE_FEEDBACK = FeedbackData(
+    feedback_id="test-005",
+    user_id="user-123",
+    collection_date=_NOW,
+    themes=[
+        {
+            'category': 'improvement',
+            'theme': 'communication clarity',
+            'frequency': 5,
+            'examples': ['Could be more clear in emails']
+        },
+        {
+            'category': 'strength',
+            'theme': 'technical expertise',
+            'frequency': 8,
+            'examples': ['Very knowledgeable']
+        }
+    ]
+)
+
+
+@flushes_log
+def test_engine_smoke():
+    """Test basic R2C2 engine functionality end to end."""
+    print_banner("TEST: R2C2 Engine Smoke Test")
+    
+    # Initialize engine
+    log("\n1. Initializing R2C2 Engine...")
+    engine = R2C2Engine(_ENGINE_SMOKE_FEEDBACK)
+    _check(
+        engine.get_current_phase() == R2C2Phase.RELATIONSHIP,
+        f"Expected RELATIONSHIP, got {engine.get_current_phase()}"
+    )
+    log(f"   ✓ Engine initialized in {engine.get_current_phase().value} phase")
+    
+    # Test phase prompt generation
+    log("\n2. Testing phase prompt generation...")
+    prompt = engine.get_phase_prompt()
+    _check(len(prompt) > 0, "Phase prompt should not be empty")
+    log(f"   ✓ Generated prompt ({len(prompt)} characters)")
+    
+    # Test phase guidance
+    log("\n3. Testing phase guidance...")
+    guidance = engine.get_phase_guidance()
+    _check(
+        guidance['phase'] == 'relationship',
+        f"Expected relationship guidance, got {guidance['phase']!r}"
+    )
+    log(f"   ✓ Phase: {guidance['phase']}")
+    log(f"   ✓ Goals: {len(guidance['goals'])} goals")
+    log(f"   ✓ Key questions: {len(guidance['key_questions'])} questions")
+    
+    # Test recording user response
+    log("\n4. Testing user response recording...")
+    emotion = EmotionState(emotion='neutral', confidence=0.8, timestamp=_NOW)
+    engine.record_user_response("I feel a bit nervous about this feedback", emotion)
+    _check(
+        len(engine.state.emotional_states) == 1,
+        f"Expected 1 emotion record, got {len(engine.state.emotional_states)}"
+    )
+    log(f"   ✓ Recorded response with emotion: {emotion.emotion}")
+    
+    # Test phase transition logic
+    log("\n5. Testing phase transition logic...")
+    _check(
+        not engine.should_transition(),
+        f"Should not transition immediately ({_elapsed(engine)})"
+    )
+    log(f"   ✓ Time in phase: {engine.get_time_in_phase():.2f} seconds")
+    
+    # Force transition to next phase
+    log("\n6. Testing manual phase transition...")
+    old_phase = engine.get_current_phase()
+    new_phase = engine.transition_to_next_phase()
+    _check(new_phase == R2C2Phase.REACTION, f"Expected REACTION, got {new_phase}")
+    log(f"   ✓ Transitioned from {old_phase.value} to {new_phase.value}")
+    
+    # Test new phase prompt
+    log("\n7. Testing new phase prompt...")
+    new_prompt = engine.get_phase_prompt()
+    _check(
+        len(new_prompt) > 0 and new_prompt != prompt,
+        f"Expected a new non-empty prompt for {new_phase}, got {len(new_prompt)} characters"
+    )
+    log(f"   ✓ Generated new prompt for {new_phase.value} phase")
+    
+    # Test session summary
+    log("\n8. Testing session summary generation...")
+    summary = engine.get_session_summary()
+    _check(
+        summary['current_phase'] == 'reaction',
+        f"Expected reaction in summary, got {summary['current_phase']!r}"
+    )
+    _check(
+        len(summary['phases_completed']) == 1,
+        f"Expected 1 completed phase, got {summary['phases_completed']}"
+    )
+    log(f"   ✓ Session duration: {summary['duration_seconds']:.2f} seconds")
+    log(f"   ✓ Phases completed: {len(summary['phases_completed'])}")
+    
+    # Test state management
+    log("\n9. Testing state management...")
+    state = engine.get_state()
+    _check(
+        len(state.emotional_states) == 1,
+        f"Expected 1 emotion record, got {len(state.emotional_states)}"
+    )
+    _check(
+        len(state.phase_history) == 1,
+        f"Expected 1 phase history entry, got {state.phase_history}"
+    )
+    log(f"   ✓ Retrieved state with {len(state.emotional_states)} emotion records")
+    
+    print_banner("✓ All engine smoke tests passed!")
+
+
+@flushes_log
 def test_automatic_time_based_transitions():
     """Test automatic phase transitions based on time thresholds."""
-    print("\n" + "="*70)
-    print("TEST: Automatic Time-Based Phase Transitions")
-    print("="*70)
-    
-    # Create feedback data
-    feedback = FeedbackData(
-        feedback_id="test-001",
-        user_id="user-123",
-        collection_date=datetime.now(),
-        themes=[
-            {
-                'category': 'improvement',
-                'theme': 'communication clarity',
-                'frequency': 5,
-                'examples': ['Could be more clear in emails']
-            }
-        ]
-    )
-    
-    engine = R2C2Engine(feedback)
+    print_banner("TEST: Automatic Time-Based Phase Transitions")
+    
+    # One clock reading per test: the engine compares these times against
+    # the live clock, so they must not age while other tests run
+    now = datetime.now()
+    
+    engine = R2C2Engine(_TIME_BASED_FEEDBACK)
     
     # Test 1: Relationship phase - should not transition immediately
-    print("\n1. Testing Relationship phase minimum duration...")
-    assert engine.get_current_phase() == R2C2Phase.RELATIONSHIP
-    assert not engine.should_transition(), "Should not transition immediately"
-    print("   ✓ Relationship phase requires minimum time")
+    log("\n1. Testing Relationship phase minimum duration...")
+    _check(
+        engine.get_current_phase() == R2C2Phase.RELATIONSHIP,
+        f"Expected RELATIONSHIP, got {engine.get_current_phase()}"
+    )
+    _check(
+        not engine.should_transition(),
+        f"Should not transition immediately ({_elapsed(engine)})"
+    )
+    log("   ✓ Relationship phase requires minimum time")
     
     # Simulate time passing by manipulating phase start time
-    engine.state.phase_start_time = datetime.now() - timedelta(seconds=130)
-    assert engine.should_transition(), "Should transition after 2+ minutes"
-    print("   ✓ Transitions after minimum duration (120s)")
+    engine.state.phase_start_time = now - _PHASE_AGE_130
+    _check(engine.should_transition(), f"Should transition after 2+ minutes ({_elapsed(engine)})")
+    log("   ✓ Transitions after minimum duration (120s)")
     
     # Test 2: Transition to Reaction phase
-    print("\n2. Testing transition to Reaction phase...")
+    log("\n2. Testing transition to Reaction phase...")
     new_phase = engine.transition_to_next_phase()
-    assert new_phase == R2C2Phase.REACTION
-    assert engine.get_current_phase() == R2C2Phase.REACTION
-    print("   ✓ Successfully transitioned to Reaction phase")
+    _check(new_phase == R2C2Phase.REACTION, f"Expected REACTION, got {new_phase}")
+    _check(
+        engine.get_current_phase() == R2C2Phase.REACTION,
+        f"Expected REACTION, got {engine.get_current_phase()}"
+    )
+    log("   ✓ Successfully transitioned to Reaction phase")
     
     # Test 3: Reaction phase - requires emotional readiness
-    print("\n3. Testing Reaction phase transition logic...")
-    engine.state.phase_start_time = datetime.now() - timedelta(seconds=200)
+    log("\n3. Testing Reaction phase transition logic...")
+    engine.state.phase_start_time = now - _PHASE_AGE_200
     
     # Add defensive emotions - should not transition yet
-    for i in range(3):
-        emotion = EmotionState(
+    engine.state.emotional_states.extend(
+        EmotionState(
             emotion='defensive',
             confidence=0.8,
-            timestamp=datetime.now() - timedelta(seconds=60-i*10)
+            timestamp=now - _DELTAS_60_10[i]
         )
-        engine.state.emotional_states.append(emotion)
+        for i in range(3)
+    )
     
-    assert not engine.should_transition(), "Should not transition with defensive emotions"
-    print("   ✓ Reaction phase waits for emotional readiness")
+    _check(
+        not engine.should_transition(),
+        f"Should not transition with defensive emotions ({_elapsed(engine)})"
+    )
+    log("   ✓ Reaction phase waits for emotional readiness")
     
     # Add neutral emotions - should now transition
-    for i in range(3):
-        emotion = EmotionState(
+    engine.state.emotional_states.extend(
+        EmotionState(
             emotion='neutral',
             confidence=0.8,
-            timestamp=datetime.now() - timedelta(seconds=i)
+            timestamp=now - _DELTAS_1[i]
         )
-        engine.state.emotional_states.append(emotion)
+        for i in range(3)
+    )
     
-    assert engine.should_transition(), "Should transition with neutral emotions"
-    print("   ✓ Transitions when emotions become neutral/positive")
+    _check(
+        engine.should_transition(),
+        f"Should transition with neutral emotions ({_elapsed(engine)})"
+    )
+    log("   ✓ Transitions when emotions become neutral/positive")
     
     # Test 4: Transition to Content phase
-    print("\n4. Testing transition to Content phase...")
+    log("\n4. Testing transition to Content phase...")
     new_phase = engine.transition_to_next_phase()
-    assert new_phase == R2C2Phase.CONTENT
-    assert engine.get_current_phase() == R2C2Phase.CONTENT
-    print("   ✓ Successfully transitioned to Content phase")
+    _check(new_phase == R2C2Phase.CONTENT, f"Expected CONTENT, got {new_phase}")
+    _check(
+        engine.get_current_phase() == R2C2Phase.CONTENT,
+        f"Expected CONTENT, got {engine.get_current_phase()}"
+    )
+    log("   ✓ Successfully transitioned to Content phase")
     
     # Test 5: Content phase - requires themes discussed
-    print("\n5. Testing Content phase transition logic...")
-    engine.state.phase_start_time = datetime.now() - timedelta(seconds=250)
+    log("\n5. Testing Content phase transition logic...")
+    engine.state.phase_start_time = now - _PHASE_AGE_250
     
     # Without content themes, should not transition
-    assert not engine.should_transition(), "Should not transition without content themes"
-    print("   ✓ Content phase requires discussion of themes")
+    _check(
+        not engine.should_transition(),
+        f"Should not transition without content themes, got {engine.state.content_themes}"
+    )
+    log("   ✓ Content phase requires discussion of themes")
     
     # Add content themes
     engine.state.content_themes = ['communication', 'leadership', 'delegation']
-    assert engine.should_transition(), "Should transition with themes discussed"
-    print("   ✓ Transitions when key themes are discussed")
+    _check(
+        engine.should_transition(),
+        f"Should transition with themes discussed, got {engine.state.content_themes}"
+    )
+    log("   ✓ Transitions when key themes are discussed")
     
     # Test 6: Transition to Coaching phase
-    print("\n6. Testing transition to Coaching phase...")
+    log("\n6. Testing transition to Coaching phase...")
     new_phase = engine.transition_to_next_phase()
-    assert new_phase == R2C2Phase.COACHING
-    assert engine.get_current_phase() == R2C2Phase.COACHING
-    print("   ✓ Successfully transitioned to Coaching phase")
+    _check(new_phase == R2C2Phase.COACHING, f"Expected COACHING, got {new_phase}")
+    _check(
+        engine.get_current_phase() == R2C2Phase.COACHING,
+        f"Expected COACHING, got {engine.get_current_phase()}"
+    )
+    log("   ✓ Successfully transitioned to Coaching phase")
     
     # Test 7: Coaching phase - final phase, no auto-transition
-    print("\n7. Testing Coaching phase (final phase)...")
-    engine.state.phase_start_time = datetime.now() - timedelta(seconds=300)
-    assert not engine.should_transition(), "Coaching phase should not auto-transition"
+    log("\n7. Testing Coaching phase (final phase)...")
+    engine.state.phase_start_time = now - _PHASE_AGE_300
+    _check(
+        not engine.should_transition(),
+        f"Coaching phase should not auto-transition ({_elapsed(engine)})"
+    )
     
     # Try to transition - should stay in coaching
     new_phase = engine.transition_to_next_phase()
-    assert new_phase == R2C2Phase.COACHING
-    print("   ✓ Coaching phase is final, no further transitions")
+    _check(new_phase == R2C2Phase.COACHING, f"Expected COACHING, got {new_phase}")
+    log("   ✓ Coaching phase is final, no further transitions")
     
-    print("\n" + "="*70)
-    print("✓ All automatic time-based transition tests passed!")
-    print("="*70)
+    print_banner("✓ All automatic time-based transition tests passed!")
 
 
+@flushes_log
 def test_emotion_based_transitions():
     """Test phase transitions triggered by emotional state changes."""
-    print("\n" + "="*70)
-    print("TEST: Emotion-Based Phase Transitions")
-    print("="*70)
+    print_banner("TEST: Emotion-Based Phase Transitions")
     
-    feedback = FeedbackData(
-        feedback_id="test-002",
-        user_id="user-456",
-        collection_date=datetime.now(),
-        themes=[{'category': 'improvement', 'theme': 'delegation', 'frequency': 3}]
-    )
+    # One clock reading per test: the engine compares these times against
+    # the live clock, so they must not age while other tests run
+    now = datetime.now()
     
-    engine = R2C2Engine(feedback)
+    engine = R2C2Engine(_EMOTION_BASED_FEEDBACK)
     
     # Test 1: Early transition with emotional readiness
-    print("\n1. Testing early transition from Relationship with readiness...")
-    engine.state.phase_start_time = datetime.now() - timedelta(seconds=95)
+    log("\n1. Testing early transition from Relationship with readiness...")
+    engine.state.phase_start_time = now - _PHASE_AGE_95
     
     # Add positive emotions indicating readiness
-    for i in range(4):
-        emotion = EmotionState(
+    engine.state.emotional_states.extend(
+        EmotionState(
             emotion='positive' if i % 2 == 0 else 'neutral',
             confidence=0.85,
-            timestamp=datetime.now() - timedelta(seconds=60-i*15)
+            timestamp=now - _DELTAS_60_15[i]
         )
-        engine.state.emotional_states.append(emotion)
+        for i in range(4)
+    )
     
-    assert engine.should_transition(), "Should allow early transition with emotional readiness"
-    print("   ✓ Can transition early (90s+) with positive emotions")
+    _check(
+        engine.should_transition(),
+        f"Should allow early transition with emotional readiness ({_elapsed(engine)})"
+    )
+    log("   ✓ Can transition early (90s+) with positive emotions")
     
     # Test 2: Defensive emotions prevent transition
-    print("\n2. Testing that defensive emotions prevent transition...")
+    log("\n2. Testing that defensive emotions prevent transition...")
     engine.transition_to_next_phase()  # Move to Reaction
-    engine.state.phase_start_time = datetime.now() - timedelta(seconds=200)
+    engine.state.phase_start_time = now - _PHASE_AGE_200
     
-    # Clear previous emotions and add defensive ones
-    engine.state.emotional_states.clear()
-    for i in range(5):
-        emotion = EmotionState(
+    # Replace previous emotions with defensive ones
+    engine.state.emotional_states[:] = [
+        EmotionState(
             emotion='defensive',
             confidence=0.75,
-            timestamp=datetime.now() - timedelta(seconds=60-i*10)
+            timestamp=now - _DELTAS_60_10[i]
         )
-        engine.state.emotional_states.append(emotion)
+        for i in range(5)
+    ]
     
-    assert not engine.should_transition(), "Defensive emotions should prevent transition"
-    print("   ✓ Defensive emotions block transition from Reaction phase")
+    _check(
+        not engine.should_transition(),
+        f"Defensive emotions should prevent transition ({_elapsed(engine)})"
+    )
+    log("   ✓ Defensive emotions block transition from Reaction phase")
     
     # Test 3: Emotional shift enables transition
-    print("\n3. Testing emotional shift from defensive to neutral...")
+    log("\n3. Testing emotional shift from defensive to neutral...")
     
     # Add neutral emotions showing emotional processing
-    for i in range(4):
-        emotion = EmotionState(
+    engine.state.emotional_states.extend(
+        EmotionState(
             emotion='neutral',
             confidence=0.8,
-            timestamp=datetime.now() - timedelta(seconds=i*5)
+            timestamp=now - _DELTAS_5[i]
         )
-        engine.state.emotional_states.append(emotion)
+        for i in range(4)
+    )
     
-    assert engine.should_transition(), "Neutral emotions should enable transition"
-    print("   ✓ Shift to neutral emotions enables transition")
+    _check(
+        engine.should_transition(),
+        f"Neutral emotions should enable transition ({_elapsed(engine)})"
+    )
+    log("   ✓ Shift to neutral emotions enables transition")
     
     # Test 4: Frustrated emotions also prevent transition
-    print("\n4. Testing frustrated emotions...")
-    engine.state.emotional_states.clear()
-    engine.state.phase_start_time = datetime.now() - timedelta(seconds=200)
+    log("\n4. Testing frustrated emotions...")
+    engine.state.phase_start_time = now - _PHASE_AGE_200
     
-    for i in range(4):
-        emotion = EmotionState(
+    engine.state.emotional_states[:] = [
+        EmotionState(
             emotion='frustrated',
             confidence=0.7,
-            timestamp=datetime.now() - timedelta(seconds=60-i*15)
+            timestamp=now - _DELTAS_60_15[i]
         )
-        engine.state.emotional_states.append(emotion)
+        for i in range(4)
+    ]
     
-    assert not engine.should_transition(), "Frustrated emotions should prevent transition"
-    print("   ✓ Frustrated emotions also block transition")
+    _check(
+        not engine.should_transition(),
+        f"Frustrated emotions should prevent transition ({_elapsed(engine)})"
+    )
+    log("   ✓ Frustrated emotions also block transition")
     
     # Test 5: Anxious emotions prevent transition
-    print("\n5. Testing anxious emotions...")
-    engine.state.emotional_states.clear()
-    
-    for i in range(4):
-        emotion = EmotionState(
+    log("\n5. Testing anxious emotions...")
+    engine.state.emotional_states[:] = [
+        EmotionState(
             emotion='anxious',
             confidence=0.75,
-            timestamp=datetime.now() - timedelta(seconds=60-i*15)
+            timestamp=now - _DELTAS_60_15[i]
         )
-        engine.state.emotional_states.append(emotion)
+        for i in range(4)
+    ]
     
-    assert not engine.should_transition(), "Anxious emotions should prevent transition"
-    print("   ✓ Anxious emotions block transition")
+    _check(
+        not engine.should_transition(),
+        f"Anxious emotions should prevent transition ({_elapsed(engine)})"
+    )
+    log("   ✓ Anxious emotions block transition")
     
     # Test 6: Extended time overrides emotional state
-    print("\n6. Testing extended time override...")
-    engine.state.phase_start_time = datetime.now() - timedelta(seconds=650)
+    log("\n6. Testing extended time override...")
+    engine.state.phase_start_time = now - _PHASE_AGE_650
     
-    assert engine.should_transition(), "Extended time should override emotional blocks"
-    print("   ✓ After 10+ minutes, transition occurs regardless of emotions")
+    _check(
+        engine.should_transition(),
+        f"Extended time should override emotional blocks ({_elapsed(engine)})"
+    )
+    log("   ✓ After 10+ minutes, transition occurs regardless of emotions")
+    
+    print_banner("✓ All emotion-based transition tests passed!")
+
+
+class _StaleEmotionDetector:
+    """Detector that alternates emotions timestamped outside every window."""
+    
+    def __init__(self):
+        self._count = 0
+    
+    def analyze_audio(self, audio, sample_rate=16000):
+        self._count += 1
+        return DetectedEmotionState(
+            emotion=EmotionType.POSITIVE if self._count % 2 else EmotionType.NEUTRAL,
+            confidence=0.9,
+            timestamp=datetime.now() - _PHASE_AGE_650
+        )
+
+
+@flushes_log
+def test_emotion_history_stays_bounded():
+    """Test that stale emotions are pruned however they are recorded."""
+    print_banner("TEST: Emotion History Stays Bounded")
+    
+    # Test 1: Recording directly through the engine
+    log("\n1. Testing stale emotions recorded through the engine...")
+    engine = R2C2Engine(_EMOTION_BASED_FEEDBACK)
+    stale_time = datetime.now() - _PHASE_AGE_650
+    for i in range(200):
+        engine.record_emotion(EmotionState(
+            emotion='positive' if i % 2 else 'neutral',
+            confidence=0.8,
+            timestamp=stale_time
+        ))
+    
+    history_length = len(engine.state.emotional_states)
+    _check(history_length < 32, f"Stale emotions should be pruned, found {history_length}")
+    pruned_total = sum(engine.state.pruned_emotion_counts.values())
+    _check(
+        pruned_total + history_length == 200,
+        f"Expected 200 emotions counted, got {pruned_total} pruned + {history_length} kept"
+    )
+    log(f"   ✓ {pruned_total} stale emotions pruned, {history_length} kept")
+    
+    # Test 2: Recording through the emotion processor
+    log("\n2. Testing stale emotions recorded through the emotion processor...")
+    if EmotionProcessor is None:
+        log("   - Skipped: pipecat is not installed")
+    else:
+        engine = R2C2Engine(_EMOTION_BASED_FEEDBACK)
+        processor = EmotionProcessor(
+            emotion_detector=_StaleEmotionDetector(),
+            r2c2_engine=engine
+        )
+        audio = (np.full(16000, 0.1, dtype=np.float32) * 32767).astype(np.int16).tobytes()
+        frame_count = 200 * EmotionProcessor.FRAME_SKIP
+        
+        async def feed_audio():
+            for _ in range(frame_count):
+                await processor.process_frame(
+                    InputAudioRawFrame(audio=audio, sample_rate=16000, num_channels=1),
+                    "downstream"
+                )
+        
+        asyncio.run(feed_audio())
+        
+        history_length = len(engine.state.emotional_states)
+        pruned_total = sum(engine.state.pruned_emotion_counts.values())
+        _check(
+            pruned_total > 0,
+            f"Processor emotions should reach the engine and be pruned, got {pruned_total}"
+        )
+        _check(history_length < 32, f"Stale emotions should be pruned, found {history_length}")
+        log(f"   ✓ {pruned_total} stale emotions pruned, {history_length} kept")
     
-    print("\n" + "="*70)
-    print("✓ All emotion-based transition tests passed!")
-    print("="*70)
+    print_banner("✓ All emotion history bound tests passed!")
 
 
+@flushes_log
 def test_manual_phase_progression():
     """Test manual phase transitions and phase history tracking."""
-    print("\n" + "="*70)
-    print("TEST: Manual Phase Progression")
-    print("="*70)
-    
-    feedback = FeedbackData(
-        feedback_id="test-003",
-        user_id="user-789",
-        collection_date=datetime.now(),
-        themes=[{'category': 'strength', 'theme': 'technical skills', 'frequency': 7}]
-    )
+    print_banner("TEST: Manual Phase Progression")
     
-    engine = R2C2Engine(feedback)
+    engine = R2C2Engine(_MANUAL_PROGRESSION_FEEDBACK)
     
     # Test 1: Manual transition through all phases
-    print("\n1. Testing manual progression through all phases...")
+    log("\n1. Testing manual progression through all phases...")
     
     phases = [R2C2Phase.RELATIONSHIP, R2C2Phase.REACTION, R2C2Phase.CONTENT, R2C2Phase.COACHING]
     
     for i, expected_phase in enumerate(phases):
         current = engine.get_current_phase()
-        assert current == expected_phase, f"Expected {expected_phase}, got {current}"
-        print(f"   ✓ Currently in {current.value} phase")
+        _check(current == expected_phase, f"Expected {expected_phase}, got {current}")
+        log(f"   ✓ Currently in {current.value} phase")
         
         if i < len(phases) - 1:
-            # Wait a bit to simulate time in phase
-            time.sleep(0.1)
+            # Simulate a little time in phase
+            engine.advance_simulated_time(0.1)
             next_phase = engine.transition_to_next_phase()
-            print(f"   → Transitioned to {next_phase.value} phase")
+            log(f"   → Transitioned to {next_phase.value} phase")
     
     # Test 2: Phase history tracking
-    print("\n2. Testing phase history tracking...")
-    assert len(engine.state.phase_history) == 3, "Should have 3 completed phases"
+    log("\n2. Testing phase history tracking...")
+    _check(
+        len(engine.state.phase_history) == 3,
+        f"Expected 3 completed phases, got {len(engine.state.phase_history)}"
+    )
     
+    expected_phases = ['relationship', 'reaction', 'content']
     for i, phase_record in enumerate(engine.state.phase_history):
-        expected_phases = ['relationship', 'reaction', 'content']
-        assert phase_record['phase'] == expected_phases[i]
-        assert 'duration' in phase_record
-        assert 'ended_at' in phase_record
-        print(f"   ✓ Phase {i+1}: {phase_record['phase']} - {phase_record['duration']:.2f}s")
+        _check(
+            phase_record['phase'] == expected_phases[i],
+            f"Expected {expected_phases[i]} at position {i}, got {phase_record['phase']!r}"
+        )
+        _check('duration' in phase_record, f"Phase record missing duration: {phase_record}")
+        _check('ended_at' in phase_record, f"Phase record missing ended_at: {phase_record}")
+        _check(
+            phase_record['duration'] >= 0.1,
+            f"Expected duration >= 0.1s, got {phase_record['duration']}"
+        )
+    
+    if VERBOSE:
+        log("\n".join(
+            f"   ✓ Phase {i+1}: {phase_record['phase']} - {phase_record['duration']:.2f}s"
+            for i, phase_record in enumerate(engine.state.phase_history)
+        ))
     
     # Test 3: Time in phase tracking
-    print("\n3. Testing time in phase tracking...")
-    time.sleep(0.2)
+    log("\n3. Testing time in phase tracking...")
+    engine.advance_simulated_time(0.25)
     time_in_phase = engine.get_time_in_phase()
-    assert time_in_phase >= 0.2, "Time in phase should be at least 0.2s"
-    print(f"   ✓ Time in current phase: {time_in_phase:.2f}s")
+    _check(time_in_phase >= 0.2, f"Time in phase should be at least 0.2s, got {time_in_phase}")
+    log(f"   ✓ Time in current phase: {time_in_phase:.2f}s")
     
     # Test 4: Cannot progress beyond final phase
-    print("\n4. Testing final phase boundary...")
-    assert engine.get_current_phase() == R2C2Phase.COACHING
+    log("\n4. Testing final phase boundary...")
+    _check(
+        engine.get_current_phase() == R2C2Phase.COACHING,
+        f"Expected COACHING, got {engine.get_current_phase()}"
+    )
     next_phase = engine.transition_to_next_phase()
-    assert next_phase == R2C2Phase.COACHING, "Should remain in Coaching phase"
-    print("   ✓ Cannot progress beyond Coaching phase")
+    _check(next_phase == R2C2Phase.COACHING, f"Should remain in COACHING, got {next_phase}")
+    log("   ✓ Cannot progress beyond Coaching phase")
     
-    print("\n" + "="*70)
-    print("✓ All manual phase progression tests passed!")
-    print("="*70)
+    print_banner("✓ All manual phase progression tests passed!")
 
 
+@flushes_log
 def test_phase_prompts_correctness():
     """Test that phase prompts are correct and contain expected content."""
-    print("\n" + "="*70)
-    print("TEST: Phase Prompt Correctness")
-    print("="*70)
+    print_banner("TEST: Phase Prompt Correctness")
     
-    feedback = FeedbackData(
-        feedback_id="test-004",
-        user_id="user-101",
-        collection_date=datetime.now(),
-        themes=[
-            {'category': 'improvement', 'theme': 'time management', 'frequency': 4},
-            {'category': 'strength', 'theme': 'problem solving', 'frequency': 6}
-        ]
-    )
+    # One clock reading per test: the engine compares these times against
+    # the live clock, so they must not age while other tests run
+    now = datetime.now()
     
-    engine = R2C2Engine(feedback)
+    engine = R2C2Engine(_PROMPT_FEEDBACK)
     
     # Test 1: Relationship phase prompt
-    print("\n1. Testing Relationship phase prompt...")
+    log("\n1. Testing Relationship phase prompt...")
     prompt = engine.get_phase_prompt(include_emotional_guidance=False)
+    prompt_lower, prompt_phrases = _prompt_terms(prompt)
     
-    assert 'RELATIONSHIP BUILDING' in prompt
-    assert 'rapport' in prompt.lower() or 'trust' in prompt.lower()
-    assert 'psychological safety' in prompt.lower() or 'safe space' in prompt.lower()
-    print("   ✓ Relationship prompt contains rapport-building guidance")
-    print(f"   ✓ Prompt length: {len(prompt)} characters")
+    _check(
+        'RELATIONSHIP BUILDING' in prompt,
+        f"RELATIONSHIP BUILDING missing from prompt: {prompt[:80]!r}"
+    )
+    _check(
+        'rapport' in prompt_lower or 'trust' in prompt_lower,
+        f"rapport/trust missing from prompt: {prompt[:80]!r}"
+    )
+    _check(
+        prompt_phrases & {'psychological safety', 'safe space'},
+        f"psychological safety/safe space missing from prompt: {prompt[:80]!r}"
+    )
+    log("   ✓ Relationship prompt contains rapport-building guidance")
+    log(f"   ✓ Prompt length: {len(prompt)} characters")
     
     # Test 2: Reaction phase prompt
-    print("\n2. Testing Reaction phase prompt...")
+    log("\n2. Testing Reaction phase prompt...")
     engine.transition_to_next_phase()
     prompt = engine.get_phase_prompt(include_emotional_guidance=False)
+    prompt_lower, prompt_phrases = _prompt_terms(prompt)
     
-    assert 'REACTION EXPLORATION' in prompt
-    assert 'defensive' in prompt.lower()
-    assert 'emotion' in prompt.lower()
-    assert 'feedback' in prompt.lower()
-    print("   ✓ Reaction prompt contains emotion exploration guidance")
-    print(f"   ✓ Prompt length: {len(prompt)} characters")
+    _check(
+        'REACTION EXPLORATION' in prompt,
+        f"REACTION EXPLORATION missing from prompt: {prompt[:80]!r}"
+    )
+    _check('defensive' in prompt_lower, f"defensive missing from prompt: {prompt[:80]!r}")
+    _check('emotion' in prompt_lower, f"emotion missing from prompt: {prompt[:80]!r}")
+    _check('feedback' in prompt_lower, f"feedback missing from prompt: {prompt[:80]!r}")
+    log("   ✓ Reaction prompt contains emotion exploration guidance")
+    log(f"   ✓ Prompt length: {len(prompt)} characters")
     
     # Test 3: Content phase prompt
-    print("\n3. Testing Content phase prompt...")
+    log("\n3. Testing Content phase prompt...")
     engine.transition_to_next_phase()
     prompt = engine.get_phase_prompt(include_emotional_guidance=False)
+    prompt_lower, prompt_phrases = _prompt_terms(prompt)
     
-    assert 'CONTENT DISCUSSION' in prompt
-    assert 'pattern' in prompt.lower() or 'theme' in prompt.lower()
-    assert 'behavior' in prompt.lower()
+    _check(
+        'CONTENT DISCUSSION' in prompt,
+        f"CONTENT DISCUSSION missing from prompt: {prompt[:80]!r}"
+    )
+    _check(
+        'pattern' in prompt_lower or 'theme' in prompt_lower,
+        f"pattern/theme missing from prompt: {prompt[:80]!r}"
+    )
+    _check('behavior' in prompt_lower, f"behavior missing from prompt: {prompt[:80]!r}")
     # Check if feedback themes are included
-    assert 'time management' in prompt.lower() or 'problem solving' in prompt.lower()
-    print("   ✓ Content prompt contains feedback analysis guidance")
-    print("   ✓ Feedback themes are included in prompt")
-    print(f"   ✓ Prompt length: {len(prompt)} characters")
+    _check(
+        prompt_phrases & {'time management', 'problem solving'},
+        f"Feedback themes missing from prompt: {prompt[:80]!r}"
+    )
+    log("   ✓ Content prompt contains feedback analysis guidance")
+    log("   ✓ Feedback themes are included in prompt")
+    log(f"   ✓ Prompt length: {len(prompt)} characters")
     
     # Test 4: Coaching phase prompt
-    print("\n4. Testing Coaching phase prompt...")
+    log("\n4. Testing Coaching phase prompt...")
     engine.transition_to_next_phase()
     prompt = engine.get_phase_prompt(include_emotional_guidance=False)
+    prompt_lower, prompt_phrases = _prompt_terms(prompt)
     
-    assert 'COACHING FOR CHANGE' in prompt
-    assert 'SMART' in prompt or 'goal' in prompt.lower()
-    assert 'action' in prompt.lower() or 'development' in prompt.lower()
-    print("   ✓ Coaching prompt contains goal-setting guidance")
-    print(f"   ✓ Prompt length: {len(prompt)} characters")
+    _check(
+        'COACHING FOR CHANGE' in prompt,
+        f"COACHING FOR CHANGE missing from prompt: {prompt[:80]!r}"
+    )
+    _check(
+        'SMART' in prompt or 'goal' in prompt_lower,
+        f"SMART/goal missing from prompt: {prompt[:80]!r}"
+    )
+    _check(
+        'action' in prompt_lower or 'development' in prompt_lower,
+        f"action/development missing from prompt: {prompt[:80]!r}"
+    )
+    log("   ✓ Coaching prompt contains goal-setting guidance")
+    log(f"   ✓ Prompt length: {len(prompt)} characters")
     
     # Test 5: Emotional adaptation guidance
-    print("\n5. Testing emotional adaptation guidance...")
+    log("\n5. Testing emotional adaptation guidance...")
     
     # Add defensive emotion
     engine.state.emotional_states.append(EmotionState(
         emotion='defensive',
         confidence=0.8,
-        timestamp=datetime.now()
+        timestamp=now
     ))
     
     prompt_with_emotion = engine.get_phase_prompt(include_emotional_guidance=True)
-    assert 'EMOTIONAL ADAPTATION' in prompt_with_emotion
-    assert 'DEFENSIVE' in prompt_with_emotion
-    assert 'SLOW DOWN' in prompt_with_emotion or 'slow down' in prompt_with_emotion.lower()
-    print("   ✓ Emotional guidance included when requested")
-    print("   ✓ Defensive emotion guidance present")
+    _check(
+        'EMOTIONAL ADAPTATION' in prompt_with_emotion,
+        f"EMOTIONAL ADAPTATION missing from prompt: {prompt_with_emotion[:80]!r}"
+    )
+    _check(
+        'DEFENSIVE' in prompt_with_emotion,
+        f"DEFENSIVE missing from prompt: {prompt_with_emotion[:80]!r}"
+    )
+    _check(
+        'SLOW DOWN' in prompt_with_emotion or 'slow down' in prompt_with_emotion.lower(),
+        f"slow down missing from prompt: {prompt_with_emotion[:80]!r}"
+    )
+    log("   ✓ Emotional guidance included when requested")
+    log("   ✓ Defensive emotion guidance present")
     
     # Test 6: Phase guidance structure
-    print("\n6. Testing phase guidance structure...")
+    log("\n6. Testing phase guidance structure...")
     guidance = engine.get_phase_guidance()
     
-    assert 'phase' in guidance
-    assert 'goals' in guidance
-    assert 'key_questions' in guidance
-    assert 'tips' in guidance
-    assert guidance['phase'] == 'coaching'
-    assert len(guidance['goals']) > 0
-    assert len(guidance['key_questions']) > 0
-    print(f"   ✓ Guidance structure complete")
-    print(f"   ✓ Goals: {len(guidance['goals'])}")
-    print(f"   ✓ Key questions: {len(guidance['key_questions'])}")
-    print(f"   ✓ Tips: {len(guidance['tips'])}")
+    _check('phase' in guidance, f"Guidance missing 'phase': {sorted(guidance)}")
+    _check('goals' in guidance, f"Guidance missing 'goals': {sorted(guidance)}")
+    _check('key_questions' in guidance, f"Guidance missing 'key_questions': {sorted(guidance)}")
+    _check('tips' in guidance, f"Guidance missing 'tips': {sorted(guidance)}")
+    _check(
+        guidance['phase'] == 'coaching',
+        f"Expected coaching guidance, got {guidance['phase']!r}"
+    )
+    _check(len(guidance['goals']) > 0, "Guidance should list goals")
+    _check(len(guidance['key_questions']) > 0, "Guidance should list key questions")
+    if VERBOSE:
+        log(
+            "   ✓ Guidance structure complete\n"
+            f"   ✓ Goals: {len(guidance['goals'])}\n"
+            f"   ✓ Key questions: {len(guidance['key_questions'])}\n"
+            f"   ✓ Tips: {len(guidance['tips'])}"
+        )
     
-    print("\n" + "="*70)
-    print("✓ All phase prompt correctness tests passed!")
-    print("="*70)
+    print_banner("✓ All phase prompt correctness tests passed!")
 
 
 def run_all_tests():
     """Run all phase transition tests."""
-    print("\n" + "="*70)
-    print("R2C2 PHASE TRANSITION TEST SUITE")
-    print("="*70)
-    print("\nTesting Requirements:")
-    print("- 14.2: R2C2 conversation engine phase transitions")
-    print("- 14.3: Emotion-based transition logic")
-    print("="*70)
+    print_banner("R2C2 PHASE TRANSITION TEST SUITE")
+    log("\nTesting Requirements:")
+    log("- 14.2: R2C2 conversation engine phase transitions")
+    log("- 14.3: Emotion-based transition logic")
+    log(RULE)
     
     try:
+        test_engine_smoke()
         test_automatic_time_based_transitions()
         test_emotion_based_transitions()
+        test_emotion_history_stays_bounded()
         test_manual_phase_progression()
         test_phase_prompts_correctness()
         
-        print("\n" + "="*70)
-        print("✓✓✓ ALL PHASE TRANSITION TESTS PASSED ✓✓✓")
-        print("="*70)
-        print("\nSummary:")
-        print("✓ Automatic time-based transitions work correctly")
-        print("✓ Emotion-based transitions function as expected")
-        print("✓ Manual phase progression operates properly")
-        print("✓ Phase prompts contain correct guidance")
-        print("\nThe R2C2 phase transition system is working correctly!")
+        print_banner("✓✓✓ ALL PHASE TRANSITION TESTS PASSED ✓✓✓")
+        log("\nSummary:")
+        log("✓ Basic engine operations work end to end")
+        log("✓ Automatic time-based transitions work correctly")
+        log("✓ Emotion-based transitions function as expected")
+        log("✓ Emotion history stays bounded")
+        log("✓ Manual phase progression operates properly")
+        log("✓ Phase prompts contain correct guidance")
+        log("\nThe R2C2 phase transition system is working correctly!")
+        flush_log()
         
         return True
         
     except AssertionError as e:
         print(f"\n✗ TEST FAILED: {e}")
-        import traceback
-        traceback.print_exc()
+        sys.stderr.write(traceback.format_exc())
         return False
     except Exception as e:
         print(f"\n✗ UNEXPECTED ERROR: {e}")
-        import traceback
-        traceback.print_exc()
+        sys.stderr.write(traceback.format_exc())
         return False
 
 
 if __name__ == "__main__":
-    import sys
     success = run_all_tests()
     sys.exit(0 if success else 1)
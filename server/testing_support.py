@@ -0,0 +1,49 @@
+"""Shared progress output helpers for the backend test suites.
+
+Progress output is buffered per test and only written when TEST_VERBOSE=1
+(R2C2_VERBOSE=1 is accepted as an alias); failures always print.
+"""
+
+import os
+import sys
+from functools import wraps
+
+VERBOSE = os.environ.get("TEST_VERBOSE", os.environ.get("R2C2_VERBOSE")) == "1"
+RULE = "=" * 70
+
+_log_buffer = []
+
+
+def log(message):
+    """Buffer a line of test progress output when verbose."""
+    if VERBOSE:
+        _log_buffer.append(message)
+
+
+def flush_log():
+    """Write buffered progress output in one call and clear it."""
+    if _log_buffer:
+        sys.stdout.write("\n".join(_log_buffer) + "\n")
+        _log_buffer.clear()
+
+
+def flushes_log(test):
+    """Write a test's buffered output when it finishes, even if it fails.
+
+    Keeps each test's output with that test, so tests can run alone or in
+    any order.
+    """
+    @wraps(test)
+    def wrapper(*args, **kwargs):
+        try:
+            return test(*args, **kwargs)
+        finally:
+            flush_log()
+    return wrapper
+
+
+def print_banner(title):
+    """Log a section banner."""
+    log("\n" + RULE)
+    log(title)
+    log(RULE)